@@ -7,15 +7,38 @@ __all__ = [
     'emoji_list',
     'distinct_emoji_list',
     'emoji_count',
+    'emoji_counter',
     'replace_emoji',
+    'normalize_skin_tones',
     'is_emoji',
     'purely_emoji',
     'version',
     'Token',
+    'EmojiDataView',
     'EmojiMatch',
     'EmojiMatchZWJ',
     'EmojiMatchZWJNonRGI',
+    # emoji.batch
+    'demojize_many',
+    'emojize_many',
+    'analyze_many',
+    'demojize_large',
+    'features',
+    'Features',
+    # emoji.utf8
+    'emoji_list_bytes',
+    'demojize_bytes',
+    'emoji_list_stream',
+    'demojize_stream',
+    # emoji.registry
+    'add_emoji',
+    'remove_emoji',
+    'reload_data',
+    # emoji.metrics
+    'stats',
     # emoji.unicode_codes
+    'emoji_to_id',
+    'id_to_emoji',
     'EMOJI_DATA',
     'STATUS',
     'LANGUAGES',
@@ -58,4 +81,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 from emoji.core import *
+from emoji.batch import *
+from emoji.utf8 import *
+from emoji.registry import *
+from emoji.metrics import *
 from emoji.unicode_codes import *
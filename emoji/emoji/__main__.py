@@ -0,0 +1,220 @@
+"""
+emoji.__main__
+~~~~~~~~~~~~~~
+
+Command line interface::
+
+    $ echo 'Python is :thumbs_up:' | python -m emoji emojize
+    Python is 👍
+    $ python -m emoji demojize --language de --jobs 4 big_file.txt > out.txt
+    $ python -m emoji serve --socket /tmp/emoji.sock
+
+The input is read from stdin or from files and processed line by line, the
+emoji data is loaded once per process. ``serve`` starts a server that keeps
+the data loaded, see :mod:`emoji.server`.
+
+"""
+
+import argparse
+import os
+import signal
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from emoji import __version__, server, unicode_codes
+from emoji.batch import demojize_many, emojize_many
+from emoji.core import demojize, emojize
+
+__all__ = ['main']
+
+_LINES_PER_CHUNK = 1000
+
+
+def _is_input(output: str, files: List[str]) -> bool:
+    """True if ``output`` is one of the input files, opening it for writing
+    would truncate the input before it is read"""
+    for file in files:
+        if file == '-':
+            continue
+        try:
+            if os.path.samefile(file, output):
+                return True
+        except OSError:  # One of them does not exist
+            pass
+    return False
+
+
+def _read_lines(files: List[str], encoding: str) -> Iterator[str]:
+    """Yield the lines of all files, ``-`` is stdin. Line endings are kept."""
+    for file in files:
+        if file == '-':
+            _reconfigure(sys.stdin, encoding)
+            yield from sys.stdin
+        else:
+            with open(file, 'r', encoding=encoding, newline='') as f:
+                yield from f
+
+
+def _reconfigure(stream: TextIO, encoding: str):
+    """Use ``encoding`` for stdin/stdout, the locale encoding may not support emoji"""
+    reconfigure = getattr(stream, 'reconfigure', None)
+    if reconfigure is not None:
+        reconfigure(encoding=encoding)
+
+
+def _convert(args: argparse.Namespace, lines: Iterable[str]) -> Iterator[str]:
+    func: Callable[..., str]
+    many: Callable[..., Iterator[str]]
+    kwargs: Dict[str, Any] = {
+        'delimiters': tuple(args.delimiters),
+        'language': args.language,
+    }
+    if args.command == 'emojize':
+        kwargs['variant'] = args.variant
+        func, many = emojize, emojize_many
+    else:
+        func, many = demojize, demojize_many
+
+    if args.jobs == 1:
+        # Process each line directly, so that the output is not delayed
+        return (func(line, **kwargs) for line in lines)
+    return many(lines, **kwargs, processes=args.jobs, chunksize=args.chunksize)
+
+
+def _jobs(value: str) -> Optional[int]:
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError('must be 0 or greater')
+    return jobs or None
+
+
+def _language(value: str) -> str:
+    if value != 'alias' and value not in unicode_codes.LANGUAGES:
+        raise argparse.ArgumentTypeError(
+            f'must be alias or one of {", ".join(unicode_codes.LANGUAGES)}'
+        )
+    return value
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m emoji', description='Emoji for Python.'
+    )
+    parser.add_argument('-V', '--version', action='version', version=__version__)
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    emojize_parser = subparsers.add_parser(
+        'emojize', help='Replace emoji names with Unicode emoji'
+    )
+    emojize_parser.add_argument(
+        '--variant',
+        choices=['text_type', 'emoji_type'],
+        help='Add a variation selector to the emoji',
+    )
+    demojize_parser = subparsers.add_parser(
+        'demojize', help='Replace Unicode emoji with emoji names'
+    )
+
+    for subparser in (emojize_parser, demojize_parser):
+        subparser.add_argument(
+            'files',
+            nargs='*',
+            default=['-'],
+            metavar='FILE',
+            help='Input files, - is stdin (default: stdin)',
+        )
+        subparser.add_argument('-o', '--output', help='Output file (default: stdout)')
+        subparser.add_argument(
+            '-l',
+            '--language',
+            type=_language,
+            default='en',
+            help='Language of the emoji names or alias (default: en)',
+        )
+        subparser.add_argument(
+            '-d',
+            '--delimiters',
+            nargs=2,
+            default=[':', ':'],
+            metavar=('START', 'END'),
+            help='Delimiters of the emoji names (default: : :)',
+        )
+        subparser.add_argument(
+            '-j',
+            '--jobs',
+            type=_jobs,
+            default=1,
+            help='Number of processes, 0 is the number of CPUs (default: 1)',
+        )
+        subparser.add_argument(
+            '--chunksize',
+            type=int,
+            default=_LINES_PER_CHUNK,
+            help=f'Lines per chunk with --jobs (default: {_LINES_PER_CHUNK})',
+        )
+        subparser.add_argument(
+            '--line-buffered',
+            action='store_true',
+            help='Flush the output after every line',
+        )
+        subparser.add_argument(
+            '--encoding', default='utf-8', help='Encoding of the input and output'
+        )
+
+    serve_parser = subparsers.add_parser(
+        'serve', help='Answer requests on a Unix socket, see emoji.server'
+    )
+    serve_parser.add_argument(
+        '-s', '--socket', required=True, help='Path of the Unix socket'
+    )
+    serve_parser.add_argument(
+        '-l',
+        '--language',
+        type=_language,
+        action='append',
+        default=[],
+        help='Load this language at start, can be repeated',
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface with the arguments ``argv``
+    (default: ``sys.argv[1:]``) and return the exit status."""
+    args = make_parser().parse_args(argv)
+    if args.command == 'serve':
+        # Remove the socket file on SIGTERM as well
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            server.serve(args.socket, args.language)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.chunksize < 1:
+        print('--chunksize must be at least 1', file=sys.stderr)
+        return 2
+    if args.output and _is_input(args.output, args.files):
+        print(f'{args.output}: --output must not be an input file', file=sys.stderr)
+        return 2
+
+    lines = _read_lines(args.files, args.encoding)
+    try:
+        if args.output:
+            with open(args.output, 'w', encoding=args.encoding, newline='') as f:
+                f.writelines(_convert(args, lines))
+        else:
+            _reconfigure(sys.stdout, args.encoding)
+            for line in _convert(args, lines):
+                sys.stdout.write(line)
+                if args.line_buffered:
+                    sys.stdout.flush()
+    except OSError as e:
+        print(f'{e.filename}: {e.strerror}' if e.filename else e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+emoji.aio
+~~~~~~~~~
+
+Coroutines for using emoji in an asyncio event loop.
+
+Short strings are processed directly in the event loop. Long strings are
+processed in an executor, so that they do not block the event loop::
+
+    import emoji.aio
+
+    async def handler(text: str) -> str:
+        return await emoji.aio.demojize_async(text)
+
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+if sys.version_info < (3, 9):
+    from typing_extensions import Literal  # type: ignore
+else:
+    from typing import Literal
+
+from emoji.core import (
+    _DEFAULT_DELIMITER,  # pyright: ignore [reportPrivateUsage]
+    _EmojiListReturn,  # pyright: ignore [reportPrivateUsage]
+    _call_with_config,  # pyright: ignore [reportPrivateUsage]
+    _config_snapshot,  # pyright: ignore [reportPrivateUsage]
+    demojize,
+    emoji_list,
+    emojize,
+    replace_emoji,
+)
+
+__all__ = [
+    'set_executor',
+    'demojize_async',
+    'emojize_async',
+    'replace_emoji_async',
+    'emoji_list_async',
+]
+
+INLINE_THRESHOLD = 10000
+"""Strings with at most this many characters are processed directly in the
+event loop. Longer strings are sent to the executor."""
+
+_executor: Optional[concurrent.futures.Executor] = None
+
+_R = TypeVar('_R')
+
+
+def set_executor(executor: Optional[concurrent.futures.Executor]):
+    """
+    Set the executor that is used for long strings. If ``None``, the default
+    executor of the event loop is used.
+
+    A :class:`concurrent.futures.ProcessPoolExecutor` can be used to process
+    long strings in parallel to the event loop, callables like ``handle_version``
+    must be picklable in that case.
+    """
+    global _executor
+    _executor = executor
+
+
+async def _run(
+    func: Callable[..., _R],
+    string: str,
+    kwargs: Dict[str, Any],
+    executor: Optional[concurrent.futures.Executor],
+    inline_threshold: Optional[int],
+) -> _R:
+    if inline_threshold is None:
+        inline_threshold = INLINE_THRESHOLD
+    if len(string) <= inline_threshold:
+        return func(string, **kwargs)
+
+    # The executor does not run in the context of the current task,
+    # so the configuration of this context is passed along explicitly
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor if executor is not None else _executor,
+        functools.partial(
+            _call_with_config, _config_snapshot(), func, string, **kwargs
+        ),
+    )
+
+
+async def demojize_async(
+    string: str,
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
+    *,
+    executor: Optional[concurrent.futures.Executor] = None,
+    inline_threshold: Optional[int] = None,
+) -> str:
+    """
+    Coroutine version of :func:`emoji.demojize()`.
+
+    :param executor: (optional) Executor for long strings, see :func:`set_executor`
+    :param inline_threshold: (optional) Maximum length of strings that are processed
+        directly in the event loop, defaults to :data:`INLINE_THRESHOLD`
+    """
+    return await _run(
+        demojize,
+        string,
+        {
+            'delimiters': delimiters,
+            'language': language,
+            'version': version,
+            'handle_version': handle_version,
+            'keep_zwj': keep_zwj,
+        },
+        executor,
+        inline_threshold,
+    )
+
+
+async def emojize_async(
+    string: str,
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    variant: Optional[Literal['text_type', 'emoji_type']] = None,
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    *,
+    executor: Optional[concurrent.futures.Executor] = None,
+    inline_threshold: Optional[int] = None,
+) -> str:
+    """
+    Coroutine version of :func:`emoji.emojize()`.
+
+    :param executor: (optional) Executor for long strings, see :func:`set_executor`
+    :param inline_threshold: (optional) Maximum length of strings that are processed
+        directly in the event loop, defaults to :data:`INLINE_THRESHOLD`
+    """
+    return await _run(
+        emojize,
+        string,
+        {
+            'delimiters': delimiters,
+            'variant': variant,
+            'language': language,
+            'version': version,
+            'handle_version': handle_version,
+        },
+        executor,
+        inline_threshold,
+    )
+
+
+async def replace_emoji_async(
+    string: str,
+    replace: Union[str, Callable[[str, Dict[str, str]], str]] = '',
+    version: float = -1,
+    keep_zwj: Optional[bool] = None,
+    *,
+    executor: Optional[concurrent.futures.Executor] = None,
+    inline_threshold: Optional[int] = None,
+) -> str:
+    """
+    Coroutine version of :func:`emoji.replace_emoji()`.
+
+    :param executor: (optional) Executor for long strings, see :func:`set_executor`
+    :param inline_threshold: (optional) Maximum length of strings that are processed
+        directly in the event loop, defaults to :data:`INLINE_THRESHOLD`
+    """
+    return await _run(
+        replace_emoji,
+        string,
+        {'replace': replace, 'version': version, 'keep_zwj': keep_zwj},
+        executor,
+        inline_threshold,
+    )
+
+
+async def emoji_list_async(
+    string: str,
+    *,
+    executor: Optional[concurrent.futures.Executor] = None,
+    inline_threshold: Optional[int] = None,
+) -> List[_EmojiListReturn]:
+    """
+    Coroutine version of :func:`emoji.emoji_list()`.
+
+    :param executor: (optional) Executor for long strings, see :func:`set_executor`
+    :param inline_threshold: (optional) Maximum length of strings that are processed
+        directly in the event loop, defaults to :data:`INLINE_THRESHOLD`
+    """
+    return await _run(emoji_list, string, {}, executor, inline_threshold)
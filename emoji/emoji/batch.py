@@ -0,0 +1,419 @@
+"""
+emoji.batch
+~~~~~~~~~~~
+
+Process many strings at once, optionally in multiple processes.
+
+"""
+
+import array
+import collections
+import concurrent.futures
+import itertools
+import os
+import sys
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if sys.version_info < (3, 9):
+    from typing_extensions import Literal  # type: ignore
+else:
+    from typing import Literal
+
+from emoji import unicode_codes
+from emoji.core import (
+    _DEFAULT_DELIMITER,  # pyright: ignore [reportPrivateUsage]
+    _config_snapshot,  # pyright: ignore [reportPrivateUsage]
+    analyze,
+    config,
+    demojize,
+    emojize,
+)
+from emoji.tokenizer import Token, get_search_tree, split_safe, tokenize_ids
+
+__all__ = [
+    'demojize_many',
+    'emojize_many',
+    'analyze_many',
+    'demojize_large',
+    'features',
+    'Features',
+]
+
+_DEFAULT_CHUNKSIZE = 1000
+_DEFAULT_PIECE_SIZE = 1 << 20
+
+_R = TypeVar('_R')
+
+
+def _init_worker(languages: List[str], options: Dict[str, Any]):
+    """Initializer of the worker processes. Loads the data once per process
+    and applies the configuration of the calling context."""
+    for name, value in options.items():
+        setattr(config, name, value)
+    for lang in languages:
+        unicode_codes.load_from_json(lang)
+    get_search_tree()
+
+
+def _loaded_languages(language: Optional[str] = None) -> List[str]:
+    """Languages that the worker processes should load: the languages
+    that are loaded in this process and ``language``"""
+    languages = [
+        lang
+        for lang in unicode_codes._loaded_keys  # pyright: ignore [reportPrivateUsage]
+        if lang in unicode_codes.LANGUAGES
+    ]
+    if language in unicode_codes.LANGUAGES and language not in languages:
+        languages.append(language)
+    return languages
+
+
+def _demojize_chunk(chunk: List[str], kwargs: Dict[str, Any]) -> List[str]:
+    return [demojize(string, **kwargs) for string in chunk]
+
+
+def _emojize_chunk(chunk: List[str], kwargs: Dict[str, Any]) -> List[str]:
+    return [emojize(string, **kwargs) for string in chunk]
+
+
+def _analyze_chunk(chunk: List[str], kwargs: Dict[str, Any]) -> List[List[Token]]:
+    return [list(analyze(string, **kwargs)) for string in chunk]
+
+
+def _chunks(strings: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(strings)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(
+    func: Callable[[List[str], Dict[str, Any]], List[_R]],
+    strings: Iterable[str],
+    kwargs: Dict[str, Any],
+    processes: Optional[int],
+    chunksize: int,
+    languages: List[str],
+) -> Iterator[_R]:
+    """Apply ``func`` to chunks of ``strings`` and yield the results in order.
+    The configuration of the calling context is used, not the configuration of
+    the context that consumes the results."""
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+
+    return _run_chunks(
+        func, strings, kwargs, processes, chunksize, languages, _config_snapshot()
+    )
+
+
+def _run_chunks(
+    func: Callable[[List[str], Dict[str, Any]], List[_R]],
+    strings: Iterable[str],
+    kwargs: Dict[str, Any],
+    processes: Optional[int],
+    chunksize: int,
+    languages: List[str],
+    options: Dict[str, Any],
+) -> Iterator[_R]:
+    if processes == 1:
+        for chunk in _chunks(strings, chunksize):
+            with config.override(**options):
+                results = func(chunk, kwargs)
+            yield from results
+        return
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(languages, options),
+    ) as executor:
+        # Limit the number of submitted chunks, so that the input is consumed lazily
+        pending: Deque['concurrent.futures.Future[List[_R]]'] = collections.deque()
+        for chunk in _chunks(strings, chunksize):
+            pending.append(executor.submit(func, chunk, kwargs))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def demojize_many(
+    strings: Iterable[str],
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
+    *,
+    processes: Optional[int] = 1,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> Iterator[str]:
+    """
+    Apply :func:`emoji.demojize()` to each string. The results are yielded
+    in the same order as the input.
+        >>> import emoji
+        >>> list(emoji.demojize_many(["Python is fun 👍", "🐍"]))
+        ['Python is fun :thumbs_up:', ':snake:']
+
+    :param strings: An iterable of strings, it is consumed lazily in chunks
+    :param delimiters: (optional) See :func:`emoji.demojize()`
+    :param language: (optional) See :func:`emoji.demojize()`
+    :param version: (optional) See :func:`emoji.demojize()`
+    :param handle_version: (optional) See :func:`emoji.demojize()`. Must be
+        picklable if ``processes`` is not 1
+    :param keep_zwj: (optional) See :func:`emoji.demojize()`
+    :param processes: (optional) Number of worker processes. If 1, the strings are
+        processed in the current process. If ``None``, the number of CPUs is used.
+        Each worker process loads the emoji data once.
+    :param chunksize: (optional) Number of strings that are processed at once
+    """
+
+    kwargs: Dict[str, Any] = {
+        'delimiters': delimiters,
+        'language': language,
+        'version': version,
+        'handle_version': handle_version,
+        'keep_zwj': keep_zwj,
+    }
+    return _run(
+        _demojize_chunk,
+        strings,
+        kwargs,
+        processes,
+        chunksize,
+        _loaded_languages('en' if language == 'alias' else language),
+    )
+
+
+def emojize_many(
+    strings: Iterable[str],
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    variant: Optional[Literal['text_type', 'emoji_type']] = None,
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    *,
+    processes: Optional[int] = 1,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> Iterator[str]:
+    """
+    Apply :func:`emoji.emojize()` to each string. The results are yielded
+    in the same order as the input.
+        >>> import emoji
+        >>> list(emoji.emojize_many(["Python is fun :thumbs_up:", ":snake:"]))
+        ['Python is fun 👍', '🐍']
+
+    :param strings: An iterable of strings, it is consumed lazily in chunks
+    :param delimiters: (optional) See :func:`emoji.emojize()`
+    :param variant: (optional) See :func:`emoji.emojize()`
+    :param language: (optional) See :func:`emoji.emojize()`
+    :param version: (optional) See :func:`emoji.emojize()`
+    :param handle_version: (optional) See :func:`emoji.emojize()`. Must be
+        picklable if ``processes`` is not 1
+    :param processes: (optional) Number of worker processes. If 1, the strings are
+        processed in the current process. If ``None``, the number of CPUs is used.
+        Each worker process loads the emoji data once.
+    :param chunksize: (optional) Number of strings that are processed at once
+    """
+
+    kwargs: Dict[str, Any] = {
+        'delimiters': delimiters,
+        'variant': variant,
+        'language': language,
+        'version': version,
+        'handle_version': handle_version,
+    }
+    return _run(
+        _emojize_chunk,
+        strings,
+        kwargs,
+        processes,
+        chunksize,
+        _loaded_languages(language),
+    )
+
+
+def analyze_many(
+    strings: Iterable[str],
+    non_emoji: bool = False,
+    join_emoji: bool = True,
+    *,
+    processes: Optional[int] = 1,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> Iterator[List[Token]]:
+    """
+    Apply :func:`emoji.analyze()` to each string and yield a list of
+    :class:`Token` for each string in the same order as the input.
+
+    :param strings: An iterable of strings, it is consumed lazily in chunks
+    :param non_emoji: (optional) See :func:`emoji.analyze()`
+    :param join_emoji: (optional) See :func:`emoji.analyze()`
+    :param processes: (optional) Number of worker processes. If 1, the strings are
+        processed in the current process. If ``None``, the number of CPUs is used.
+        Each worker process loads the emoji data once.
+    :param chunksize: (optional) Number of strings that are processed at once
+    """
+
+    kwargs: Dict[str, Any] = {'non_emoji': non_emoji, 'join_emoji': join_emoji}
+    return _run(
+        _analyze_chunk, strings, kwargs, processes, chunksize, _loaded_languages()
+    )
+
+
+def demojize_large(
+    string: str,
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
+    *,
+    processes: Optional[int] = None,
+    piece_size: int = _DEFAULT_PIECE_SIZE,
+) -> str:
+    """
+    Apply :func:`emoji.demojize()` to a single large string in multiple processes.
+    The string is split with :func:`emoji.tokenizer.split_safe` at characters that
+    cannot be part of an emoji, the pieces are demojized in parallel and joined
+    again. The result is the same as ``emoji.demojize(string, ...)``.
+
+    :param string: String contains Unicode characters. MUST BE UNICODE.
+    :param delimiters: (optional) See :func:`emoji.demojize()`
+    :param language: (optional) See :func:`emoji.demojize()`
+    :param version: (optional) See :func:`emoji.demojize()`
+    :param handle_version: (optional) See :func:`emoji.demojize()`. Must be
+        picklable if ``processes`` is not 1. The ``match_start`` and ``match_end``
+        values in the data dict are relative to the piece.
+    :param keep_zwj: (optional) See :func:`emoji.demojize()`
+    :param processes: (optional) Number of worker processes. If ``None``, the
+        number of CPUs is used.
+    :param piece_size: (optional) Minimum number of characters per piece
+    """
+
+    if len(string) <= piece_size:
+        processes = 1
+    return ''.join(
+        demojize_many(
+            split_safe(string, piece_size),
+            delimiters=delimiters,
+            language=language,
+            version=version,
+            handle_version=handle_version,
+            keep_zwj=keep_zwj,
+            processes=processes,
+            chunksize=1,
+        )
+    )
+
+
+class Features(NamedTuple):
+    """
+    Emoji features of many strings, see :func:`features`. The attributes are
+    :class:`numpy.ndarray` if NumPy is installed, otherwise :class:`array.array`.
+
+    ``indptr``, ``indices`` and ``data`` are the bag-of-emoji of the strings in
+    compressed sparse row format: row ``i`` contains the emoji IDs
+    ``indices[indptr[i]:indptr[i + 1]]`` (see :func:`emoji.emoji_to_id`) and
+    the number of occurrences ``data[indptr[i]:indptr[i + 1]]``. With SciPy:
+        >>> scipy.sparse.csr_matrix((f.data, f.indices, f.indptr), shape=f.shape)
+    """
+
+    count: Any
+    """Number of emoji in each string (int64)"""
+    distinct: Any
+    """Number of distinct emoji in each string (int64)"""
+    max_version: Any
+    """Highest Emoji version of the emoji in each string, 0.0 if there are none
+    (float64)"""
+    indptr: Any
+    """Row offsets of the bag-of-emoji, ``len(strings) + 1`` entries (int64)"""
+    indices: Any
+    """Emoji IDs of the bag-of-emoji, sorted in each row (int64)"""
+    data: Any
+    """Number of occurrences of the emoji in ``indices`` (int64)"""
+    shape: Tuple[int, int]
+    """Shape of the bag-of-emoji matrix: number of strings and number of IDs"""
+
+
+def _to_numpy(arrays: List['array.array[Any]']) -> List[Any]:
+    """Wrap the arrays in NumPy arrays without copying, if NumPy is installed"""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return arrays  # type: ignore
+    return [numpy.asarray(a) for a in arrays]  # type: ignore
+
+
+def features(strings: Iterable[str]) -> Features:
+    """
+    Count the emoji in each string for machine learning pipelines. Each string
+    is tokenized once and the results are written to preallocated arrays that
+    are indexed by the emoji IDs, no dicts are created for the emoji.
+        >>> import emoji
+        >>> f = emoji.features(['Python is fun 👍👍', 'no emoji'])
+        >>> f.count.tolist(), f.distinct.tolist(), f.max_version.tolist()
+        ([2, 0], [1, 0], [0.6, 0.0])
+        >>> f.indptr.tolist(), f.indices.tolist(), f.data.tolist()
+        ([0, 1, 1], [3954], [2])
+
+    Non-RGI ZWJ sequences are counted as the emoji they consist of.
+
+    :param strings: A sequence or iterable of strings
+    :return: :class:`Features`, with NumPy arrays if NumPy is installed
+    """
+
+    if not isinstance(strings, Sequence):
+        strings = list(strings)
+    id_list = unicode_codes._get_emoji_ids()[0]  # pyright: ignore [reportPrivateUsage]
+    versions = [
+        float(unicode_codes.EMOJI_DATA[emj]['E'])
+        if emj in unicode_codes.EMOJI_DATA
+        else 0.0
+        for emj in id_list
+    ]
+
+    rows = len(strings)
+    count = array.array('q', [0]) * rows
+    distinct = array.array('q', [0]) * rows
+    max_version = array.array('d', [0.0]) * rows
+    indptr = array.array('q', [0]) * (rows + 1)
+    indices = array.array('q')
+    data = array.array('q')
+
+    bag: Dict[int, int] = {}
+    for row, string in enumerate(strings):
+        for emoji_id in tokenize_ids(string):
+            bag[emoji_id] = bag.get(emoji_id, 0) + 1
+        if bag:
+            columns = sorted(bag)
+            indices.extend(columns)
+            data.extend([bag[column] for column in columns])
+            count[row] = sum(bag.values())
+            distinct[row] = len(columns)
+            max_version[row] = max([versions[column] for column in columns])
+            bag.clear()
+        indptr[row + 1] = len(indices)
+
+    return Features(
+        *_to_numpy([count, distinct, max_version, indptr, indices, data]),
+        shape=(rows, len(id_list)),
+    )
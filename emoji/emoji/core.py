@@ -6,24 +6,45 @@ Core components for emoji.
 
 """
 
+import collections
+import contextlib
+import contextvars
+import functools
 import re
+import threading
 import unicodedata
 import sys
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 if sys.version_info < (3, 9):
     from typing_extensions import Literal, Match, TypedDict  # type: ignore
 else:
     from typing import Literal, Match, TypedDict
 
-from emoji import unicode_codes
+from emoji import metrics, tokenizer, unicode_codes
 from emoji.tokenizer import (
     Token,
+    EmojiDataView,
     EmojiMatch,
     EmojiMatchZWJ,
     EmojiMatchZWJNonRGI,
     tokenize,
     filter_tokens,
+    get_search_tree,
+    _ZWJ,  # pyright: ignore [reportPrivateUsage]
 )
 
 __all__ = [
@@ -34,17 +55,23 @@ __all__ = [
     'emoji_list',
     'distinct_emoji_list',
     'emoji_count',
+    'emoji_counter',
     'replace_emoji',
+    'normalize_skin_tones',
     'is_emoji',
     'purely_emoji',
     'version',
     'Token',
+    'EmojiDataView',
     'EmojiMatch',
     'EmojiMatchZWJ',
     'EmojiMatchZWJNonRGI',
 ]
 
 _DEFAULT_DELIMITER = ':'
+# Approximate size of an entry in the lru_cache of get_emoji_by_name():
+# the key tuple, the name, the linked list element and the hash table slot
+_NAME_CACHE_ENTRY_SIZE = 200
 # In Arabic language, the unicode character "\u0655" should be kept so we add it to the pattern below
 _EMOJI_NAME_PATTERN = '\\w\\-&.’”“()!#*+,/«»\u0300\u0301\u0302\u0303\u0306\u0308\u030a\u0327\u064b\u064e\u064f\u0650\u0653\u0654\u3099\u30fb\u309a\u0655'
 
@@ -55,8 +82,20 @@ class _EmojiListReturn(TypedDict):
     match_end: int
 
 
+_CONTEXT_OPTIONS = ('demojize_keep_zwj', 'replace_emoji_keep_zwj', 'callback_data_view')
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+_config_overrides: 'contextvars.ContextVar[Dict[str, Any]]' = contextvars.ContextVar(
+    'emoji_config_overrides', default={}
+)
+
+
 class config:
-    """Module-wide configuration"""
+    """Module-wide configuration
+
+    The values can be changed temporarily for the current thread or asyncio
+    task with :meth:`config.override`."""
 
     demojize_keep_zwj = True
     """Change the behavior of :func:`emoji.demojize()` regarding
@@ -91,6 +130,165 @@ class config:
     See :attr:`config.demojize_keep_zwj` for more information.
     """
 
+    callback_data_view = False
+    """Change the data dict that is passed to the callables ``handle_version``
+    in :func:`emoji.emojize()` and :func:`emoji.demojize()` and ``replace`` in
+    :func:`emoji.replace_emoji()`.
+
+    If ``False``, a copy of the entry from :data:`EMOJI_DATA` with the additional
+    keys ``match_start`` and ``match_end`` is passed, see :meth:`EmojiMatch.data_copy`.
+
+    If ``True``, a read-only :class:`EmojiDataView` with the same keys is passed
+    instead. This avoids copying the dict for every emoji. Callables that need to
+    modify the data can call :meth:`EmojiDataView.copy`.
+    """
+
+    @staticmethod
+    @contextlib.contextmanager
+    def override(**options: Any) -> Iterator[None]:
+        """Context manager that changes the configuration only in the current context,
+        i.e. the current thread or asyncio task. Other threads and tasks keep using the
+        module-wide configuration, so no lock is needed to use different settings
+        concurrently::
+
+            with emoji.config.override(demojize_keep_zwj=False):
+                emoji.demojize(s)
+
+        The options :attr:`demojize_keep_zwj`, :attr:`replace_emoji_keep_zwj` and
+        :attr:`callback_data_view` can be changed.
+
+        :raises TypeError: if an option is unknown"""
+
+        for name in options:
+            if name not in _CONTEXT_OPTIONS:
+                raise TypeError(f'Unknown config option {name!r}')
+
+        token = _config_overrides.set({**_config_overrides.get(), **options})
+        try:
+            yield
+        finally:
+            _config_overrides.reset(token)
+
+    @staticmethod
+    def enable_stats(enabled: bool = True):
+        """Enable or disable the per-call counters of :func:`emoji.stats()`.
+        Collecting the counters has a small overhead on every call."""
+        metrics.enabled = enabled
+
+    @staticmethod
+    def enable_result_cache(maxsize: int = 1024, max_length: int = 64):
+        """Cache the results of :func:`emoji.emojize()`, :func:`emoji.demojize()`,
+        :func:`emoji.replace_emoji()`, :func:`emoji.analyze()`,
+        :func:`emoji.emoji_list()` and :func:`emoji.emoji_count()` for short strings.
+        Useful if the same strings occur many times, e.g. chat messages or reactions.
+
+        The results are cached by the string, the arguments and the configuration of
+        the current context. Calls with a callable argument, e.g. ``handle_version``,
+        are never cached. The cache is cleared when the emoji data changes, e.g.
+        when a language is loaded or :func:`emoji.add_emoji` is called.
+        :func:`emoji.stats()` reports the hits and misses as ``result_cache.hits``
+        and ``result_cache.misses``.
+
+        :param maxsize: (optional) Maximum number of cached results, the least
+            recently used result is removed first. ``0`` disables the cache.
+        :param max_length: (optional) Results for longer strings are not cached
+        :raises ValueError: if a parameter is negative"""
+        _result_cache.configure(maxsize, max_length)
+
+    @staticmethod
+    def memory_usage() -> Dict[str, Any]:
+        """Returns the approximate memory usage in bytes of the loaded emoji data
+        and the indexes that were built from it::
+
+            {
+                'EMOJI_DATA': 2759217,  # everything in EMOJI_DATA
+                'languages': {'en': 392157, 'alias': 209575, 'fr': 480600},
+                'search_tree': 1614101,
+                'name_index': 157360,
+                'emoji_ids': 411880,
+                'name_cache': 400,
+                'result_cache': 0,
+                'patterns': 0,
+                'total': 4373718,
+            }
+
+        The sizes in ``languages`` are the sizes of the names in each language,
+        they are included in the size of ``EMOJI_DATA``. The search tree is only
+        counted once it was built. ``name_index`` are the indexes of
+        the names that were built so far, the names themselves are counted in
+        ``EMOJI_DATA``. ``emoji_ids`` is only counted once the IDs were loaded,
+        see :func:`emoji_to_id`. The size of ``name_cache``,
+        the cache of :func:`emoji.unicode_codes.get_emoji_by_name`, is estimated from
+        the number of entries. ``result_cache`` is the size of the cached results,
+        see :meth:`config.enable_result_cache`."""
+
+        emoji_data = unicode_codes.EMOJI_DATA
+        seen: Set[int] = set()
+        data_size = metrics.deep_sizeof(emoji_data, seen)
+
+        languages: Dict[str, int] = {}
+        for lang in unicode_codes._loaded_keys:  # pyright: ignore [reportPrivateUsage]
+            if lang in unicode_codes.LANGUAGES or lang == 'alias':
+                language_seen: Set[int] = set()
+                languages[lang] = sum(
+                    metrics.deep_sizeof(data[lang], language_seen)
+                    for data in emoji_data.values()
+                    if lang in data
+                )
+
+        # The data dicts in the leaves are already counted in EMOJI_DATA
+        tree_size = metrics.deep_sizeof(
+            tokenizer._SEARCH_TREE,  # pyright: ignore [reportPrivateUsage]
+            seen,
+        )
+
+        index_size = metrics.deep_sizeof(
+            unicode_codes._name_index,  # pyright: ignore [reportPrivateUsage]
+            seen,
+        )
+
+        ids_size = metrics.deep_sizeof(
+            unicode_codes._emoji_ids,  # pyright: ignore [reportPrivateUsage]
+            seen,
+        )
+
+        cache_size = (
+            unicode_codes.get_emoji_by_name.cache_info().currsize * _NAME_CACHE_ENTRY_SIZE
+        )
+
+        result_cache_size = metrics.deep_sizeof(
+            _result_cache._results,  # pyright: ignore [reportPrivateUsage]
+            seen,
+        )
+
+        patterns_size = sum(
+            sys.getsizeof(pattern)
+            for pattern in (
+                tokenizer._SAFE_CHAR_PATTERN,  # pyright: ignore [reportPrivateUsage]
+                tokenizer._CANDIDATE_PATTERN,  # pyright: ignore [reportPrivateUsage]
+                tokenizer._UTF8_RUN_PATTERN,  # pyright: ignore [reportPrivateUsage]
+            )
+            if pattern is not None
+        )
+
+        return {
+            'EMOJI_DATA': data_size,
+            'languages': languages,
+            'search_tree': tree_size,
+            'name_index': index_size,
+            'emoji_ids': ids_size,
+            'name_cache': cache_size,
+            'result_cache': result_cache_size,
+            'patterns': patterns_size,
+            'total': data_size
+            + tree_size
+            + index_size
+            + ids_size
+            + cache_size
+            + result_cache_size
+            + patterns_size,
+        }
+
     @staticmethod
     def load_language(language: Union[List[str], str, None] = None):
         """Load one or multiple languages into memory.
@@ -119,6 +317,192 @@ class config:
             unicode_codes.load_from_json(lang)
 
 
+def _get_config(name: str) -> Any:
+    """Returns the value of a config option in the current context"""
+    overrides = _config_overrides.get()
+    if name in overrides:
+        return overrides[name]
+    return getattr(config, name)
+
+
+def _config_snapshot() -> Dict[str, Any]:
+    """Returns the values of all config options in the current context.
+    Used to pass the configuration to other threads or processes."""
+    return {name: _get_config(name) for name in _CONTEXT_OPTIONS}
+
+
+def _call_with_config(
+    options: Dict[str, Any], func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Call ``func`` with the configuration ``options`` from :func:`_config_snapshot`"""
+    with config.override(**options):
+        return func(*args, **kwargs)
+
+
+class _ResultCache:
+    """Thread-safe LRU cache of the results of the public functions, see
+    :meth:`config.enable_result_cache`. It has the attributes ``hits``, ``misses``
+    and ``currsize`` like :meth:`functools.lru_cache.cache_info`."""
+
+    def __init__(self):
+        self.maxsize = 0
+        self.max_length = 0
+        self.hits = 0
+        self.misses = 0
+        # Incremented by clear(), results that were computed before are not stored
+        self.generation = 0
+        self._results: 'collections.OrderedDict[Any, Any]' = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def currsize(self) -> int:
+        return len(self._results)
+
+    def configure(self, maxsize: int, max_length: int):
+        if maxsize < 0 or max_length < 0:
+            raise ValueError('maxsize and max_length must not be negative')
+        with self._lock:
+            self.maxsize = maxsize
+            self.max_length = max_length
+            self.hits = 0
+            self.misses = 0
+            self.generation += 1
+            self._results.clear()
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._results.clear()
+
+    def get(self, key: Any, default: Any) -> Any:
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Any, result: Any, generation: int):
+        with self._lock:
+            if generation != self.generation or self.maxsize == 0:
+                return
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+
+_result_cache = _ResultCache()
+_MISSING = object()
+
+metrics.register_cache('result_cache', lambda: _result_cache)
+
+
+def _clear_result_cache(event: str, info: Dict[str, Any]):
+    """Hook that clears the result cache when the emoji data changes"""
+    _result_cache.clear()
+
+
+for _event in (
+    'language_loaded',
+    'emoji_added',
+    'emoji_removed',
+    'data_reloaded',
+):
+    unicode_codes.register_hook(_event, _clear_result_cache)
+
+
+# The skin tone modifiers by their names in the emoji names, e.g. :dark_skin_tone:
+_SKIN_TONES = {
+    'light': '\U0001f3fb',
+    'medium-light': '\U0001f3fc',
+    'medium': '\U0001f3fd',
+    'medium-dark': '\U0001f3fe',
+    'dark': '\U0001f3ff',
+}
+_SKIN_TONE_PATTERN = re.compile('[\U0001f3fb-\U0001f3ff]')
+
+# Multi-Person Groupings: sequences of persons with individual skin tones
+# (without variation selectors) and the single emoji for the same skin tone
+_MULTI_PERSON_GROUPINGS = {
+    '\U0001f9d1\u200d\u2764\u200d\U0001f9d1': '\U0001f491',  # 💑
+    '\U0001f9d1\u200d\u2764\u200d\U0001f48b\u200d\U0001f9d1': '\U0001f48f',  # 💏
+    '\U0001faf1\u200d\U0001faf2': '\U0001f91d',  # 🤝
+    '\U0001f469\u200d\U0001f91d\u200d\U0001f468': '\U0001f46b',  # 👫
+    '\U0001f468\u200d\U0001f91d\u200d\U0001f468': '\U0001f46c',  # 👬
+    '\U0001f469\u200d\U0001f91d\u200d\U0001f469': '\U0001f46d',  # 👭
+}
+
+# Emoji with a skin tone by the emoji they are replaced with, for each target tone
+_skin_tone_maps: Dict[Optional[str], Dict[str, str]] = {}
+
+
+def _clear_skin_tone_maps(event: str, info: Dict[str, Any]):
+    """Hook that clears the maps of :func:`normalize_skin_tones` when emoji
+    are added or removed"""
+    _skin_tone_maps.clear()
+
+
+for _event in ('emoji_added', 'emoji_removed', 'data_reloaded'):
+    unicode_codes.register_hook(_event, _clear_skin_tone_maps)
+
+
+def _cached_result(
+    store: Callable[[Any], Any] = lambda result: result,
+    load: Callable[[Any], Any] = lambda result: result,
+) -> Callable[[_F], _F]:
+    """Decorator that looks up the results of a function in the result cache.
+    ``store`` converts a result for the cache and ``load`` converts it back,
+    e.g. to return a new copy of a mutable result."""
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(string: str, *args: Any, **kwargs: Any) -> Any:
+            cache = _result_cache
+            if (
+                cache.maxsize == 0
+                or not isinstance(string, str)  # pyright: ignore [reportUnnecessaryIsInstance]
+                or len(string) > cache.max_length
+                or any(callable(arg) for arg in args)
+                or any(callable(arg) for arg in kwargs.values())
+            ):
+                return func(string, *args, **kwargs)
+
+            key = (
+                func,
+                string,
+                args,
+                tuple(sorted(kwargs.items())),
+                tuple(_get_config(name) for name in _CONTEXT_OPTIONS),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                # E.g. delimiters as a list
+                return func(string, *args, **kwargs)
+
+            generation = cache.generation
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = store(func(string, *args, **kwargs))
+                cache.put(key, result, generation)
+            return load(result)
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+def _callback_data(emoji_match: EmojiMatch) -> Dict[str, Any]:
+    """Data that is passed to user callables, see :attr:`config.callback_data_view`"""
+    if _get_config('callback_data_view'):
+        return emoji_match.data_view()  # type: ignore
+    return emoji_match.data_copy()
+
+
+@_cached_result()
 def emojize(
     string: str,
     delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
@@ -171,6 +555,8 @@ def emojize(
     """
 
     unicode_codes.load_from_json(language)
+    # The same data for all names, even if it is replaced meanwhile
+    emoji_data = unicode_codes.EMOJI_DATA
 
     pattern = re.compile(
         '(%s[%s]+%s)'
@@ -188,10 +574,18 @@ def emojize(
 
         if emj is None:
             return match.group(1)
+        data = emoji_data.get(emj)
+        if data is None:  # The name index already belongs to newer data
+            return match.group(1)
 
-        if version is not None and unicode_codes.EMOJI_DATA[emj]['E'] > version:
+        if version is not None and data['E'] > version:
             if callable(handle_version):
-                emj_data = unicode_codes.EMOJI_DATA[emj].copy()
+                if _get_config('callback_data_view'):
+                    return handle_version(
+                        emj,
+                        EmojiDataView(data, match.start(), match.end()),  # type: ignore
+                    )
+                emj_data = data.copy()
                 emj_data['match_start'] = match.start()
                 emj_data['match_end'] = match.end()
                 return handle_version(emj, emj_data)
@@ -201,7 +595,7 @@ def emojize(
             else:
                 return ''
 
-        if variant is None or 'variant' not in unicode_codes.EMOJI_DATA[emj]:
+        if variant is None or 'variant' not in data:
             return emj
 
         if emj[-1] == '\ufe0e' or emj[-1] == '\ufe0f':
@@ -219,6 +613,7 @@ def emojize(
     return pattern.sub(replace, string)
 
 
+@_cached_result(store=tuple, load=iter)
 def analyze(
     string: str, non_emoji: bool = False, join_emoji: bool = True
 ) -> Iterator[Token]:
@@ -239,12 +634,14 @@ def analyze(
     )
 
 
+@_cached_result()
 def demojize(
     string: str,
     delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
     language: str = 'en',
     version: Optional[float] = None,
     handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
 ) -> str:
     """
     Replace Unicode emoji in a string with emoji shortcodes. Useful for storage.
@@ -279,6 +676,8 @@ def demojize(
                 ...
             })
 
+    :param keep_zwj: (optional) Keep the zero-width-joiners in non-RGI emoji.
+        If ``None``, :attr:`config.demojize_keep_zwj` is used.
     """
 
     if language == 'alias':
@@ -293,7 +692,7 @@ def demojize(
         assert emoji_match.data is not None
         if version is not None and emoji_match.data['E'] > version:
             if callable(handle_version):
-                return handle_version(emoji_match.emoji, emoji_match.data_copy())
+                return handle_version(emoji_match.emoji, _callback_data(emoji_match))
             elif handle_version is not None:
                 return handle_version
             else:
@@ -309,17 +708,22 @@ def demojize(
             # The emoji exists, but it is not translated, so we keep the emoji
             return emoji_match.emoji
 
-    matches = tokenize(string, keep_zwj=config.demojize_keep_zwj)
+    if keep_zwj is None:
+        keep_zwj = _get_config('demojize_keep_zwj')
+
+    matches = tokenize(string, keep_zwj=keep_zwj)
     return ''.join(
         str(handle(token.value)) if isinstance(token.value, EmojiMatch) else token.value
         for token in matches
     )
 
 
+@_cached_result()
 def replace_emoji(
     string: str,
     replace: Union[str, Callable[[str, Dict[str, str]], str]] = '',
     version: float = -1,
+    keep_zwj: Optional[bool] = None,
 ) -> str:
     """
     Replace Unicode emoji in a customizable string.
@@ -331,6 +735,8 @@ def replace_emoji(
         replace(str, dict) -> str
     :param version: (optional) Max version. If set to an Emoji Version,
         only emoji above this version will be replaced.
+    :param keep_zwj: (optional) Keep the zero-width-joiners in non-RGI emoji.
+        If ``None``, :attr:`config.replace_emoji_keep_zwj` is used.
     """
 
     def handle(emoji_match: EmojiMatch) -> str:
@@ -338,17 +744,20 @@ def replace_emoji(
             assert emoji_match.data is not None
             if emoji_match.data['E'] > version:
                 if callable(replace):
-                    return replace(emoji_match.emoji, emoji_match.data_copy())
+                    return replace(emoji_match.emoji, _callback_data(emoji_match))
                 else:
                     return str(replace)
         elif callable(replace):
-            return replace(emoji_match.emoji, emoji_match.data_copy())
+            return replace(emoji_match.emoji, _callback_data(emoji_match))
         elif replace is not None:  # type: ignore
             return replace
         return emoji_match.emoji
 
-    matches = tokenize(string, keep_zwj=config.replace_emoji_keep_zwj)
-    if config.replace_emoji_keep_zwj:
+    if keep_zwj is None:
+        keep_zwj = _get_config('replace_emoji_keep_zwj')
+
+    matches = tokenize(string, keep_zwj=keep_zwj)
+    if keep_zwj:
         matches = filter_tokens(matches, emoji_only=False, join_emoji=True)
     return ''.join(
         str(handle(m.value)) if isinstance(m.value, EmojiMatch) else m.value
@@ -356,6 +765,87 @@ def replace_emoji(
     )
 
 
+def _get_skin_tone_map(tone: Optional[str]) -> Dict[str, str]:
+    """Map of every emoji in :data:`EMOJI_DATA` that contains a skin tone
+    modifier to the same emoji with the modifiers replaced by ``tone``.
+    If ``tone`` is None, the emoji is mapped to the best qualified emoji without
+    the modifiers, e.g. ☝🏻 to ☝️ and not to the unqualified ☝.
+    Multi-Person Groupings are mapped to the single emoji, e.g. 🫱🏿‍🫲🏻 to 🤝."""
+    skin_tone_map = _skin_tone_maps.get(tone)
+    if skin_tone_map is None:
+        emoji_data = unicode_codes.EMOJI_DATA
+        unknown = max(unicode_codes.STATUS.values()) + 1
+        skin_tone_map = {}
+        for emj in emoji_data:
+            if not _SKIN_TONE_PATTERN.search(emj):
+                continue
+            base = _SKIN_TONE_PATTERN.sub('', emj)
+            grouping = _MULTI_PERSON_GROUPINGS.get(base.replace('\ufe0f', ''))
+            if tone is not None:
+                candidates = [_SKIN_TONE_PATTERN.sub(tone, emj)]
+            else:
+                candidates = [base, _SKIN_TONE_PATTERN.sub('\ufe0f', emj)]
+            if grouping is not None:
+                candidates.append(grouping + (tone or ''))
+            # The best qualified candidate, or the first one if none is known
+            target = min(
+                candidates,
+                key=lambda candidate: emoji_data[candidate]['status']
+                if candidate in emoji_data
+                else unknown,
+            )
+            if target != emj:
+                skin_tone_map[emj] = target
+        if emoji_data is unicode_codes.EMOJI_DATA:  # Not replaced meanwhile
+            _skin_tone_maps[tone] = skin_tone_map
+    return skin_tone_map
+
+
+@_cached_result()
+def normalize_skin_tones(string: str, to: Optional[str] = None) -> str:
+    """
+    Replace the skin tones of all emoji in a string. Removes the skin tones by
+    default or replaces them with the skin tone ``to``. Emoji without a skin
+    tone are not changed.
+        >>> emoji.normalize_skin_tones('👍🏽 👨🏿\u200d💻')
+        '👍 👨\u200d💻'
+        >>> emoji.normalize_skin_tones('👍🏽 👍', to='dark')
+        '👍🏿 👍'
+
+    The emoji in a non-RGI ZWJ sequence are replaced one by one, e.g. the family
+    emoji ``👨‍👩🏿‍👧🏻`` becomes ``👨‍👩‍👧``. A skin tone modifier that is not
+    part of another emoji is an emoji itself, it is removed or replaced as well.
+
+    :param string: String contains Unicode characters. MUST BE UNICODE.
+    :param to: (optional) The skin tone: one of ``'light'``, ``'medium-light'``,
+        ``'medium'``, ``'medium-dark'``, ``'dark'`` or the skin tone modifier
+        character, e.g. ``'\U0001F3FF'``
+    :raises ValueError: if ``to`` is not a skin tone
+    """
+
+    tone = _SKIN_TONES.get(to, to) if to is not None else None
+    if tone is not None and tone not in _SKIN_TONES.values():
+        raise ValueError('Unknown skin tone', to)
+
+    # Only emoji with a skin tone modifier are replaced
+    if not _SKIN_TONE_PATTERN.search(string):
+        return string
+
+    skin_tone_map = _get_skin_tone_map(tone)
+    result: List[str] = []
+    pos = 0
+    for token in tokenize(string, keep_zwj=False):
+        if isinstance(token.value, EmojiMatch):
+            target = skin_tone_map.get(token.value.emoji)
+            if target is not None:
+                result.append(string[pos : token.value.start])
+                result.append(target)
+                pos = token.value.end
+    result.append(string[pos:])
+    return ''.join(result)
+
+
+@_cached_result(load=lambda result: [dict(item) for item in result])
 def emoji_list(string: str) -> List[_EmojiListReturn]:
     """
     Returns the location and emoji in list of dict format.
@@ -374,12 +864,21 @@ def emoji_list(string: str) -> List[_EmojiListReturn]:
     ]
 
 
+def _iter_emoji(string: str) -> Iterator[str]:
+    """Yields the emoji in a string, the same as ``emoji_list()`` but
+    without creating a dict for each emoji"""
+    for token in tokenize(string, keep_zwj=False):
+        if isinstance(token.value, EmojiMatch):
+            yield token.chars
+
+
 def distinct_emoji_list(string: str) -> List[str]:
     """Returns distinct list of emojis from the string."""
-    distinct_list = list({e['emoji'] for e in emoji_list(string)})
+    distinct_list = list(set(_iter_emoji(string)))
     return distinct_list
 
 
+@_cached_result()
 def emoji_count(string: str, unique: bool = False) -> int:
     """
     Returns the count of emojis in a string.
@@ -387,8 +886,17 @@ def emoji_count(string: str, unique: bool = False) -> int:
     :param unique: (optional) True if count only unique emojis
     """
     if unique:
-        return len(distinct_emoji_list(string))
-    return len(emoji_list(string))
+        return len(set(_iter_emoji(string)))
+    return sum(1 for _ in _iter_emoji(string))
+
+
+def emoji_counter(string: str) -> Counter[str]:
+    """
+    Returns a :class:`collections.Counter` with the frequency of each emoji in a string.
+        >>> emoji.emoji_counter("Hello 🇵🇱🍺🇵🇱")
+        Counter({'🇵🇱': 2, '🍺': 1})
+    """
+    return collections.Counter(_iter_emoji(string))
 
 
 def is_emoji(string: str) -> bool:
@@ -405,7 +913,27 @@ def purely_emoji(string: str) -> bool:
     This might not imply that `is_emoji` for all the characters, for example,
     if the string contains variation selectors.
     """
-    return all(isinstance(m.value, EmojiMatch) for m in analyze(string, non_emoji=True))
+    if not string:
+        return True
+    first = string[0]
+    if (
+        first not in get_search_tree()
+        and first != '\ufe0e'
+        and first != '\ufe0f'
+    ):
+        return False
+
+    # Same result as checking analyze(string, non_emoji=True) but stops at the
+    # first character that is not an emoji. A ZWJ that follows an emoji can
+    # only be part of a (non-RGI) ZWJ sequence, so the ZWJ sequences do not
+    # need to be joined into EmojiMatchZWJNonRGI objects.
+    previous_is_emoji = False
+    for token in tokenize(string, keep_zwj=True):
+        if isinstance(token.value, EmojiMatch):
+            previous_is_emoji = True
+        elif not previous_is_emoji or token.chars != _ZWJ:
+            return False
+    return True
 
 
 def version(string: str) -> float:
@@ -421,14 +949,16 @@ def version(string: str) -> float:
     :param string: An emoji or a text containing an emoji
     :raises ValueError: if ``string`` does not contain an emoji
     """
+    emoji_data = unicode_codes.EMOJI_DATA
+
     # Try dictionary lookup
-    if string in unicode_codes.EMOJI_DATA:
-        return unicode_codes.EMOJI_DATA[string]['E']
+    if string in emoji_data:
+        return emoji_data[string]['E']
 
     # Try name lookup
     emj_code = unicode_codes.get_emoji_by_name(string, 'en')
-    if emj_code and emj_code in unicode_codes.EMOJI_DATA:
-        return unicode_codes.EMOJI_DATA[emj_code]['E']
+    if emj_code and emj_code in emoji_data:
+        return emoji_data[emj_code]['E']
 
     # Try to find first emoji in string
     version: List[float] = []
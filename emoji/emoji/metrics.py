@@ -0,0 +1,107 @@
+"""
+emoji.metrics
+~~~~~~~~~~~~~
+
+Counters and timings for the hot paths, see :func:`emoji.stats()`.
+
+"""
+
+import sys
+import threading
+from typing import Any, Callable, Dict, Set, Tuple, Union
+
+__all__ = ['stats']
+
+enabled = False
+"""If ``True``, per-call counters are collected. Use :meth:`emoji.config.enable_stats`
+to change it. Timings of one-time initializations are always collected."""
+
+_counters: Dict[str, Union[int, float]] = {}  # Cleared by stats(reset=True)
+_timings: Dict[str, Union[int, float]] = {}  # Cumulative, never cleared
+_lock = threading.Lock()  # Protects _counters and _timings
+_caches: Dict[str, Callable[[], Any]] = {}
+_cache_offsets: Dict[str, Tuple[int, int]] = {}  # hits and misses at the last reset
+
+
+def count(name: str, value: Union[int, float] = 1):
+    """Add ``value`` to the counter ``name``"""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def timing(name: str, seconds: float):
+    """Add a call with the duration ``seconds`` to the timing ``name``"""
+    with _lock:
+        _timings[f'{name}.calls'] = _timings.get(f'{name}.calls', 0) + 1
+        _timings[f'{name}.seconds'] = _timings.get(f'{name}.seconds', 0) + seconds
+
+
+def register_cache(name: str, cache_info: Callable[[], Any]):
+    """Register a cache for :func:`stats`. ``cache_info`` must return an object
+    with the attributes ``hits``, ``misses`` and ``currsize`` like
+    :meth:`functools.lru_cache.cache_info`"""
+    _caches[name] = cache_info
+
+
+def stats(reset: bool = False) -> Dict[str, Union[int, float]]:
+    """
+    Returns counters, cumulative timings and cache statistics as a flat dict,
+    e.g. to export them to Prometheus:
+        >>> emoji.config.enable_stats()
+        >>> emoji.demojize('Python is fun 👍')
+        'Python is fun :thumbs_up:'
+        >>> emoji.stats()
+        {'get_search_tree.calls': 1, 'get_search_tree.seconds': 0.0091,
+        'load_from_json.calls': 1, 'load_from_json.seconds': 0.0236,
+        'tokenize.calls': 1, 'tokenize.chars': 15,
+        'get_emoji_by_name.hits': 0, 'get_emoji_by_name.misses': 0, ...}
+
+    Timings of the data loading and the search tree build are always collected.
+    The per-call counters like ``tokenize.calls`` and ``tokenize.chars``, the number
+    of characters the tokenizer scanned, are only collected after
+    :meth:`emoji.config.enable_stats` was called.
+
+    :param reset: (optional) Reset the per-call counters and the cache statistics
+        after reading them. The timings are cumulative and are not reset, because
+        the initializations they measure usually run only once per process.
+    """
+    with _lock:
+        result = dict(sorted({**_counters, **_timings}.items()))
+        if reset:
+            _counters.clear()
+
+    for name, cache_info in _caches.items():
+        info = cache_info()
+        offset_hits, offset_misses = _cache_offsets.get(name, (0, 0))
+        if info.hits < offset_hits or info.misses < offset_misses:
+            offset_hits, offset_misses = 0, 0  # The cache was cleared in the meantime
+        hits = info.hits - offset_hits
+        misses = info.misses - offset_misses
+        result[f'{name}.hits'] = hits
+        result[f'{name}.misses'] = misses
+        result[f'{name}.currsize'] = info.currsize
+        result[f'{name}.hit_rate'] = hits / (hits + misses) if hits else 0.0
+        if reset:
+            _cache_offsets[name] = (info.hits, info.misses)
+
+    return result
+
+
+def deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    """Size in bytes of ``obj`` and all dicts, lists, tuples, sets and their
+    items that it contains. Objects whose ``id()`` is in ``seen`` are skipped,
+    the ids of the counted objects are added to ``seen``."""
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())  # type: ignore
+            stack.extend(item.values())  # type: ignore
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)  # type: ignore
+    return size
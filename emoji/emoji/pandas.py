@@ -0,0 +1,162 @@
+"""
+emoji.pandas
+~~~~~~~~~~~~
+
+A pandas Series accessor ``.emoji``. Importing this module registers it::
+
+    >>> import pandas as pd
+    >>> import emoji.pandas
+    >>> s = pd.Series(['Python is fun 👍', 'no emoji', 'Python is fun 👍'])
+    >>> s.emoji.demojize().tolist()
+    ['Python is fun :thumbs_up:', 'no emoji', 'Python is fun :thumbs_up:']
+    >>> s.emoji.count().tolist()
+    [1, 0, 1]
+
+Columns often contain the same values many times. The accessor processes each
+distinct value only once and strings that cannot contain an emoji are not
+tokenized at all, see :func:`emoji.tokenizer.may_contain_emoji`.
+Missing values and values that are not strings are returned as missing values.
+
+Requires pandas, which is not a dependency of the emoji package.
+
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy
+import pandas
+
+if sys.version_info < (3, 9):
+    from typing_extensions import Literal  # type: ignore
+else:
+    from typing import Literal
+
+from emoji.core import (
+    _DEFAULT_DELIMITER,  # pyright: ignore [reportPrivateUsage]
+    _iter_emoji,  # pyright: ignore [reportPrivateUsage]
+    demojize,
+    emoji_count,
+    emojize,
+)
+from emoji.tokenizer import may_contain_emoji
+
+__all__ = ['EmojiAccessor']
+
+
+@pandas.api.extensions.register_series_accessor('emoji')
+class EmojiAccessor:
+    """
+    The ``.emoji`` accessor of a :class:`pandas.Series` of strings.
+
+    :param series: The Series
+    """
+
+    def __init__(self, series: 'pandas.Series[Any]'):
+        self._series = series
+
+    def _map(
+        self, func: Callable[[str], Any], na: Any, dtype: Any = object
+    ) -> 'pandas.Series[Any]':
+        """Apply ``func`` to each distinct string and broadcast the results to
+        the rows. Rows with other values get ``na``."""
+        codes, uniques = pandas.factorize(self._series)
+        # The last entry is used for the missing values, their code is -1
+        results = numpy.empty(len(uniques) + 1, dtype=dtype)
+        for i, value in enumerate(uniques):
+            results[i] = func(value) if isinstance(value, str) else na
+        results[-1] = na
+        return pandas.Series(
+            results[codes], index=self._series.index, name=self._series.name
+        )
+
+    def demojize(
+        self,
+        delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+        language: str = 'en',
+        version: Optional[float] = None,
+        handle_version: Optional[
+            Union[str, Callable[[str, Dict[str, str]], str]]
+        ] = None,
+        keep_zwj: Optional[bool] = None,
+    ) -> 'pandas.Series[Any]':
+        """
+        Apply :func:`emoji.demojize()` to each string, see there for the parameters.
+        """
+
+        def func(string: str) -> str:
+            if not may_contain_emoji(string):
+                return string
+            return demojize(
+                string,
+                delimiters=delimiters,
+                language=language,
+                version=version,
+                handle_version=handle_version,
+                keep_zwj=keep_zwj,
+            )
+
+        return self._map(func, None)
+
+    def emojize(
+        self,
+        delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+        variant: Optional[Literal['text_type', 'emoji_type']] = None,
+        language: str = 'en',
+        version: Optional[float] = None,
+        handle_version: Optional[
+            Union[str, Callable[[str, Dict[str, str]], str]]
+        ] = None,
+    ) -> 'pandas.Series[Any]':
+        """
+        Apply :func:`emoji.emojize()` to each string, see there for the parameters.
+        """
+
+        def func(string: str) -> str:
+            return emojize(
+                string,
+                delimiters=delimiters,
+                variant=variant,
+                language=language,
+                version=version,
+                handle_version=handle_version,
+            )
+
+        return self._map(func, None)
+
+    def count(self, unique: bool = False) -> 'pandas.Series[Any]':
+        """
+        Apply :func:`emoji.emoji_count()` to each string. The result has the
+        dtype ``int64``, or ``float64`` if there are missing values.
+
+        :param unique: (optional) True if count only unique emojis
+        """
+
+        def func(string: str) -> int:
+            if not may_contain_emoji(string):
+                return 0
+            return emoji_count(string, unique)
+
+        result = self._map(func, numpy.nan, numpy.float64)
+        if result.isna().any():
+            return result
+        return result.astype(numpy.int64)
+
+    def list(self) -> 'pandas.Series[Any]':
+        """
+        Returns a list of the emoji in each string, in the order of
+        :func:`emoji.emoji_list()` but only the emoji themselves::
+
+            >>> pd.Series(['🐍 and 🐍']).emoji.list().tolist()
+            [['🐍', '🐍']]
+
+        Rows with the same value share the same list object, copy the lists
+        before you modify them.
+        """
+
+        def func(string: str) -> List[str]:
+            if not may_contain_emoji(string):
+                return []
+            return list(_iter_emoji(string))
+
+        return self._map(func, None)
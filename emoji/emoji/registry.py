@@ -0,0 +1,170 @@
+"""
+emoji.registry
+~~~~~~~~~~~~~~
+
+Add custom emoji and shortcodes to :data:`EMOJI_DATA` or remove emoji::
+
+    >>> emoji.add_emoji('\\U000F0000', {'en': ':partyparrot:', 'image': 'parrot.gif'})
+    >>> emoji.emojize('Deploy done :partyparrot:')
+    'Deploy done \\U000F0000'
+    >>> emoji.demojize('Deploy done \\U000F0000')
+    'Deploy done :partyparrot:'
+
+The search tree, the name indexes and the regular expressions are updated in
+place, they are not rebuilt.
+
+Replace all emoji data with newer JSON files without restarting the process::
+
+    >>> emoji.reload_data('/srv/emoji-data/16.0')
+
+"""
+
+import os
+import pathlib
+import re
+import time
+import unicodedata
+from typing import Any, Dict, Union
+
+import emoji as _emoji
+from emoji import metrics
+from emoji.core import _EMOJI_NAME_PATTERN  # pyright: ignore [reportPrivateUsage]
+from emoji.tokenizer import (
+    _add_to_search_tree,  # pyright: ignore [reportPrivateUsage]
+    _read_search_tree,  # pyright: ignore [reportPrivateUsage]
+    _remove_from_search_tree,  # pyright: ignore [reportPrivateUsage]
+    _replace_search_tree,  # pyright: ignore [reportPrivateUsage]
+)
+from emoji.unicode_codes import (
+    LANGUAGES,
+    STATUS,
+    EmojiDataDict,
+    _add_entry,  # pyright: ignore [reportPrivateUsage]
+    _fire,  # pyright: ignore [reportPrivateUsage]
+    _read_source,  # pyright: ignore [reportPrivateUsage]
+    _remove_entry,  # pyright: ignore [reportPrivateUsage]
+    _replace_data,  # pyright: ignore [reportPrivateUsage]
+    _write_lock,  # pyright: ignore [reportPrivateUsage]
+)
+
+__all__ = ['add_emoji', 'remove_emoji', 'reload_data']
+
+_NAME_PATTERN = re.compile(f':[{_EMOJI_NAME_PATTERN}]+:')
+
+
+def _check_name(name: Any):
+    """Raises ValueError if :func:`emoji.emojize` cannot find the name"""
+    if not isinstance(name, str) or not _NAME_PATTERN.fullmatch(name):
+        raise ValueError('Invalid name', name)
+    if unicodedata.normalize('NFKC', name) != name:
+        raise ValueError('Name must be NFKC normalized', name)
+
+
+def add_emoji(emoji: str, data: Dict[str, Any]):
+    """
+    Add a custom emoji to :data:`EMOJI_DATA` or replace an existing emoji.
+    The emoji can be any string, e.g. an emoji sequence or characters from the
+    Unicode Private Use Area that are used for custom glyphs.
+
+    The names work in all functions, e.g. :func:`emoji.emojize` and
+    :func:`emoji.demojize`. Loading a language with
+    :func:`emoji.config.load_language` later does not change the entry.
+
+    :param emoji: The emoji
+    :param data: The entry like the values of :data:`EMOJI_DATA`: the English name
+        ``'en'`` is required. Optional are ``'status'`` (default:
+        ``STATUS['fully_qualified']``), the Emoji version ``'E'`` (default: ``0``),
+        a list of ``'alias'`` names and names in other languages,
+        e.g. ``'de': ':party_papagei:'``. Other keys are kept in the entry.
+    :raises ValueError: if the data is invalid or a name is already used by
+        another emoji
+    """
+
+    start = time.perf_counter()
+    if not isinstance(emoji, str) or not emoji:  # pyright: ignore [reportUnnecessaryIsInstance]
+        raise ValueError('Emoji must be a non-empty string', emoji)
+    entry = EmojiDataDict(data)
+    entry.setdefault('status', STATUS['fully_qualified'])
+    entry.setdefault('E', 0)
+    if 'en' not in entry:
+        raise ValueError('Data must contain the English name "en"')
+    if entry['status'] not in STATUS.values():
+        raise ValueError('Invalid status', entry['status'])
+    if not isinstance(entry['E'], (int, float)):
+        raise ValueError('Invalid Emoji version', entry['E'])
+    if 'alias' in entry:
+        entry['alias'] = list(entry['alias'])
+        for alias in entry['alias']:
+            _check_name(alias)
+    for language in LANGUAGES:
+        if language in entry:
+            _check_name(entry[language])
+
+    with _write_lock:
+        _add_entry(emoji, entry)
+        _add_to_search_tree(emoji, entry)
+
+    _fire('emoji_added', emoji=emoji, duration=time.perf_counter() - start)
+
+
+def remove_emoji(emoji: str):
+    """
+    Remove an emoji from :data:`EMOJI_DATA`. It is not found by the functions
+    anymore, e.g. :func:`emoji.demojize` keeps it unchanged. Its ID is not reused,
+    see :func:`emoji.emoji_to_id`.
+
+    :param emoji: The emoji
+    :raises KeyError: if the emoji is not in :data:`EMOJI_DATA`
+    """
+
+    start = time.perf_counter()
+    with _write_lock:
+        _remove_entry(emoji)
+        _remove_from_search_tree(emoji)
+
+    _fire('emoji_removed', emoji=emoji, duration=time.perf_counter() - start)
+
+
+def reload_data(path_or_package: Union[str, 'os.PathLike[str]']):
+    """
+    Replace :data:`EMOJI_DATA` with the data of the JSON files in a directory or
+    a package, e.g. the files of a newer Emoji version. The files must have the
+    same names and format as the files in ``emoji/unicode_codes``. Languages that
+    are loaded later are read from the same place.
+
+    The new data, the search tree and the name indexes are built completely
+    before they replace the old ones. Calls that run in other threads during
+    the reload do not fail, they use the old or the new data. A call of
+    :func:`emoji.emojize` may find a name in the new data and then ignore it
+    because it keeps using the entries of the old data. Calls that start after
+    the reload use the new data. The old data is kept if a file cannot be read.
+
+    The languages that were loaded are loaded again. Emoji that were added with
+    :func:`add_emoji` are not kept. Use :data:`emoji.EMOJI_DATA` after the reload,
+    ``from emoji import EMOJI_DATA`` still refers to the old data.
+
+    :param path_or_package: A directory or the name of a package, e.g.
+        ``'emoji.unicode_codes'`` for the data that ships with this package
+    """
+
+    start = time.perf_counter()
+    source = path_or_package
+    if (
+        not isinstance(source, str)
+        or os.path.isdir(source)
+        or not all(part.isidentifier() for part in source.split('.'))
+    ):
+        # A directory, unicode_codes treats a str source as a package name
+        source = pathlib.Path(source).resolve()
+
+    with _write_lock:
+        # Build everything that was built for the old data, then swap
+        data = _read_source(source)
+        search_tree = _read_search_tree(data.emoji_data)
+        _replace_data(data)
+        _replace_search_tree(search_tree)
+        _emoji.EMOJI_DATA = data.emoji_data
+
+    duration = time.perf_counter() - start
+    metrics.timing('reload_data', duration)
+    _fire('data_reloaded', source=path_or_package, duration=duration)
@@ -0,0 +1,248 @@
+"""
+emoji.server
+~~~~~~~~~~~~
+
+A long-running process that keeps the emoji data loaded and answers requests
+over a Unix socket. Start it with::
+
+    $ python -m emoji serve --socket /tmp/emoji.sock
+
+and use the :class:`Client`::
+
+    >>> with emoji.server.Client('/tmp/emoji.sock') as client:
+    ...     client.emojize('Python is :thumbs_up:')
+    'Python is 👍'
+
+Protocol: each request and each response is a frame of a 4-byte big-endian
+length followed by that many bytes of UTF-8 encoded JSON. A connection can
+send any number of requests, the responses are sent in the same order.
+
+Request::
+
+    {"op": "demojize", "string": "Python is 👍", "language": "de", "id": 1}
+
+``op`` is one of ``emojize``, ``demojize``, ``analyze`` or ``ping``. Other keys
+are passed as keyword arguments to :func:`emoji.emojize`, :func:`emoji.demojize`
+or :func:`emoji.analyze`. The optional ``id`` is copied into the response.
+
+Response::
+
+    {"result": "Python is :daumen_hoch:", "id": 1}
+    {"error": "Language not supported", "id": 1}
+
+``analyze`` returns a list with a dict for each token, see :func:`token_to_dict`.
+
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+from typing import Any, Dict, Iterable, List, Optional
+
+from emoji import unicode_codes
+from emoji.core import analyze, demojize, emojize
+from emoji.tokenizer import EmojiMatch, Token, get_search_tree
+
+__all__ = ['Client', 'make_server', 'serve', 'token_to_dict']
+
+MAX_FRAME_SIZE = 1 << 26
+"""Maximum size of a request or response in bytes"""
+
+_HEADER = struct.Struct('>I')
+
+_OPTIONS = {
+    'emojize': {'delimiters', 'variant', 'language', 'version', 'handle_version'},
+    'demojize': {'delimiters', 'language', 'version', 'handle_version', 'keep_zwj'},
+    'analyze': {'non_emoji', 'join_emoji'},
+    'ping': set(),
+}
+
+
+def token_to_dict(token: Token) -> Dict[str, Any]:
+    """
+    Convert a :class:`Token` to a JSON serializable dict. Emoji are converted to
+    ``{'chars': ..., 'emoji': ..., 'match_start': ..., 'match_end': ...,
+    'data': ...}`` where ``data`` is the entry in :data:`EMOJI_DATA` or ``None``
+    for non-RGI ZWJ sequences. Other characters are converted to ``{'chars': ...}``.
+    """
+    if not isinstance(token.value, EmojiMatch):
+        return {'chars': token.chars}
+    match = token.value
+    return {
+        'chars': token.chars,
+        'emoji': match.emoji,
+        'match_start': match.start,
+        'match_end': match.end,
+        'data': dict(match.data) if match.data is not None else None,
+    }
+
+
+def _write_frame(wfile: Any, obj: Any):
+    payload = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError('Frame too large', len(payload))
+    wfile.write(_HEADER.pack(len(payload)) + payload)
+    wfile.flush()
+
+
+def _read_frame(rfile: Any) -> Optional[Any]:
+    """Returns the decoded frame or ``None`` if the connection was closed"""
+    header = rfile.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        raise EOFError('Connection closed in the middle of a frame')
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError('Frame too large', size)
+    payload = rfile.read(size)
+    if len(payload) < size:
+        raise EOFError('Connection closed in the middle of a frame')
+    return json.loads(payload.decode('utf-8'))
+
+
+def _handle(request: Any) -> Any:
+    """Returns the result of a request or raises an exception"""
+    if not isinstance(request, dict):
+        raise ValueError('The request must be a JSON object')
+    kwargs: Dict[str, Any] = dict(request)  # type: ignore
+    kwargs.pop('id', None)
+    op = kwargs.pop('op', None)
+    if op not in _OPTIONS:
+        raise ValueError('Unknown op', op)
+    if op == 'ping':
+        return 'pong'
+
+    string = kwargs.pop('string', None)
+    if not isinstance(string, str):
+        raise ValueError('"string" must be a string')
+    unknown = set(kwargs) - _OPTIONS[op]
+    if unknown:
+        raise ValueError('Unknown options', sorted(unknown))
+    if 'delimiters' in kwargs:
+        kwargs['delimiters'] = tuple(kwargs['delimiters'])
+
+    if op == 'emojize':
+        return emojize(string, **kwargs)
+    if op == 'demojize':
+        return demojize(string, **kwargs)
+    return [token_to_dict(token) for token in analyze(string, **kwargs)]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                request = _read_frame(self.rfile)
+            except (EOFError, ValueError, UnicodeDecodeError):
+                return  # The stream cannot be resynchronized
+            if request is None:
+                return
+            response: Dict[str, Any]
+            try:
+                response = {'result': _handle(request)}
+            except Exception as e:
+                response = {'error': ' '.join(str(arg) for arg in e.args) or repr(e)}
+            if isinstance(request, dict) and 'id' in request:
+                response['id'] = request['id']
+            try:
+                _write_frame(self.wfile, response)
+            except ValueError as e:
+                _write_frame(self.wfile, {'error': str(e), 'id': response.get('id')})
+
+
+def make_server(path: str, languages: Iterable[str] = ()) -> socketserver.BaseServer:
+    """
+    Load the emoji data and create a server that listens on the Unix socket
+    ``path``. Each connection is handled in a separate thread.
+    Call ``serve_forever()`` on the returned server to handle requests.
+
+    :param path: Path of the Unix socket. An existing socket file is replaced.
+    :param languages: (optional) Languages to load in addition to English,
+        other languages are loaded on the first request that uses them.
+    :raises NotImplementedError: if the platform does not support Unix sockets
+    """
+    server_class = getattr(socketserver, 'ThreadingUnixStreamServer', None)
+    if server_class is None:
+        raise NotImplementedError('Unix sockets are not supported on this platform')
+
+    for language in languages:
+        if language != 'alias':
+            unicode_codes.load_from_json(language)
+    get_search_tree()
+
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+        os.unlink(path)
+    server: socketserver.BaseServer = server_class(path, _RequestHandler)
+    server.daemon_threads = True  # type: ignore
+    return server
+
+
+def serve(path: str, languages: Iterable[str] = ()):
+    """
+    Handle requests on the Unix socket ``path`` until the process is interrupted.
+    See :func:`make_server` for the parameters.
+    """
+    server = make_server(path, languages)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+
+class Client:
+    """
+    Client for the server. The methods raise :class:`ValueError` if the server
+    returns an error.
+
+    :param path: Path of the Unix socket
+    :param timeout: (optional) Timeout in seconds for the socket operations
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        self._socket = socket.socket(getattr(socket, 'AF_UNIX'), socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(path)
+        self._rfile = self._socket.makefile('rb')
+        self._wfile = self._socket.makefile('wb')
+
+    def request(self, op: str, **kwargs: Any) -> Any:
+        """Send a request and return the result, see the module documentation"""
+        _write_frame(self._wfile, {'op': op, **kwargs})
+        response = _read_frame(self._rfile)
+        if response is None:
+            raise EOFError('The server closed the connection')
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['result']
+
+    def emojize(self, string: str, **kwargs: Any) -> str:
+        """:func:`emoji.emojize` on the server"""
+        return self.request('emojize', string=string, **kwargs)
+
+    def demojize(self, string: str, **kwargs: Any) -> str:
+        """:func:`emoji.demojize` on the server"""
+        return self.request('demojize', string=string, **kwargs)
+
+    def analyze(self, string: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        """:func:`emoji.analyze` on the server, see :func:`token_to_dict`"""
+        return self.request('analyze', string=string, **kwargs)
+
+    def ping(self) -> bool:
+        """Returns True if the server answers"""
+        return self.request('ping') == 'pong'
+
+    def close(self):
+        self._rfile.close()
+        self._wfile.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
@@ -6,21 +6,96 @@ Components for detecting and tokenizing emoji in strings.
 
 """
 
-from typing import List, NamedTuple, Dict, Union, Iterator, Any
-from emoji import unicode_codes
+import re
+import time
+from typing import (
+    List,
+    Mapping,
+    NamedTuple,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+    Iterator,
+    Any,
+)
+from emoji import metrics, unicode_codes
+from emoji.unicode_codes import HOOK_EVENTS, register_hook, unregister_hook
 
 
 __all__ = [
+    'EmojiDataView',
     'EmojiMatch',
     'EmojiMatchZWJ',
     'EmojiMatchZWJNonRGI',
     'Token',
     'tokenize',
     'filter_tokens',
+    'split_safe',
+    'tokenize_ids',
+    'may_contain_emoji',
+    'register_hook',
+    'unregister_hook',
+    'HOOK_EVENTS',
 ]
 
 _ZWJ = '\u200d'
 _SEARCH_TREE: Dict[str, Any] = {}
+_EMPTY_DATA: Dict[str, Any] = {}
+_SAFE_CHAR_PATTERN: Optional[Pattern[str]] = None
+_CANDIDATE_PATTERN: Optional[Pattern[str]] = None
+_UTF8_RUN_PATTERN: Optional[Pattern[bytes]] = None
+_JOINED_CHARS: Optional[Set[str]] = None
+
+
+class EmojiDataView(Mapping[str, Any]):
+    """
+    Read-only view of the data from :data:`EMOJI_DATA` for a match with the
+    additional keys ``match_start`` and ``match_end``.
+
+    Unlike :meth:`EmojiMatch.data_copy` no dict is allocated, the view only
+    holds a reference to the entry in :data:`EMOJI_DATA`.
+    Use :meth:`copy` to get a mutable dict.
+    """
+
+    __slots__ = ('_data', 'match_start', 'match_end')
+
+    def __init__(self, data: Union[Dict[str, Any], None], start: int, end: int):
+        self._data = _EMPTY_DATA if data is None else data
+        self.match_start = start
+        self.match_end = end
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'match_start':
+            return self.match_start
+        if key == 'match_end':
+            return self.match_end
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key == 'match_start' or key == 'match_end' or key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        yield 'match_start'
+        yield 'match_end'
+
+    def __len__(self) -> int:
+        return len(self._data) + 2
+
+    def copy(self) -> Dict[str, Any]:
+        """Returns a mutable dict, the same as :meth:`EmojiMatch.data_copy`"""
+        emj_data = self._data.copy()
+        emj_data['match_start'] = self.match_start
+        emj_data['match_end'] = self.match_end
+        return emj_data
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.copy()!r})'
 
 
 class EmojiMatch:
@@ -59,6 +134,14 @@ class EmojiMatch:
         else:
             return {'match_start': self.start, 'match_end': self.end}
 
+    def data_view(self) -> EmojiDataView:
+        """
+        Returns a read-only :class:`EmojiDataView` of the data from
+        :data:`EMOJI_DATA` for this match with the additional keys
+        ``match_start`` and ``match_end``. Cheaper than :meth:`data_copy`.
+        """
+        return EmojiDataView(self.data, self.start, self.end)
+
     def is_zwj(self) -> bool:
         """
         Checks if this is a ZWJ-emoji.
@@ -166,15 +249,36 @@ def tokenize(string: str, keep_zwj: bool) -> Iterator[Token]:
     :return: An iterable of tuples :class:`Token` ``(char, char)`` or :class:`Token` ``(chars, EmojiMatch)``
     """
 
+    if metrics.enabled:
+        return _tokenize_counted(string, keep_zwj)
+    return _tokenize(string, keep_zwj)
+
+
+def _tokenize_counted(string: str, keep_zwj: bool) -> Iterator[Token]:
+    """:func:`tokenize` that counts the calls and the scanned characters"""
+    metrics.count('tokenize.calls')
+    scanned = 0
+    try:
+        for token in _tokenize(string, keep_zwj):
+            scanned += len(token.chars)
+            yield token
+        scanned = len(string)
+    finally:
+        # If the caller stopped early, only the yielded characters are counted
+        metrics.count('tokenize.chars', scanned)
+
+
+def _tokenize(string: str, keep_zwj: bool) -> Iterator[Token]:
+    # Only the tree is used, it is a consistent snapshot even if the data
+    # is replaced by emoji.reload_data() meanwhile
     tree = get_search_tree()
-    EMOJI_DATA = unicode_codes.EMOJI_DATA
     # result: [ Token(oldsubstring0, EmojiMatch), Token(char1, char1), ... ]
     result: List[Token] = []
     i = 0
     length = len(string)
-    ignore: List[
+    ignore: Set[
         int
-    ] = []  # index of chars in string that are skipped, i.e. the ZWJ-char in non-RGI-ZWJ-sequences
+    ] = set()  # index of chars in string that are skipped, i.e. the ZWJ-char in non-RGI-ZWJ-sequences
     while i < length:
         consumed = False
         char = string[i]
@@ -208,14 +312,14 @@ def tokenize(string: str, keep_zwj: bool) -> Iterator[Token]:
         elif (
             char == _ZWJ
             and result
-            and result[-1].chars in EMOJI_DATA
             and i > 0
             and string[i - 1] in tree
+            and _tree_data(tree, result[-1].chars) is not None
         ):
             # the current char is ZWJ and the last match was an emoji
-            ignore.append(i)
+            ignore.add(i)
             if (
-                EMOJI_DATA[result[-1].chars]['status']
+                _tree_data(tree, result[-1].chars)['status']  # type: ignore
                 == unicode_codes.STATUS['component']
             ):
                 # last match was a component, it could be ZWJ+EMOJI+COMPONENT
@@ -246,6 +350,32 @@ def tokenize(string: str, keep_zwj: bool) -> Iterator[Token]:
     yield from result
 
 
+def _tree_data(tree: Dict[str, Any], emj: str) -> Optional[Dict[str, Any]]:
+    """The entry of EMOJI_DATA in the search tree or None if ``emj`` is not
+    an emoji"""
+    for char in emj:
+        tree = tree.get(char)  # type: ignore
+        if tree is None:
+            return None
+    return tree.get('data')
+
+
+def tokenize_ids(string: str) -> Iterator[int]:
+    """
+    Finds unicode emoji in a string and yields the ID of each emoji,
+    see :func:`emoji.emoji_to_id`. Non-RGI ZWJ sequences yield the IDs of
+    the emoji they consist of.
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    :return: An iterable of integers
+    :raises KeyError: if an emoji has no ID
+    """
+    emoji_ids = unicode_codes._get_emoji_ids()[1]  # pyright: ignore [reportPrivateUsage]
+    for token in tokenize(string, keep_zwj=False):
+        if isinstance(token.value, EmojiMatch):
+            yield emoji_ids[token.value.emoji]
+
+
 def filter_tokens(
     matches: Iterator[Token], emoji_only: bool, join_emoji: bool
 ) -> Iterator[Token]:
@@ -315,6 +445,183 @@ def filter_tokens(
     yield from accumulator
 
 
+def _char_class(chars: Iterable[str], negate: bool = False) -> str:
+    """Character class for a regular expression. Consecutive characters are
+    merged into ranges: ``re`` checks a class with characters outside of the
+    BMP one item at a time, most emoji are outside of the BMP."""
+    codes = sorted(set(map(ord, chars)))
+    items: List[str] = []
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        items.append(re.escape(chr(codes[i])))
+        if j > i:
+            items.append('-' + re.escape(chr(codes[j])))
+        i = j + 1
+    return '[%s%s]' % ('^' if negate else '', ''.join(items))
+
+
+def _emoji_chars(emoji_data: Dict[str, Dict[str, Any]]) -> Set[str]:
+    """All characters that occur in emoji, including the ZWJ and the
+    variation selectors. The tokenizer can never match across other characters."""
+    chars = {_ZWJ, '\ufe0e', '\ufe0f'}
+    for emj in emoji_data:
+        chars.update(emj)
+    return chars
+
+
+def _get_safe_char_pattern() -> Pattern[str]:
+    """Regular expression that matches a character that does not occur in any emoji.
+    The tokenizer can never match across such a character."""
+    global _SAFE_CHAR_PATTERN
+    pattern = _SAFE_CHAR_PATTERN
+    if pattern is None:
+        emoji_data = unicode_codes.EMOJI_DATA
+        pattern = re.compile(_char_class(_emoji_chars(emoji_data), negate=True))
+        if emoji_data is unicode_codes.EMOJI_DATA:
+            _SAFE_CHAR_PATTERN = pattern
+    return pattern
+
+
+def _get_utf8_run_pattern() -> Pattern[bytes]:
+    """Regular expression for UTF-8 encoded bytes that matches a run of the
+    characters that occur in emoji. It is an automaton over the bytes: a trie of
+    the UTF-8 encodings of the characters, with the last byte as a class.
+    Tokenizing the decoded runs one by one yields the same emoji as tokenizing the
+    whole decoded string, see :func:`split_safe`."""
+    global _UTF8_RUN_PATTERN
+    run_pattern = _UTF8_RUN_PATTERN
+    if run_pattern is None:
+        emoji_data = unicode_codes.EMOJI_DATA
+        tree: Dict[int, Any] = {}
+        for char in _emoji_chars(emoji_data):
+            node = tree
+            for byte in char.encode('utf-8'):
+                node = node.setdefault(byte, {})
+
+        def alternation(node: Dict[int, Any]) -> str:
+            # UTF-8 is prefix-free: a node has either children or is the last byte
+            last = [byte for byte, child in node.items() if not child]
+            items = [
+                re.escape(chr(byte)) + alternation(child)
+                for byte, child in sorted(node.items())
+                if child
+            ]
+            if last:
+                items.append(_char_class(map(chr, last)))
+            return items[0] if len(items) == 1 else '(?:%s)' % '|'.join(items)
+
+        # The lookahead for the first byte lets ``re`` skip other bytes faster.
+        # Bytes are written as the Latin-1 characters with the same code.
+        first = _char_class(map(chr, tree))
+        pattern = '(?=%s)(?:%s)+' % (first, alternation(tree))
+        run_pattern = re.compile(pattern.encode('latin-1'))
+        if emoji_data is unicode_codes.EMOJI_DATA:
+            _UTF8_RUN_PATTERN = run_pattern
+    return run_pattern
+
+
+def _get_joined_chars() -> Set[str]:
+    """Returns the pairs of characters that are adjacent in an emoji and the
+    characters that the tokenizer handles together with the token in front of
+    them: the ZWJ, the variation selectors and the first characters of components.
+    A string of emoji characters can be split in front of ``string[i]`` if neither
+    ``string[i - 1 : i + 1]`` nor ``string[i]`` is in the set. Tokenizing the
+    pieces one by one yields the same tokens as tokenizing the whole string."""
+    global _JOINED_CHARS
+    chars = _JOINED_CHARS
+    if chars is None:
+        emoji_data = unicode_codes.EMOJI_DATA
+        component = unicode_codes.STATUS['component']
+        chars = {_ZWJ, '\ufe0e', '\ufe0f'}
+        for emj, data in emoji_data.items():
+            if data['status'] == component:
+                chars.add(emj[0])
+            chars.update(emj[i : i + 2] for i in range(len(emj) - 1))
+        if emoji_data is unicode_codes.EMOJI_DATA:
+            _JOINED_CHARS = chars
+    return chars
+
+
+def _get_candidate_pattern() -> Pattern[str]:
+    """Regular expression that matches where an emoji could start: the first
+    character of an emoji that is an emoji on its own, or the first character
+    followed by a possible second character. Also matches the variation selectors,
+    because the tokenizer removes them."""
+    global _CANDIDATE_PATTERN
+    pattern = _CANDIDATE_PATTERN
+    if pattern is None:
+        emoji_data = unicode_codes.EMOJI_DATA
+        singles = {'\ufe0e', '\ufe0f'}
+        seconds: Dict[str, Set[str]] = {}
+        for emj in emoji_data:
+            if len(emj) == 1:
+                singles.add(emj)
+            else:
+                seconds.setdefault(emj[0], set()).add(emj[1])
+
+        # Group the first characters by their possible second characters
+        groups: Dict[FrozenSet[str], Set[str]] = {}
+        for first, chars in seconds.items():
+            if first not in singles:
+                groups.setdefault(frozenset(chars), set()).add(first)
+
+        alternatives = [_char_class(singles)]
+        alternatives.extend(
+            _char_class(firsts) + _char_class(chars) for chars, firsts in groups.items()
+        )
+        pattern = re.compile('|'.join(alternatives))
+        if emoji_data is unicode_codes.EMOJI_DATA:
+            _CANDIDATE_PATTERN = pattern
+    return pattern
+
+
+def may_contain_emoji(string: str) -> bool:
+    """
+    Fast check with a regular expression before tokenizing a string.
+    Returns ``False`` if :func:`tokenize` would yield all characters of the string
+    unchanged and no emoji, i.e. if :func:`emoji.demojize` would return the
+    string as it is. ``True`` means that the string should be tokenized.
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    """
+
+    return _get_candidate_pattern().search(string) is not None
+
+
+def split_safe(string: str, size: int) -> Iterator[str]:
+    """
+    Splits a string into pieces of at least ``size`` characters (except the last one).
+    The string is only split in front of a character that does not occur
+    in any emoji, so the split never falls inside an emoji or a ZWJ-sequence.
+    Tokenizing the pieces one by one yields the same tokens as tokenizing the
+    whole string (with the indices relative to the pieces).
+
+    If there is no such character, the string is not split at all.
+
+    :param string: String contains unicode characters. MUST BE UNICODE.
+    :param size: Minimum size of the pieces
+    :return: An iterable of the pieces, ``''.join(pieces) == string``
+    """
+
+    if size < 1:
+        raise ValueError('size must be at least 1')
+
+    pattern = _get_safe_char_pattern()
+    length = len(string)
+    start = 0
+    while length - start > size:
+        match = pattern.search(string, start + size)
+        if match is None:
+            break
+        yield string[start : match.start()]
+        start = match.start()
+    if start < length or length == 0:
+        yield string[start:]
+
+
 def get_search_tree() -> Dict[str, Any]:
     """
     Generate a search tree for demojize().
@@ -363,14 +670,92 @@ def get_search_tree() -> Dict[str, Any]:
 
 
     """
+    global _SEARCH_TREE
+    tree = _SEARCH_TREE
+    if not tree:
+        start = time.perf_counter()
+        emoji_data = unicode_codes.EMOJI_DATA
+        # Other threads only see the complete tree
+        tree = _build_search_tree(emoji_data)
+        if emoji_data is unicode_codes.EMOJI_DATA:  # Not replaced meanwhile
+            _SEARCH_TREE = tree
+        duration = time.perf_counter() - start
+        metrics.timing('get_search_tree', duration)
+        unicode_codes._fire(  # pyright: ignore [reportPrivateUsage]
+            'search_tree_built', duration=duration
+        )
+    return tree
+
+
+def _build_search_tree(emoji_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for emj, data in emoji_data.items():
+        sub_tree = tree
+        lastidx = len(emj) - 1
+        for i, char in enumerate(emj):
+            if char not in sub_tree:
+                sub_tree[char] = {}
+            sub_tree = sub_tree[char]
+            if i == lastidx:
+                sub_tree['data'] = data
+    return tree
+
+
+def _read_search_tree(emoji_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the search tree for new data if it was built for the current data,
+    otherwise it is built when it is needed, see :func:`_replace_search_tree`"""
     if not _SEARCH_TREE:
-        for emj in unicode_codes.EMOJI_DATA:
-            sub_tree = _SEARCH_TREE
-            lastidx = len(emj) - 1
-            for i, char in enumerate(emj):
-                if char not in sub_tree:
-                    sub_tree[char] = {}
-                sub_tree = sub_tree[char]
-                if i == lastidx:
-                    sub_tree['data'] = unicode_codes.EMOJI_DATA[emj]
-    return _SEARCH_TREE
+        return {}
+    return _build_search_tree(emoji_data)
+
+
+def _replace_search_tree(tree: Dict[str, Any]):
+    """Replace the search tree with a tree from :func:`_read_search_tree` and
+    reset the regular expressions, they are built again from the new data"""
+    global _SEARCH_TREE, _SAFE_CHAR_PATTERN, _CANDIDATE_PATTERN, _UTF8_RUN_PATTERN
+    global _JOINED_CHARS
+    _SEARCH_TREE = tree
+    _SAFE_CHAR_PATTERN = None
+    _CANDIDATE_PATTERN = None
+    _UTF8_RUN_PATTERN = None
+    _JOINED_CHARS = None
+
+
+def _add_to_search_tree(emj: str, data: Dict[str, Any]):
+    """Insert a new or replaced entry of :data:`EMOJI_DATA` into the search tree
+    and reset the regular expressions that do not cover it yet. The search tree
+    and the regular expressions are only updated if they were built."""
+    global _SAFE_CHAR_PATTERN, _CANDIDATE_PATTERN, _UTF8_RUN_PATTERN, _JOINED_CHARS
+    if _SEARCH_TREE:
+        sub_tree = _SEARCH_TREE
+        for char in emj:
+            sub_tree = sub_tree.setdefault(char, {})
+        sub_tree['data'] = data
+
+    if _SAFE_CHAR_PATTERN is not None and _SAFE_CHAR_PATTERN.search(emj):
+        _SAFE_CHAR_PATTERN = None
+    if _CANDIDATE_PATTERN is not None and not _CANDIDATE_PATTERN.match(emj):
+        _CANDIDATE_PATTERN = None
+    if _UTF8_RUN_PATTERN is not None and not _UTF8_RUN_PATTERN.fullmatch(
+        emj.encode('utf-8')
+    ):
+        _UTF8_RUN_PATTERN = None
+    _JOINED_CHARS = None
+
+
+def _remove_from_search_tree(emj: str):
+    """Remove an entry from the search tree, if it was built. The regular
+    expressions still match the characters of the entry, which is allowed."""
+    if not _SEARCH_TREE:
+        return
+    path: List[Tuple[Dict[str, Any], str]] = []
+    sub_tree = _SEARCH_TREE
+    for char in emj:
+        path.append((sub_tree, char))
+        sub_tree = sub_tree[char]
+    del sub_tree['data']
+    # Remove the nodes that are not needed by other emoji anymore
+    for parent, char in reversed(path):
+        if parent[char]:
+            break
+        del parent[char]
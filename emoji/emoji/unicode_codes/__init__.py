@@ -1,16 +1,37 @@
+import os
 import sys
+import collections
+import functools
 import importlib.resources
 import json
-from functools import lru_cache
+import threading
+import time
 from warnings import warn
 
-from typing import Any, BinaryIO, Dict, List, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from emoji import metrics
 from emoji.unicode_codes.data_dict import STATUS, LANGUAGES
 
 __all__ = [
     'get_emoji_by_name',
     'load_from_json',
+    'emoji_to_id',
+    'id_to_emoji',
+    'register_hook',
+    'unregister_hook',
+    'HOOK_EVENTS',
     'EMOJI_DATA',
     'STATUS',
     'LANGUAGES',
@@ -23,7 +44,166 @@ _loaded_keys: List[str] = list(
 )  # Keep track of keys already loaded from json files to avoid loading them twice
 
 
-@lru_cache(maxsize=4000)
+HOOK_EVENTS = (
+    'language_loaded',
+    'search_tree_built',
+    'name_index_built',
+    'emoji_added',
+    'emoji_removed',
+    'data_reloaded',
+)
+"""Events that can be passed to :func:`register_hook`"""
+
+_hooks: Dict[str, List[Callable[[str, Dict[str, Any]], None]]] = {
+    event: [] for event in HOOK_EVENTS
+}
+
+_name_index: Dict[str, Dict[str, str]] = {}  # Emoji by name for each language
+
+_emoji_ids: Optional[Tuple[List[str], Dict[str, int]]] = None  # Loaded on first use
+
+# A package name or a directory, the JSON files are read from here
+_DataSource = Union[str, 'os.PathLike[str]']
+_data_source: _DataSource = 'emoji.unicode_codes'
+
+# Serializes the changes of EMOJI_DATA, see emoji.registry. Reentrant because
+# adding an entry may load a language.
+_write_lock = threading.RLock()
+
+
+def register_hook(event: str, callback: Callable[[str, Dict[str, Any]], None]):
+    """
+    Register a callback that is called after a lazy initialization or a change
+    of the emoji data. The callback is called as ``callback(event, info)`` where
+    ``info`` is a dict with the ``'duration'`` in seconds and, depending on the
+    event, the ``'language'``, the ``'emoji'`` or the ``'source'``.
+
+    Events:
+
+    - ``'language_loaded'``: a language was loaded into :data:`EMOJI_DATA`
+    - ``'search_tree_built'``: the search tree of the tokenizer was built
+    - ``'name_index_built'``: the index of :func:`get_emoji_by_name` for a language was built
+    - ``'emoji_added'``: an emoji was added or replaced with :func:`emoji.add_emoji`
+    - ``'emoji_removed'``: an emoji was removed with :func:`emoji.remove_emoji`
+    - ``'data_reloaded'``: the data was replaced with :func:`emoji.reload_data`
+
+    Exceptions in the callback are turned into a :class:`RuntimeWarning`.
+
+    :param event: One of :data:`HOOK_EVENTS`
+    :param callback: A callable ``callback(event: str, info: dict)``
+    :raises ValueError: if the event is unknown
+    """
+    if event not in _hooks:
+        raise ValueError('Unknown event', event)
+    _hooks[event].append(callback)
+
+
+def unregister_hook(event: str, callback: Callable[[str, Dict[str, Any]], None]):
+    """Remove a callback that was registered with :func:`register_hook`
+
+    :raises ValueError: if the callback is not registered for the event"""
+    if event not in _hooks:
+        raise ValueError('Unknown event', event)
+    _hooks[event].remove(callback)
+
+
+def _fire(event: str, **info: Any):
+    """Call the hooks of ``event``"""
+    for callback in _hooks[event]:
+        try:
+            callback(event, info)
+        except Exception as e:
+            warn(f'Exception in emoji hook {callback!r}: {e!r}', RuntimeWarning)
+
+
+def _build_name_index(
+    emoji_data: Dict[str, Dict[str, Any]], language: str
+) -> Dict[str, str]:
+    index: Dict[str, str] = {}
+    fully_qualified = STATUS['fully_qualified']
+    for emj, data in emoji_data.items():
+        if data['status'] > fully_qualified:
+            continue
+        if language == 'alias':
+            for alias in data.get('alias', []):
+                index.setdefault(alias, emj)
+        elif language in data:
+            index.setdefault(data[language], emj)
+    return index
+
+
+def _get_name_index(language: str) -> Dict[str, str]:
+    """Returns a dict of all names (or aliases) of fully qualified and component
+    emoji in a language. If a name is used for multiple emoji, the first one wins."""
+    index = _name_index.get(language)
+    if index is None:
+        start = time.perf_counter()
+        emoji_data = EMOJI_DATA
+        index = _build_name_index(emoji_data, language)
+        if emoji_data is EMOJI_DATA:  # Not replaced by reload_data() meanwhile
+            _name_index[language] = index
+        duration = time.perf_counter() - start
+        metrics.timing('name_index', duration)
+        _fire('name_index_built', language=language, duration=duration)
+    return index
+
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _NameCache:
+    """LRU cache of :func:`get_emoji_by_name` with the interface of
+    :func:`functools.lru_cache`. A result that was looked up before
+    :meth:`cache_clear` is not stored, so after a change of the data the cache
+    does not return a result of the old data. The data must be changed before
+    :meth:`cache_clear` is called."""
+
+    def __init__(self, func: Callable[[str, str], Optional[str]], maxsize: int):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0  # Incremented by cache_clear()
+        self._results: 'collections.OrderedDict[Tuple[str, str], Optional[str]]' = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __call__(self, name: str, language: str) -> Optional[str]:
+        key = (name, language)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+            generation = self._generation
+        result = self._func(name, language)
+        with self._lock:
+            self.misses += 1
+            if generation == self._generation:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        return result
+
+    def cache_info(self) -> _CacheInfo:
+        with self._lock:
+            return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def cache_clear(self):
+        with self._lock:
+            self._generation += 1
+            self.hits = 0
+            self.misses = 0
+            self._results.clear()
+
+
+@functools.partial(_NameCache, maxsize=4000)
 def get_emoji_by_name(name: str, language: str) -> Optional[str]:
     """
     Find emoji by short-name in a specific language.
@@ -33,18 +213,192 @@ def get_emoji_by_name(name: str, language: str) -> Optional[str]:
     :param language: language-code e.g. 'es', 'de', etc. or 'alias'
     """
 
-    fully_qualified = STATUS['fully_qualified']
-
     if language == 'alias':
-        for emj, data in EMOJI_DATA.items():
-            if name in data.get('alias', []) and data['status'] <= fully_qualified:
-                return emj
+        emj = _get_name_index('alias').get(name)
+        if emj is not None:
+            return emj
         language = 'en'
 
-    for emj, data in EMOJI_DATA.items():
-        if data.get(language) == name and data['status'] <= fully_qualified:
-            return emj
+    return _get_name_index(language).get(name)
+
+
+metrics.register_cache('get_emoji_by_name', lambda: get_emoji_by_name.cache_info())
+
+
+def _names(data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """The names of an entry of EMOJI_DATA in each language that has an index,
+    see :func:`_get_name_index`. Entries that are not indexed have no names."""
+    if data['status'] > STATUS['fully_qualified']:
+        return {}
+    names = {
+        language: [name]
+        for language, name in data.items()
+        if language in LANGUAGES and isinstance(name, str)
+    }
+    if data.get('alias'):
+        names['alias'] = list(data['alias'])
+    return names
 
+
+def _add_names(emj: str, data: Dict[str, Any]):
+    """Add the names of a new entry to the indexes that were built"""
+    for language, names in _names(data).items():
+        index = _name_index.get(language)
+        if index is not None:
+            for name in names:
+                index.setdefault(name, emj)
+    get_emoji_by_name.cache_clear()
+
+
+def _remove_names(emj: str, data: Dict[str, Any]):
+    """Remove the names of an entry from the indexes that were built"""
+    for language, names in _names(data).items():
+        index = _name_index.get(language)
+        if index is not None:
+            for name in names:
+                if index.get(name) == emj:
+                    del index[name]
+    get_emoji_by_name.cache_clear()
+
+
+def _add_entry(emj: str, entry: Dict[str, Any]):
+    """Add or replace an entry of EMOJI_DATA and update the name indexes and the
+    IDs that were built. The caller holds ``_write_lock``.
+
+    :raises ValueError: if a name is already used by another emoji
+    """
+    for language, names in _names(entry).items():
+        if language not in ('en', 'alias'):
+            # The names must be compared to all names of the language
+            load_from_json(language)
+        index = _get_name_index(language)
+        for name in names:
+            other = index.get(name)
+            if other is not None and other != emj:
+                raise ValueError('Name is already used', name, other)
+
+    old = EMOJI_DATA.get(emj)
+    if old is not None:
+        _remove_names(emj, old)
+    EMOJI_DATA[emj] = entry
+    _add_names(emj, entry)
+    _add_emoji_id(emj)
+
+
+def _remove_entry(emj: str):
+    """Remove an entry of EMOJI_DATA and its names. The ID is kept.
+    The caller holds ``_write_lock``.
+
+    :raises KeyError: if the emoji is not in EMOJI_DATA
+    """
+    _remove_names(emj, EMOJI_DATA.pop(emj))
+
+
+class _Data(NamedTuple):
+    """The data of a source and the indexes built from it, see :func:`_read_source`"""
+
+    source: _DataSource
+    emoji_data: Dict[str, Dict[str, Any]]
+    name_index: Dict[str, Dict[str, str]]
+    emoji_ids: Optional[Tuple[List[str], Dict[str, int]]]
+
+
+def _read_source(source: _DataSource) -> _Data:
+    """Read the data of ``source`` with the languages that are loaded and build
+    the indexes that were built for the current data. Nothing is replaced yet,
+    see :func:`_replace_data`."""
+    languages = [key for key in _loaded_keys if key in LANGUAGES and key != 'en']
+    emoji_data = _read_data(source, languages)
+    emoji_ids = None
+    if _emoji_ids is not None:
+        emoji_ids = _read_emoji_ids(emoji_data, source)
+    name_index = {
+        language: _build_name_index(emoji_data, language) for language in _name_index
+    }
+    return _Data(source, emoji_data, name_index, emoji_ids)
+
+
+def _replace_data(data: _Data):
+    """Replace EMOJI_DATA and the indexes with the data from :func:`_read_source`.
+    The caller holds ``_write_lock``."""
+    global EMOJI_DATA, _data_source, _name_index, _emoji_ids
+    _data_source = data.source
+    EMOJI_DATA = data.emoji_data
+    _name_index = data.name_index
+    _emoji_ids = data.emoji_ids
+    get_emoji_by_name.cache_clear()
+
+
+def _get_emoji_ids() -> Tuple[List[str], Dict[str, int]]:
+    """Returns the list of emoji by ID and the dict of IDs by emoji"""
+    global _emoji_ids
+    emoji_ids = _emoji_ids
+    if emoji_ids is None:
+        start = time.perf_counter()
+        emoji_data = EMOJI_DATA
+        emoji_ids = _read_emoji_ids(emoji_data, _data_source)
+        if emoji_data is EMOJI_DATA:  # Not replaced by reload_data() meanwhile
+            _emoji_ids = emoji_ids
+        metrics.timing('load_emoji_ids', time.perf_counter() - start)
+    return emoji_ids
+
+
+def _read_emoji_ids(
+    emoji_data: Dict[str, Dict[str, Any]], source: _DataSource
+) -> Tuple[List[str], Dict[str, int]]:
+    with _open_file('emoji_ids.json', source) as f:
+        ids: List[str] = json.load(f)
+    # Share the strings with EMOJI_DATA
+    keys = {emj: emj for emj in emoji_data}
+    id_list = [keys.get(emj, emj) for emj in ids]
+    id_dict = {emj: i for i, emj in enumerate(id_list)}
+    # Emoji that were added with emoji.add_emoji()
+    for emj in emoji_data:
+        if emj not in id_dict:
+            _add_emoji_id(emj, (id_list, id_dict))
+    return id_list, id_dict
+
+
+def _add_emoji_id(
+    emj: str, emoji_ids: Optional[Tuple[List[str], Dict[str, int]]] = None
+):
+    """Assign the next free ID to an emoji that has no ID yet"""
+    if emoji_ids is None:
+        emoji_ids = _emoji_ids
+    if emoji_ids is not None and emj not in emoji_ids[1]:
+        id_list, id_dict = emoji_ids
+        id_dict[emj] = len(id_list)
+        id_list.append(emj)
+
+
+def emoji_to_id(emoji: str) -> Optional[int]:
+    """
+    Returns the ID of an emoji, a small non-negative integer, or None if the
+    emoji has no ID. The IDs are stored in the file ``emoji_ids.json`` and are
+    stable across releases: the ID of an emoji never changes and is never reused.
+    Emoji that were added with :func:`emoji.add_emoji` get the next free IDs in
+    the order in which they were added, their IDs are only valid in this process.
+        >>> emoji.emoji_to_id('🥇')
+        0
+        >>> emoji.id_to_emoji(0)
+        '🥇'
+
+    :param emoji: An emoji, a key of :data:`EMOJI_DATA`
+    """
+    return _get_emoji_ids()[1].get(emoji)
+
+
+def id_to_emoji(emoji_id: int) -> Optional[str]:
+    """
+    Returns the emoji with the ID ``emoji_id`` or None if the ID is unknown,
+    see :func:`emoji_to_id`. Emoji that were removed from the Unicode standard
+    keep their ID, so the result is not always in :data:`EMOJI_DATA`.
+
+    :param emoji_id: An ID returned by :func:`emoji_to_id`
+    """
+    id_list = _get_emoji_ids()[0]
+    if 0 <= emoji_id < len(id_list):
+        return id_list[emoji_id]
     return None
 
 
@@ -76,20 +430,49 @@ Accessing EMOJI_DATA[emj]['{key}'] without loading the language is deprecated.""
 EMOJI_DATA: Dict[str, Dict[str, Any]]
 
 
-def _open_file(name: str) -> BinaryIO:
+def _open_file(name: str, source: Optional[_DataSource] = None) -> BinaryIO:
+    """Open a JSON file of ``source``, a package name or a directory
+    (default: the current source, see :func:`emoji.reload_data`)"""
+    if source is None:
+        source = _data_source
+    if not isinstance(source, str):
+        return open(os.path.join(source, name), 'rb')
     if sys.version_info >= (3, 9):
-        return importlib.resources.files('emoji.unicode_codes').joinpath(name).open('rb')
+        return importlib.resources.files(source).joinpath(name).open('rb')
     else:
-        return importlib.resources.open_binary('emoji.unicode_codes', name)
+        return importlib.resources.open_binary(source, name)
+
+
+def _read_data(
+    source: _DataSource, languages: Iterable[str] = ()
+) -> Dict[str, Dict[str, Any]]:
+    """Read a new EMOJI_DATA from emoji.json and the files of the ``languages``"""
+    with _open_file('emoji.json', source) as f:
+        emoji_data = dict(json.load(f, object_pairs_hook=EmojiDataDict))  # type: ignore
+    for key in languages:
+        _read_language(emoji_data, key, source)
+    return emoji_data  # type: ignore
+
+
+def _read_language(
+    emoji_data: Dict[str, Dict[str, Any]], key: str, source: _DataSource
+):
+    with _open_file(f'emoji_{key}.json', source) as f:
+        for emj, value in json.load(f).items():
+            emoji_data[emj][key] = value
 
 
 def _load_default_from_json():
     global EMOJI_DATA
     global _loaded_keys
 
-    with _open_file('emoji.json') as f:
-        EMOJI_DATA = dict(json.load(f, object_pairs_hook=EmojiDataDict))  # type: ignore
+    start = time.perf_counter()
+    EMOJI_DATA = _read_data(_data_source)
     _loaded_keys = list(_DEFAULT_KEYS)
+    _name_index.clear()
+    duration = time.perf_counter() - start
+    metrics.timing('load_from_json', duration)
+    _fire('language_loaded', language='en', duration=duration)
 
 
 def load_from_json(key: str):
@@ -101,11 +484,17 @@ def load_from_json(key: str):
     if key not in LANGUAGES:
         raise NotImplementedError('Language not supported', key)
 
-    with _open_file(f'emoji_{key}.json') as f:
-        for emj, value in json.load(f).items():
-            EMOJI_DATA[emj][key] = value  # type: ignore
+    start = time.perf_counter()
+    with _write_lock:
+        if key in _loaded_keys:  # Loaded by another thread meanwhile
+            return
+        _read_language(EMOJI_DATA, key, _data_source)
 
-    _loaded_keys.append(key)
+        _loaded_keys.append(key)
+        _name_index.pop(key, None)
+    duration = time.perf_counter() - start
+    metrics.timing('load_from_json', duration)
+    _fire('language_loaded', language=key, duration=duration)
 
 
 _load_default_from_json()
@@ -0,0 +1,226 @@
+"""
+emoji.utf8
+~~~~~~~~~~
+
+Find and replace emoji in UTF-8 encoded bytes. The offsets are byte offsets::
+
+    >>> emoji.emoji_list_bytes('Café ☕'.encode('utf-8'))
+    [{'match_start': 6, 'match_end': 9, 'emoji': '☕'}]
+
+The bytes are scanned with a regular expression that matches runs of the
+characters that occur in emoji. Only these runs are decoded and tokenized,
+all other bytes are not decoded at all. Other bytes do not have to be valid
+UTF-8, they are skipped or copied unchanged.
+
+"""
+
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from emoji.core import (
+    _DEFAULT_DELIMITER,  # pyright: ignore [reportPrivateUsage]
+    _EmojiListReturn,  # pyright: ignore [reportPrivateUsage]
+    demojize,
+)
+from emoji.tokenizer import (
+    EmojiMatch,
+    _get_joined_chars,  # pyright: ignore [reportPrivateUsage]
+    _get_utf8_run_pattern,  # pyright: ignore [reportPrivateUsage]
+    may_contain_emoji,
+    tokenize,
+)
+
+__all__ = [
+    'emoji_list_bytes',
+    'demojize_bytes',
+    'emoji_list_stream',
+    'demojize_stream',
+]
+
+_MAX_CHAR_SIZE = 4  # Maximum length of a UTF-8 encoded character
+
+# A piece of the input: offset in the stream, bytes, True if it is a run of
+# characters that occur in emoji
+_Piece = Tuple[int, bytes, bool]
+
+
+def _split_point(run: str, joined: Set[str]) -> int:
+    """The last index where ``run`` can be split without changing the tokens,
+    see :func:`emoji.tokenizer._get_joined_chars`, or 0"""
+    for i in range(len(run) - 1, 0, -1):
+        if run[i] not in joined and run[i - 1 : i + 1] not in joined:
+            return i
+    return 0
+
+
+def _split_runs(chunks: Iterable[bytes]) -> Iterator[List[_Piece]]:
+    """Split a stream of bytes into runs and the bytes between them. Yields the
+    pieces of each chunk. A run at the end of a chunk could continue in the next
+    chunk, only its end that could be joined with the next characters is kept
+    back until the next chunk arrives. This is usually the last character, but
+    a run where all adjacent characters could be joined is kept back completely,
+    e.g. emoji joined with ZWJ."""
+    pattern = _get_utf8_run_pattern()
+    joined = _get_joined_chars()
+    buffer = b''
+    offset = 0  # Offset of buffer in the stream
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buffer += chunk or b''
+        # A run that ends near the end could be continued by the next character,
+        # which may be incomplete
+        limit = len(buffer) if final else len(buffer) - _MAX_CHAR_SIZE + 1
+        pieces: List[_Piece] = []
+        pos = 0
+        cut = None
+        for match in pattern.finditer(buffer):
+            start, end = match.span()
+            if not final and end >= limit:
+                run = match.group().decode('utf-8')
+                end = start + len(run[: _split_point(run, joined)].encode('utf-8'))
+                cut = end
+            if start > pos:
+                pieces.append((offset + pos, buffer[pos:start], False))
+            if end > start:
+                pieces.append((offset + start, buffer[start:end], True))
+            pos = end
+            if cut is not None:
+                break
+        if cut is None:
+            cut = max(pos, limit)
+        if cut > pos:
+            pieces.append((offset + pos, buffer[pos:cut], False))
+        if pieces:
+            yield pieces
+        buffer = buffer[cut:]
+        offset += cut
+
+
+def _emoji_in_runs(pieces: List[_Piece]) -> Iterator[_EmojiListReturn]:
+    for offset, piece, is_run in pieces:
+        if not is_run:
+            continue
+        run = piece.decode('utf-8')
+        if not may_contain_emoji(run):
+            continue
+        # Translate the character offsets in the run to byte offsets
+        pos = 0
+        byte_pos = offset
+        for token in tokenize(run, keep_zwj=False):
+            if not isinstance(token.value, EmojiMatch):
+                continue
+            match = token.value
+            byte_pos += len(run[pos : match.start].encode('utf-8'))
+            start = byte_pos
+            byte_pos += len(match.emoji.encode('utf-8'))
+            pos = match.end
+            yield {'match_start': start, 'match_end': byte_pos, 'emoji': match.emoji}
+
+
+def emoji_list_bytes(data: bytes) -> List[_EmojiListReturn]:
+    """
+    Returns the location and emoji in UTF-8 encoded bytes in list of dict format,
+    the same as :func:`emoji.emoji_list()` but with byte offsets.
+        >>> emoji.emoji_list_bytes('Hi, I am fine. 😁'.encode('utf-8'))
+        [{'match_start': 15, 'match_end': 19, 'emoji': '😁'}]
+
+    :param data: UTF-8 encoded bytes
+    """
+
+    return [item for pieces in _split_runs([data]) for item in _emoji_in_runs(pieces)]
+
+
+def emoji_list_stream(chunks: Iterable[bytes]) -> Iterator[_EmojiListReturn]:
+    """
+    Yields the location and emoji in a stream of UTF-8 encoded bytes, see
+    :func:`emoji_list_bytes`. The offsets are relative to the start of the stream.
+    The chunks can be split anywhere, even inside of a character or an emoji.
+
+    :param chunks: An iterable of bytes, it is consumed lazily
+    """
+
+    for pieces in _split_runs(chunks):
+        yield from _emoji_in_runs(pieces)
+
+
+def demojize_stream(
+    chunks: Iterable[bytes],
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
+) -> Iterator[bytes]:
+    """
+    Apply :func:`demojize_bytes` to a stream of UTF-8 encoded bytes. The chunks
+    can be split anywhere, ``b''.join()`` of the yielded bytes is the same as
+    ``demojize_bytes(b''.join(chunks), ...)``.
+
+    :param chunks: An iterable of bytes, it is consumed lazily
+    :param delimiters: (optional) See :func:`emoji.demojize()`
+    :param language: (optional) See :func:`emoji.demojize()`
+    :param version: (optional) See :func:`emoji.demojize()`
+    :param handle_version: (optional) See :func:`emoji.demojize()`. The
+        ``match_start`` and ``match_end`` values in the data dict are character
+        offsets relative to the decoded run or to a piece of a long run.
+    :param keep_zwj: (optional) See :func:`emoji.demojize()`
+    """
+
+    kwargs: Dict[str, Any] = {
+        'delimiters': delimiters,
+        'language': language,
+        'version': version,
+        'handle_version': handle_version,
+        'keep_zwj': keep_zwj,
+    }
+    for pieces in _split_runs(chunks):
+        result: List[bytes] = []
+        for _, piece, is_run in pieces:
+            if is_run:
+                run = piece.decode('utf-8')
+                if may_contain_emoji(run):
+                    piece = demojize(run, **kwargs).encode('utf-8')
+            result.append(piece)
+        yield b''.join(result)
+
+
+def demojize_bytes(
+    data: bytes,
+    delimiters: Tuple[str, str] = (_DEFAULT_DELIMITER, _DEFAULT_DELIMITER),
+    language: str = 'en',
+    version: Optional[float] = None,
+    handle_version: Optional[Union[str, Callable[[str, Dict[str, str]], str]]] = None,
+    keep_zwj: Optional[bool] = None,
+) -> bytes:
+    """
+    Replace Unicode emoji in UTF-8 encoded bytes with emoji shortcodes. The result
+    is the same as ``emoji.demojize(data.decode('utf-8'), ...).encode('utf-8')``.
+        >>> emoji.demojize_bytes('Python is fun 👍'.encode('utf-8'))
+        b'Python is fun :thumbs_up:'
+
+    See :func:`demojize_stream` for the parameters.
+
+    :param data: UTF-8 encoded bytes
+    """
+
+    return b''.join(
+        demojize_stream(
+            [data],
+            delimiters=delimiters,
+            language=language,
+            version=version,
+            handle_version=handle_version,
+            keep_zwj=keep_zwj,
+        )
+    )
@@ -1,4 +1,6 @@
+from types import ModuleType
 from typing import List
+import importlib
 import random
 import functools
 
@@ -14,6 +16,13 @@ def pytest_sessionstart():
     )
 
 
+@pytest.fixture
+def emoji_module() -> ModuleType:
+    """The emoji package that is imported now. test_json.py imports it again, the
+    functions of an older module object cannot be pickled for a process pool."""
+    return importlib.import_module('emoji')
+
+
 def pytest_addoption(parser: pytest.Parser):
     parser.addoption(
         '--shuffle',
@@ -22,6 +31,33 @@ def pytest_addoption(parser: pytest.Parser):
         default=False,
         help='Run tests in random order',
     )
+    parser.addoption(
+        '--perf',
+        dest='perf',
+        action='store_true',
+        default=False,
+        help='Run the performance tests that are marked with "perf"',
+    )
+    parser.addoption(
+        '--perf-update-baseline',
+        dest='perf_update_baseline',
+        action='store_true',
+        default=False,
+        help='Write the timings of the performance tests to the baseline file',
+    )
+    parser.addoption(
+        '--perf-tolerance',
+        dest='perf_tolerance',
+        type=float,
+        default=3.0,
+        help='Allowed slowdown factor compared to the baseline',
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        'markers', 'perf: performance regression test, only runs with --perf'
+    )
 
 
 def pytest_collection_modifyitems(session: pytest.Session, items: List[pytest.Item]):
@@ -29,3 +65,9 @@ def pytest_collection_modifyitems(session: pytest.Session, items: List[pytest.It
         print('')
         print('Shuffling items for a random test order')
         random.shuffle(items)
+
+    if not session.config.getoption('perf'):
+        skip_perf = pytest.mark.skip(reason='Performance test, use --perf to run it')
+        for item in items:
+            if 'perf' in item.keywords:
+                item.add_marker(skip_perf)
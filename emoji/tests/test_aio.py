@@ -0,0 +1,85 @@
+"""Unittests for emoji.aio"""
+
+import asyncio
+import concurrent.futures
+from typing import Any, List
+
+import emoji
+import emoji.aio
+
+
+class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls: List[Any] = []
+
+    def submit(self, *args: Any, **kwargs: Any):  # type: ignore
+        self.calls.append(args[0])
+        return super().submit(*args, **kwargs)
+
+
+def test_async_inline_and_executor():
+    short = 'Python is fun 👍'
+    long = short * 100
+
+    async def main():
+        with RecordingExecutor() as executor:
+            assert await emoji.aio.demojize_async(
+                short, executor=executor
+            ) == emoji.demojize(short)
+            assert executor.calls == []
+
+            result = await emoji.aio.demojize_async(
+                long, language='alias', executor=executor, inline_threshold=100
+            )
+            assert result == emoji.demojize(long, language='alias')
+            assert len(executor.calls) == 1
+
+            demojized = emoji.demojize(long)
+            result = await emoji.aio.emojize_async(
+                demojized, executor=executor, inline_threshold=100
+            )
+            assert result == long
+
+            result = await emoji.aio.replace_emoji_async(
+                long, 'X', executor=executor, inline_threshold=100
+            )
+            assert result == emoji.replace_emoji(long, 'X')
+
+            result = await emoji.aio.emoji_list_async(
+                long, executor=executor, inline_threshold=100
+            )
+            assert result == emoji.emoji_list(long)
+            assert len(executor.calls) == 4
+
+    asyncio.run(main())
+
+
+def test_async_set_executor():
+    async def main():
+        with RecordingExecutor() as executor:
+            emoji.aio.set_executor(executor)
+            try:
+                text = '👍' * (emoji.aio.INLINE_THRESHOLD + 1)
+                assert await emoji.aio.demojize_async(text) == emoji.demojize(text)
+                assert len(executor.calls) == 1
+            finally:
+                emoji.aio.set_executor(None)
+
+        # Default executor of the event loop
+        text = '👍' * (emoji.aio.INLINE_THRESHOLD + 1)
+        assert await emoji.aio.demojize_async(text) == emoji.demojize(text)
+
+    asyncio.run(main())
+
+
+def test_async_config_override():
+    family = '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb'
+
+    async def main():
+        with emoji.config.override(demojize_keep_zwj=False):
+            # The executor uses the configuration of the calling task
+            result = await emoji.aio.demojize_async(family, inline_threshold=0)
+        assert result == emoji.demojize(family, keep_zwj=False)
+
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""Unittests for emoji.batch"""
+
+import array
+import itertools
+import sys
+from types import ModuleType
+from typing import List
+
+import pytest
+import emoji
+import emoji.tokenizer
+
+
+texts: List[str] = [
+    'Python is fun 👍',
+    '',
+    'no emoji',
+    '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb',
+    'A 🦖 is eating a 🥐',
+    '🇫🇷👌️',
+] * 7
+
+
+def test_demojize_many():
+    expected = [emoji.demojize(text) for text in texts]
+    assert list(emoji.demojize_many(texts)) == expected
+    assert list(emoji.demojize_many(iter(texts), chunksize=4)) == expected
+
+    expected = [
+        emoji.demojize(text, language='alias', delimiters=('{', '}')) for text in texts
+    ]
+    assert (
+        list(emoji.demojize_many(texts, language='alias', delimiters=('{', '}')))
+        == expected
+    )
+
+    expected = [emoji.demojize(text, version=3.0, handle_version='X') for text in texts]
+    assert list(emoji.demojize_many(texts, version=3.0, handle_version='X')) == expected
+
+
+def test_emojize_many():
+    demojized = [emoji.demojize(text, language='de') for text in texts]
+    expected = [emoji.emojize(text, language='de') for text in demojized]
+    assert list(emoji.emojize_many(demojized, language='de', chunksize=5)) == expected
+
+
+def test_analyze_many():
+    expected = [list(emoji.analyze(text, non_emoji=True)) for text in texts]
+    result = list(emoji.analyze_many(texts, non_emoji=True, chunksize=3))
+    assert [[t.chars for t in tokens] for tokens in result] == [
+        [t.chars for t in tokens] for tokens in expected
+    ]
+
+
+def test_many_lazy():
+    # Infinite input is consumed chunk by chunk
+    result = emoji.demojize_many(itertools.cycle(['👍']), chunksize=10)
+    assert list(itertools.islice(result, 25)) == [':thumbs_up:'] * 25
+
+
+def test_many_chunksize():
+    with pytest.raises(ValueError):
+        list(emoji.demojize_many(texts, chunksize=0))
+
+
+def test_many_processes(emoji_module: ModuleType):
+    expected = [emoji.demojize(text, language='fr') for text in texts]
+    result = emoji_module.demojize_many(
+        texts, language='fr', processes=2, chunksize=4
+    )
+    assert list(result) == expected
+
+    demojized = [emoji.demojize(text) for text in texts]
+    expected = [emoji.emojize(text) for text in demojized]
+    result = emoji_module.emojize_many(demojized, processes=2, chunksize=4)
+    assert list(result) == expected
+
+    result = list(emoji_module.analyze_many(texts, processes=2, chunksize=4))
+    assert len(result) == len(texts)
+    for text, tokens in zip(texts, result):
+        assert [
+            (t.chars, t.value.start, t.value.end)  # type: ignore
+            for t in tokens
+        ] == [
+            (t.chars, t.value.start, t.value.end)  # type: ignore
+            for t in emoji.analyze(text)
+        ]
+
+
+def test_split_safe():
+    from emoji.tokenizer import split_safe, tokenize
+
+    text = ' '.join(texts) + '\n#️⃣ 1️⃣2️⃣ 🏴󠁧󠁢󠁳󠁣󠁴󠁿'
+    for size in (1, 2, 3, 7, 50, len(text)):
+        pieces = list(split_safe(text, size))
+        assert ''.join(pieces) == text
+        assert all(len(piece) >= size for piece in pieces[:-1])
+        for keep_zwj in (True, False):
+            assert [t.chars for t in tokenize(text, keep_zwj)] == [
+                t.chars for piece in pieces for t in tokenize(piece, keep_zwj)
+            ]
+
+    assert list(split_safe('', 5)) == ['']
+    # No character outside of emoji: cannot be split
+    assert list(split_safe('👍👍👍👍', 1)) == ['👍👍👍👍']
+    with pytest.raises(ValueError):
+        list(split_safe('abc', 0))
+
+
+def test_may_contain_emoji():
+    from emoji.tokenizer import may_contain_emoji
+
+    for emj in emoji.EMOJI_DATA:
+        assert may_contain_emoji(f'a {emj} b')
+    for text in texts:
+        assert may_contain_emoji(text) == (emoji.demojize(text) != text)
+    # The tokenizer removes variation selectors
+    assert may_contain_emoji('a\ufe0fb')
+    assert not may_contain_emoji('#1 *2, 3 \U0001F1EB \u200d')
+    assert may_contain_emoji('3\u20e3')
+    assert may_contain_emoji('\U0001F1EB\U0001F1F7')
+
+
+def test_demojize_large(emoji_module: ModuleType):
+    text = '\n'.join(texts) * 20
+    expected = emoji.demojize(text, language='es')
+    assert emoji_module.demojize_large(text, language='es', processes=1) == expected
+    assert (
+        emoji_module.demojize_large(text, language='es', processes=2, piece_size=100)
+        == expected
+    )
+
+
+def test_many_config_override(emoji_module: ModuleType):
+    family = '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb'
+    expected = emoji.demojize(family, keep_zwj=False)
+    with emoji_module.config.override(demojize_keep_zwj=False):
+        serial = emoji_module.demojize_many([family] * 3)
+        parallel = emoji_module.demojize_many([family] * 3, processes=2)
+    # The configuration of the calling context is used
+    assert list(serial) == [expected] * 3
+    assert list(parallel) == [expected] * 3
+
+
+def check_features(features: emoji.Features):
+    assert features.shape[0] == len(texts)
+    assert all(i < features.shape[1] for i in features.indices)
+    assert list(features.indptr[:1]) == [0]
+    for row, text in enumerate(texts):
+        emoji_ids = sorted(emoji.tokenizer.tokenize_ids(text))
+        start, end = features.indptr[row], features.indptr[row + 1]
+        columns = list(features.indices[start:end])
+        assert columns == sorted(set(emoji_ids))
+        assert list(features.data[start:end]) == [emoji_ids.count(i) for i in columns]
+        assert features.count[row] == len(emoji_ids)
+        assert features.distinct[row] == len(columns)
+        versions = [emoji.version(emoji.id_to_emoji(i)) for i in columns]  # type: ignore
+        assert features.max_version[row] == max(versions, default=0.0)
+
+
+def test_features():
+    check_features(emoji.features(texts))
+    check_features(emoji.features(iter(texts)))
+
+    features = emoji.features([])
+    assert list(features.count) == []
+    assert list(features.indptr) == [0]
+
+
+def test_features_without_numpy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)  # type: ignore
+    features = emoji.features(texts)
+    assert isinstance(features.count, array.array)
+    check_features(features)
+
+
+def test_features_numpy():
+    numpy = pytest.importorskip('numpy')
+    features = emoji.features(texts)
+    assert isinstance(features.indices, numpy.ndarray)
+    assert features.indices.dtype == numpy.int64
+    assert features.max_version.dtype == numpy.float64
@@ -0,0 +1,85 @@
+"""Unittests for the command line interface python -m emoji"""
+
+import importlib
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from emoji.__main__ import main
+
+
+def test_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('Python is :thumbs_up:\n:snake:'))
+    assert main(['emojize']) == 0
+    assert capsys.readouterr().out == 'Python is 👍\n🐍'
+
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('Python is 👍\n'))
+    assert main(['demojize', '--delimiters', '__', '__', '-']) == 0
+    assert capsys.readouterr().out == 'Python is __thumbs_up__\n'
+
+
+def test_files(tmp_path: Path):
+    first = tmp_path / 'first.txt'
+    second = tmp_path / 'second.txt'
+    output = tmp_path / 'output.txt'
+    first.write_bytes('👍\r\n🐍\n'.encode('utf-8'))
+    second.write_bytes('Python 🐍'.encode('utf-8'))
+
+    args = ['demojize', '-l', 'de', '-o', str(output)]
+    assert main([*args, str(first), str(second)]) == 0
+    assert output.read_bytes().decode('utf-8') == (
+        ':daumen_hoch:\r\n:schlange:\nPython :schlange:'
+    )
+
+    assert main(['emojize', '-l', 'de', '-o', str(first), str(output)]) == 0
+    assert first.read_bytes().decode('utf-8') == '👍\r\n🐍\nPython 🐍'
+
+
+def test_jobs(tmp_path: Path):
+    # The process pool needs the module that is imported now, see emoji_module
+    main = importlib.import_module('emoji.__main__').main
+    lines = [f'line {i} :thumbs_up: :snake:\n' for i in range(100)]
+    source = tmp_path / 'source.txt'
+    output = tmp_path / 'output.txt'
+    source.write_text(''.join(lines), encoding='utf-8')
+
+    args = ['emojize', '--jobs', '2', '--chunksize', '7', '-o', str(output)]
+    assert main([*args, str(source)]) == 0
+    assert output.read_text(encoding='utf-8') == ''.join(
+        f'line {i} 👍 🐍\n' for i in range(100)
+    )
+
+
+def test_errors(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(['demojize', str(tmp_path / 'missing.txt')]) == 1
+    assert 'missing.txt' in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(['emojize', '--language', 'xx'])
+    with pytest.raises(SystemExit):
+        main(['emojize', '--jobs', '-1'])
+    with pytest.raises(SystemExit):
+        main([])
+    assert main(['emojize', '--chunksize', '0']) == 2
+
+    # The input is not truncated
+    source = tmp_path / 'source.txt'
+    source.write_text('Python 🐍', encoding='utf-8')
+    capsys.readouterr()
+    assert main(['demojize', '-o', str(source), str(source)]) == 2
+    assert 'source.txt' in capsys.readouterr().err
+    args = ['demojize', '-o', str(tmp_path / '.' / 'source.txt'), '-', str(source)]
+    assert main(args) == 2
+    assert source.read_text(encoding='utf-8') == 'Python 🐍'
+
+
+def test_python_m_emoji():
+    result = subprocess.run(
+        [sys.executable, '-m', 'emoji', 'emojize', '--language', 'alias'],
+        input=':1st_place_medal:\n'.encode('utf-8'),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert result.stdout.decode('utf-8') == '🥇\n'
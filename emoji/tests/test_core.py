@@ -1,5 +1,6 @@
 """Unittests for emoji.core"""
 
+import collections
 import random
 import re
 import sys
@@ -456,6 +457,18 @@ def test_emoji_count():
     assert emoji.emoji_count('Hi') == 0
     assert emoji.emoji_count('Hello 🇫🇷👌') == 2
     assert emoji.emoji_count('Hello 🇵🇱🍺🇵🇱', unique=True) == 2
+    assert emoji.emoji_count('Hello 🇵🇱🍺🇵🇱') == 3
+    assert emoji.emoji_count('Hi', unique=True) == 0
+
+
+def test_emoji_counter():
+    assert emoji.emoji_counter('Hi') == {}
+    assert emoji.emoji_counter('Hello 🇵🇱🍺🇵🇱') == {'🇵🇱': 2, '🍺': 1}
+    text = '\U0001f468\u200d\U0001f469\U0001f3ff\u200d\U0001f468 👌 abc 👌'
+    counter = emoji.emoji_counter(text)
+    assert sum(counter.values()) == emoji.emoji_count(text)
+    assert len(counter) == emoji.emoji_count(text, unique=True)
+    assert counter == collections.Counter(e['emoji'] for e in emoji.emoji_list(text))
 
 
 def test_replace_emoji():
@@ -471,6 +484,52 @@ def test_replace_emoji():
     assert emoji.replace_emoji('Hello 🇫🇷👌', replace) == 'Hello xx'
 
 
+def test_normalize_skin_tones():
+    assert emoji.normalize_skin_tones('Hi 👍🏽 👍') == 'Hi 👍 👍'
+    assert emoji.normalize_skin_tones('👨🏿\u200d💻') == '👨\u200d💻'
+    assert emoji.normalize_skin_tones('no emoji') == 'no emoji'
+    # The fully-qualified emoji is preferred
+    assert emoji.normalize_skin_tones('☝🏻') == '☝\ufe0f'
+    assert emoji.normalize_skin_tones('🕵🏻\u200d♂️') == '🕵\ufe0f\u200d♂️'
+    # Multi-Person Groupings
+    assert emoji.normalize_skin_tones('🫱🏿\u200d🫲🏻') == '🤝'
+    assert emoji.normalize_skin_tones('🫱🏿\u200d🫲🏻', to='light') == '🤝🏻'
+    assert emoji.normalize_skin_tones('🧑🏿\u200d❤️\u200d🧑🏻') == '💑'
+    assert emoji.normalize_skin_tones('🧑🏻\u200d🤝\u200d🧑🏿') == '🧑\u200d🤝\u200d🧑'
+    # Non-RGI ZWJ sequence
+    family = '👨\u200d👩🏿\u200d👧🏻\u200d👦🏾'
+    assert emoji.normalize_skin_tones(family) == '👨\u200d👩\u200d👧\u200d👦'
+    assert emoji.normalize_skin_tones(family, to='dark') == (
+        '👨\u200d👩🏿\u200d👧🏿\u200d👦🏿'
+    )
+    # Other characters are kept as they are
+    text = 'a\ufe0f 👍🏿\u200d x\u200d'
+    assert emoji.normalize_skin_tones(text) == 'a\ufe0f 👍\u200d x\u200d'
+
+    assert emoji.normalize_skin_tones('👍🏽 👍🏿', to='medium-light') == '👍🏼 👍🏼'
+    assert emoji.normalize_skin_tones('👍🏽', to='\U0001f3ff') == '👍🏿'
+    assert emoji.normalize_skin_tones('🏽') == ''
+    with pytest.raises(ValueError):
+        emoji.normalize_skin_tones('👍🏽', to='purple')
+
+
+def test_normalize_skin_tones_all():
+    tones = '\U0001f3fb\U0001f3fc\U0001f3fd\U0001f3fe\U0001f3ff'
+    for emj, data in emoji.EMOJI_DATA.items():
+        if data['status'] > emoji.STATUS['fully_qualified'] or emj in tones:
+            continue
+        for to in [None, *tones]:
+            result = emoji.normalize_skin_tones(emj, to)
+            if not any(tone in emj for tone in tones):
+                assert result == emj
+            elif to is None:
+                assert not any(tone in result for tone in tones)
+                assert emoji.is_emoji(result), (emj, result)
+            else:
+                assert all(tone == to for tone in tones if tone in result)
+                assert emoji.is_emoji(result), (emj, to, result)
+
+
 def test_is_emoji():
     assert emoji.is_emoji('😁')
     assert not emoji.is_emoji('H')
@@ -710,9 +769,127 @@ purely_emoji_testdata = [
     ('abc\U0001f600', False),
     ('\U0001f600c', False),
     ('\u270a\U0001f3fe', True),
+    ('', True),
+    ('a\U0001f600', False),
+    ('\U0001f600\u200d', True),
+    ('\u200d\U0001f600', False),
+    ('\U0001f600 ', False),
+    (
+        '\U0001f468\u200d\U0001f469\U0001f3ff\u200d\U0001f467\U0001f3fb\u200d\U0001f466\U0001f3fe',
+        True,
+    ),
+    ('\U0001f468\u200d\U0001f469\U0001f3ff\u200dx', False),
 ]
 
 
 @pytest.mark.parametrize('string,expected', purely_emoji_testdata)
 def test_purely_emoji(string: str, expected: bool):
     assert emoji.purely_emoji(string) == expected
+    assert emoji.purely_emoji(string) == all(
+        isinstance(m.value, emoji.EmojiMatch)
+        for m in emoji.analyze(string, non_emoji=True)
+    )
+
+
+def test_callback_data_view():
+    collected: List[Any] = []
+
+    def f(emj: str, data: Dict[str, Any]) -> str:
+        collected.append(data)
+        return data['en']
+
+    text = 'A 🦖 is eating a 🥐'
+    assert emoji.config.callback_data_view is False
+    expected_replace = emoji.replace_emoji(text, f)
+    expected_demojize = emoji.demojize(text, version=-1, handle_version=f)
+    expected_emojize = emoji.emojize(':T-Rex:', version=-1, handle_version=f)
+    copies = list(collected)
+    assert all(type(data) is not emoji.EmojiDataView for data in copies)
+    collected.clear()
+
+    emoji.config.callback_data_view = True
+    try:
+        assert emoji.replace_emoji(text, f) == expected_replace
+        assert emoji.demojize(text, version=-1, handle_version=f) == expected_demojize
+        assert emoji.emojize(':T-Rex:', version=-1, handle_version=f) == expected_emojize
+    finally:
+        emoji.config.callback_data_view = False
+
+    assert len(collected) == len(copies)
+    for view, copy in zip(collected, copies):
+        assert isinstance(view, emoji.EmojiDataView)
+        assert dict(view) == copy
+        assert view.copy() == copy
+        assert len(view) == len(copy)
+        assert view['match_start'] == copy['match_start']
+        assert 'match_end' in view
+        assert view.get('alias') == copy.get('alias')
+        with pytest.raises(TypeError):
+            view['en'] = 'x'  # type: ignore
+
+    # The view refers to the entry in EMOJI_DATA without copying it
+    assert collected[0]._data is emoji.EMOJI_DATA['🦖']  # pyright: ignore [reportPrivateUsage]
+
+
+def test_data_view_non_rgi():
+    view = emoji.EmojiMatch('x', 2, 3, None).data_view()
+    assert dict(view) == {'match_start': 2, 'match_end': 3}
+    assert view.copy() == emoji.EmojiMatch('x', 2, 3, None).data_copy()
+    with pytest.raises(KeyError):
+        view['en']
+
+
+def test_config_override():
+    family = '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb'
+    with_zwj = emoji.demojize(family, keep_zwj=True)
+    without_zwj = emoji.demojize(family, keep_zwj=False)
+    assert with_zwj != without_zwj
+
+    default = emoji.config.demojize_keep_zwj
+    with emoji.config.override(demojize_keep_zwj=not default):
+        assert emoji.demojize(family) == (with_zwj if not default else without_zwj)
+        with emoji.config.override(demojize_keep_zwj=default):
+            assert emoji.demojize(family) == (with_zwj if default else without_zwj)
+        assert emoji.demojize(family) == (with_zwj if not default else without_zwj)
+        # Explicit argument takes precedence
+        assert emoji.demojize(family, keep_zwj=True) == with_zwj
+    assert emoji.config.demojize_keep_zwj == default
+
+    with emoji.config.override(replace_emoji_keep_zwj=True):
+        assert emoji.replace_emoji(family, 'x') == 'x'
+    with emoji.config.override(replace_emoji_keep_zwj=False):
+        assert emoji.replace_emoji(family, 'x') == 'xxx'
+    assert emoji.replace_emoji(family, 'x', keep_zwj=True) == 'x'
+
+    with pytest.raises(TypeError):
+        with emoji.config.override(unknown_option=True):
+            pass
+
+
+def test_config_override_threads():
+    import threading
+
+    family = '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb'
+    expected = {
+        True: emoji.demojize(family, keep_zwj=True),
+        False: emoji.demojize(family, keep_zwj=False),
+    }
+    barrier = threading.Barrier(4)
+    errors: List[str] = []
+
+    def worker(keep_zwj: bool):
+        with emoji.config.override(demojize_keep_zwj=keep_zwj):
+            barrier.wait()
+            for _ in range(200):
+                if emoji.demojize(family) != expected[keep_zwj]:
+                    errors.append(f'wrong result for keep_zwj={keep_zwj}')
+
+    threads = [
+        threading.Thread(target=worker, args=(keep_zwj,))
+        for keep_zwj in (True, False, True, False)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
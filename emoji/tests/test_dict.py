@@ -1,10 +1,13 @@
 """Unittests for the big dict of dicts containing all emoji"""
 
 from typing import Set, Dict
+from pathlib import Path
+import json
 import re
 import emoji
 
 from testutils import load_all_languages as load_all_languages
+from check_data import check_data
 
 
 def test_all_languages_list(load_all_languages):  # type:ignore
@@ -60,3 +63,37 @@ def test_name_valid(load_all_languages):  # type:ignore
             if lang in item:
                 name = item[lang]
                 assert pattern.match(name)
+
+
+def test_check_data():
+    assert check_data() == []
+
+
+def test_check_data_errors(tmp_path: Path):
+    data = {
+        '\U0001F44D': {'en': ':thumbs_up:', 'status': 2, 'E': 0.6, 'alias': [':+1:']},
+        '\U0001F44E': {'en': ':thumbs_up:', 'status': 2, 'E': 0.6},
+        '\U0001F40D': {'en': ':snake :', 'status': 7, 'E': 0.6},
+    }
+    (tmp_path / 'emoji.json').write_text(json.dumps(data), encoding='utf-8')
+    ids = ['\U0001F44D', '\U0001F44E', '\U0001F44D']
+    (tmp_path / 'emoji_ids.json').write_text(json.dumps(ids), encoding='utf-8')
+    for lang in emoji.LANGUAGES:
+        translations = {'\U0001F44D': ':daumen_hoch:'}
+        if lang == 'de':
+            translations['\U0001F600'] = ':grinsendes_gesicht:'
+            translations['\U0001F44E'] = ':daumen_runter:'
+        if lang != 'es':
+            (tmp_path / f'emoji_{lang}.json').write_text(
+                json.dumps(translations), encoding='utf-8'
+            )
+
+    errors = '\n'.join(check_data(tmp_path))
+    assert "en: name ':thumbs_up:' is used by" in errors
+    assert 'has an invalid status' in errors
+    assert "':snake :' does not match _EMOJI_NAME_PATTERN" in errors
+    assert "emoji_de.json: '\U0001F600' is not in emoji.json" in errors
+    assert 'emoji_es.json is missing' in errors
+    assert "de: name ':daumen_hoch:'" not in errors
+    assert 'emoji_ids.json: contains duplicates' in errors
+    assert "emoji_ids.json: '\U0001F40D' has no ID" in errors
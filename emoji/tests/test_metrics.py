@@ -0,0 +1,107 @@
+"""Unittests for emoji.metrics"""
+
+import uuid
+
+import emoji
+import emoji.tokenizer
+
+
+def test_stats_disabled():
+    emoji.stats(reset=True)
+    emoji.demojize('Python is fun 👍')
+    stats = emoji.stats()
+    assert 'tokenize.calls' not in stats
+    assert all(isinstance(value, (int, float)) for value in stats.values())
+
+
+def test_stats_enabled():
+    emoji.stats(reset=True)
+    emoji.config.enable_stats()
+    try:
+        emoji.demojize('Python is fun 👍')
+        emoji.emoji_count('👍👍')
+        assert emoji.purely_emoji('👍 abc') is False
+        unknown = f':unknown_{uuid.uuid4().hex}:'  # always a cache miss
+        emoji.emojize(f':thumbs_up: {unknown}')
+        emoji.emojize(':thumbs_up:')  # always a cache hit
+    finally:
+        emoji.config.enable_stats(False)
+
+    stats = emoji.stats(reset=True)
+    assert stats['tokenize.calls'] == 3
+    # purely_emoji() stops after the second token
+    assert stats['tokenize.chars'] == len('Python is fun 👍') + 2 + 2
+    assert stats['get_emoji_by_name.hits'] >= 1
+    assert 0 < stats['get_emoji_by_name.hit_rate'] < 1
+
+    stats = emoji.stats()
+    assert 'tokenize.calls' not in stats
+    assert stats['get_emoji_by_name.hits'] == 0
+    assert stats['get_emoji_by_name.misses'] == 0
+
+
+def test_stats_timings():
+    before = emoji.stats().get('get_search_tree.calls', 0)
+    emoji.tokenizer._SEARCH_TREE.clear()  # pyright: ignore [reportPrivateUsage]
+    emoji.tokenizer.get_search_tree()
+    stats = emoji.stats(reset=True)
+    assert stats['get_search_tree.calls'] == before + 1
+    assert stats['get_search_tree.seconds'] > 0
+    # The timings are not reset
+    assert emoji.stats()['get_search_tree.calls'] == before + 1
+
+
+def test_memory_usage():
+    # Start with fresh data without the languages that other tests loaded
+    loaded_keys = emoji.unicode_codes._loaded_keys  # pyright: ignore [reportPrivateUsage]
+    languages = list(loaded_keys)
+    loaded_keys[:] = ['en', 'alias', 'E', 'status']
+    emoji.reload_data('emoji.unicode_codes')
+    try:
+        _check_memory_usage()
+    finally:
+        for language in languages:
+            if language in emoji.LANGUAGES:
+                emoji.config.load_language(language)
+
+
+def _check_memory_usage():
+    emoji.demojize('👍')  # build the search tree
+    usage = emoji.config.memory_usage()
+    assert usage['EMOJI_DATA'] > 0
+    assert usage['search_tree'] > 0
+    assert set(usage['languages']) == {'en', 'alias'}
+    assert sum(usage['languages'].values()) < usage['EMOJI_DATA']
+    assert usage['total'] == (
+        usage['EMOJI_DATA']
+        + usage['search_tree']
+        + usage['name_index']
+        + usage['emoji_ids']
+        + usage['result_cache']
+        + usage['name_cache']
+        + usage['patterns']
+    )
+
+    emoji.config.load_language('de')
+    after = emoji.config.memory_usage()
+    assert set(after['languages']) == {'en', 'alias', 'de'}
+    assert after['languages']['de'] > 0
+    assert after['EMOJI_DATA'] > usage['EMOJI_DATA']
+
+
+def test_deep_sizeof():
+    import sys
+    from emoji.metrics import deep_sizeof
+
+    shared = 'x' * 100
+    obj = {'a': [shared, shared], 'b': (shared,)}
+    size = deep_sizeof(obj, set())
+    assert size == (
+        sys.getsizeof(obj)
+        + sys.getsizeof('a')
+        + sys.getsizeof('b')
+        + sys.getsizeof(obj['a'])
+        + sys.getsizeof(obj['b'])
+        + sys.getsizeof(shared)
+    )
+    assert deep_sizeof(obj, {id(shared)}) == size - sys.getsizeof(shared)
@@ -0,0 +1,74 @@
+"""Unittests for emoji.pandas"""
+
+from typing import Any, List
+
+import pytest
+import emoji
+
+pandas = pytest.importorskip('pandas')
+import emoji.pandas  # noqa: E402
+
+
+def values(series: Any) -> List[Any]:
+    """The values of the Series, with None for missing values. The representation
+    of missing values depends on the pandas version."""
+    return [
+        None if pandas.api.types.is_scalar(value) and pandas.isna(value) else value
+        for value in series
+    ]
+
+
+def test_demojize():
+    series = pandas.Series(
+        ['Python is fun 👍', 'no emoji', None, 'Python is fun 👍', 3, 'a️b'],
+        index=list('abcdef'),
+        name='text',
+    )
+    result = series.emoji.demojize()
+    assert result.index.equals(series.index)
+    assert result.name == 'text'
+    assert values(result) == [
+        'Python is fun :thumbs_up:',
+        'no emoji',
+        None,
+        'Python is fun :thumbs_up:',
+        None,
+        'ab',
+    ]
+    assert series.emoji.demojize(language='de', delimiters=('_', '_')).iloc[0] == (
+        'Python is fun _daumen_hoch_'
+    )
+
+
+def test_emojize():
+    series = pandas.Series([':snake: :thumbs_up:', 'no emoji', None])
+    assert values(series.emoji.emojize()) == ['🐍 👍', 'no emoji', None]
+
+
+def test_count():
+    series = pandas.Series(['🐍🐍👍', 'no emoji', '🐍🐍👍', '#1 2⃣'])
+    result = series.emoji.count()
+    assert result.dtype == 'int64'
+    assert result.tolist() == [3, 0, 3, 1]
+    assert series.emoji.count(unique=True).tolist() == [2, 0, 2, 1]
+
+    result = pandas.Series(['🐍', None]).emoji.count()
+    assert result.dtype == 'float64'
+    assert result[0] == 1
+    assert pandas.isna(result[1])
+
+    assert pandas.Series([], dtype=object).emoji.count().tolist() == []
+
+
+def test_list():
+    series = pandas.Series(['🐍 and 👍', 'no emoji', '🐍 and 👍', None])
+    expected = [['🐍', '👍'], [], ['🐍', '👍'], None]
+    assert values(series.emoji.list()) == expected
+    for text, emojis in zip(series[:3], expected):
+        assert emojis == [item['emoji'] for item in emoji.emoji_list(text)]
+
+
+def test_string_dtype():
+    series = pandas.Series(['🐍', None, 'x'], dtype='string')
+    assert values(series.emoji.demojize()) == [':snake:', None, 'x']
+    assert series.emoji.count().tolist()[::2] == [1, 0]
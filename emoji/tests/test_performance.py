@@ -0,0 +1,158 @@
+"""Performance regression tests for the hot paths.
+These tests are skipped unless pytest is run with ``--perf``.
+
+The timings are divided by the time of a fixed calibration workload to make
+them comparable across machines and compared to ``perf_baseline.json``.
+Update the baseline with ``pytest --perf --perf-update-baseline -k performance``
+"""
+
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+import emoji
+import emoji.tokenizer
+from benchmark import make_chat, make_shortcodes, make_zwj
+
+pytestmark = pytest.mark.perf
+
+BASELINE_FILE = Path(__file__).parent / 'perf_baseline.json'
+
+SIZE = 20000
+
+
+def best_time(func: Callable[[], Any], repeat: int = 7) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibration_time() -> float:
+    """Time of a pure Python workload similar to the tokenizer loop"""
+    table = {chr(i): i for i in range(0x250)}
+    text = ''.join(chr(i % 0x300) for i in range(SIZE * 5))
+
+    def work():
+        n = 0
+        for c in text:
+            if c in table:
+                n += 1
+        return n
+
+    return best_time(work)
+
+
+def corpus(name: str, size: int) -> str:
+    rnd = random.Random(1)
+    if name == 'chat':
+        return make_chat(size, rnd)
+    if name == 'zwj':
+        return make_zwj(size, rnd)
+    return make_shortcodes(size, rnd, name)
+
+
+def reset_search_tree():
+    emoji.tokenizer._SEARCH_TREE.clear()  # pyright: ignore [reportPrivateUsage]
+
+
+def build_search_tree():
+    reset_search_tree()
+    emoji.tokenizer.get_search_tree()
+
+
+hot_paths: Dict[str, Callable[[str], Any]] = {
+    'tokenize': lambda s: list(emoji.tokenizer.tokenize(s, keep_zwj=True)),
+    'demojize': emoji.demojize,
+    'emojize': emoji.emojize,
+}
+
+scaling_cases = [
+    ('tokenize', 'chat'),
+    ('tokenize', 'zwj'),
+    ('demojize', 'chat'),
+    ('demojize', 'zwj'),
+    ('emojize', 'en'),
+]
+
+
+@pytest.fixture(scope='module')
+def baseline(request: pytest.FixtureRequest) -> Iterator[Dict[str, float]]:
+    update = request.config.getoption('perf_update_baseline')
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            data: Dict[str, float] = json.load(f)
+    else:
+        data = {}
+    measured: Dict[str, float] = {}
+    yield measured if update else data
+    if update:
+        data.update(measured)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(data.items())), f, indent=2)
+            f.write('\n')
+
+
+@pytest.fixture(scope='module')
+def calibration() -> float:
+    return calibration_time()
+
+
+def check_baseline(
+    request: pytest.FixtureRequest,
+    baseline: Dict[str, float],
+    name: str,
+    relative: float,
+):
+    if request.config.getoption('perf_update_baseline'):
+        baseline[name] = round(relative, 4)
+        return
+    assert name in baseline, f'No baseline for {name}, run with --perf-update-baseline'
+    tolerance = request.config.getoption('perf_tolerance')
+    assert relative <= baseline[name] * tolerance, (
+        f'{name} is {relative / baseline[name]:.1f} times slower than the baseline '
+        f'(tolerance {tolerance})'
+    )
+
+
+@pytest.mark.parametrize('func_name,corpus_name', scaling_cases)
+def test_hot_path_baseline(
+    request: pytest.FixtureRequest,
+    baseline: Dict[str, float],
+    calibration: float,
+    func_name: str,
+    corpus_name: str,
+):
+    text = corpus(corpus_name, SIZE)
+    func = hot_paths[func_name]
+    func(text)  # warm up caches
+    relative = best_time(lambda: func(text)) / calibration
+    check_baseline(request, baseline, f'{func_name}[{corpus_name}]', relative)
+
+
+def test_search_tree_baseline(
+    request: pytest.FixtureRequest, baseline: Dict[str, float], calibration: float
+):
+    try:
+        relative = best_time(build_search_tree) / calibration
+    finally:
+        emoji.tokenizer.get_search_tree()
+    check_baseline(request, baseline, 'get_search_tree[build]', relative)
+
+
+@pytest.mark.parametrize('func_name,corpus_name', scaling_cases)
+def test_hot_path_linear(func_name: str, corpus_name: str):
+    # Four times the input should take about four times as long, a quadratic
+    # algorithm would take sixteen times as long
+    func = hot_paths[func_name]
+    small = corpus(corpus_name, SIZE // 4)
+    large = corpus(corpus_name, SIZE)
+    func(small)  # warm up caches
+    ratio = best_time(lambda: func(large)) / best_time(lambda: func(small))
+    assert ratio < 8, f'{func_name}[{corpus_name}] scales super-linearly: {ratio:.1f}'
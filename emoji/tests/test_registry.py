@@ -0,0 +1,282 @@
+"""Unittests for emoji.add_emoji(), emoji.remove_emoji() and emoji.reload_data()"""
+
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+import emoji
+import emoji.unicode_codes
+from emoji.tokenizer import may_contain_emoji, split_safe
+
+PARROT = '\U000f0000'
+
+
+@pytest.fixture
+def parrot() -> Iterator[str]:
+    # Build the search tree and the name indexes before the emoji is added
+    emoji.demojize('👍')
+    emoji.emojize(':thumbs_up:', language='alias')
+    emoji.add_emoji(
+        PARROT,
+        {'en': ':partyparrot:', 'alias': [':parrot_party:'], 'de': ':party_papagei:'},
+    )
+    try:
+        yield PARROT
+    finally:
+        if PARROT in emoji.EMOJI_DATA:
+            emoji.remove_emoji(PARROT)
+
+
+def test_add_emoji(parrot: str):
+    assert emoji.emojize('Deploy done :partyparrot:') == f'Deploy done {parrot}'
+    assert emoji.emojize(':parrot_party:', language='alias') == parrot
+    assert emoji.emojize(':party_papagei:', language='de') == parrot
+    assert emoji.demojize(f'Deploy done {parrot}') == 'Deploy done :partyparrot:'
+    assert emoji.demojize(parrot, language='alias') == ':parrot_party:'
+    assert emoji.demojize(parrot, language='de') == ':party_papagei:'
+    assert emoji.emoji_list(f'a{parrot}👍') == [
+        {'match_start': 1, 'match_end': 2, 'emoji': parrot},
+        {'match_start': 2, 'match_end': 3, 'emoji': '👍'},
+    ]
+    assert emoji.is_emoji(parrot)
+    assert emoji.purely_emoji(parrot + parrot)
+    assert emoji.replace_emoji(f'a{parrot}b') == 'ab'
+    assert emoji.unicode_codes.get_emoji_by_name(':partyparrot:', 'en') == parrot
+    assert emoji.EMOJI_DATA[parrot]['status'] == emoji.STATUS['fully_qualified']
+    assert may_contain_emoji(f'x{parrot}')
+    # The emoji is not split from the next character
+    assert list(split_safe(f'{parrot}{parrot}ab', 1)) == [parrot + parrot, 'a', 'b']
+
+    data = f'é{parrot}'.encode('utf-8')
+    assert emoji.emoji_list_bytes(data) == [
+        {'match_start': 2, 'match_end': 6, 'emoji': parrot}
+    ]
+    assert emoji.demojize_bytes(data) == 'é:partyparrot:'.encode('utf-8')
+
+
+def test_add_emoji_id(parrot: str):
+    emoji_id = emoji.emoji_to_id(parrot)
+    # New IDs are added after the IDs of the emoji in EMOJI_DATA
+    assert emoji_id >= len(emoji.EMOJI_DATA) - 1
+    assert emoji.id_to_emoji(emoji_id) == parrot
+    # The ID is kept, it is not reused for another emoji
+    emoji.remove_emoji(parrot)
+    emoji.add_emoji(parrot, {'en': ':partyparrot:'})
+    assert emoji.emoji_to_id(parrot) == emoji_id
+
+
+def test_replace_emoji(parrot: str):
+    emoji.add_emoji(parrot, {'en': ':fast_parrot:', 'E': 15})
+    assert emoji.demojize(parrot) == ':fast_parrot:'
+    assert emoji.emojize(':fast_parrot:') == parrot
+    assert emoji.emojize(':partyparrot:') == ':partyparrot:'
+    assert emoji.emojize(':parrot_party:', language='alias') == ':parrot_party:'
+    assert emoji.demojize(parrot, version=14) == ''
+
+
+def test_remove_emoji(parrot: str):
+    emoji.remove_emoji(parrot)
+    assert parrot not in emoji.EMOJI_DATA
+    assert emoji.demojize(f'a{parrot}') == f'a{parrot}'
+    assert emoji.emojize(':partyparrot:') == ':partyparrot:'
+    assert emoji.unicode_codes.get_emoji_by_name(':partyparrot:', 'en') is None
+    assert not emoji.is_emoji(parrot)
+    assert emoji.emoji_list_bytes(parrot.encode('utf-8')) == []
+    with pytest.raises(KeyError):
+        emoji.remove_emoji(parrot)
+
+
+def test_sequence():
+    # The sequence shares a prefix with an existing emoji in the search tree
+    sequence = '👍\U000f0001'
+    emoji.demojize('👍')
+    emoji.add_emoji(sequence, {'en': ':thumbs_up_plus:'})
+    try:
+        assert emoji.demojize(sequence + '👍') == ':thumbs_up_plus::thumbs_up:'
+        assert emoji.emojize(':thumbs_up_plus:') == sequence
+    finally:
+        emoji.remove_emoji(sequence)
+    assert emoji.demojize(sequence) == ':thumbs_up:\U000f0001'
+    assert emoji.demojize('👍') == ':thumbs_up:'
+
+
+@pytest.mark.parametrize(
+    'emj, data',
+    [
+        ('', {'en': ':empty:'}),
+        (PARROT, {}),
+        (PARROT, {'en': 'no_colons'}),
+        (PARROT, {'en': ':with space:'}),
+        (PARROT, {'en': ':partyparrot:', 'status': 42}),
+        (PARROT, {'en': ':partyparrot:', 'E': 'new'}),
+        (PARROT, {'en': ':partyparrot:', 'alias': [':a b:']}),
+        (PARROT, {'en': ':partyparrot:', 'de': 7}),
+        (PARROT, {'en': ':thumbs_up:'}),
+        (PARROT, {'en': ':partyparrot:', 'alias': [':thumbsup:']}),
+        (PARROT, {'en': ':partyparrot:', 'de': ':daumen_hoch:'}),
+    ],
+)
+def test_invalid(emj: str, data: Dict[str, Any]):
+    with pytest.raises(ValueError):
+        emoji.add_emoji(emj, data)
+    assert PARROT not in emoji.EMOJI_DATA
+    assert emoji.emojize(':partyparrot:') == ':partyparrot:'
+
+
+def test_hooks():
+    events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def hook(event: str, info: Dict[str, Any]):
+        events.append((event, info))
+
+    for event in ('emoji_added', 'emoji_removed'):
+        emoji.unicode_codes.register_hook(event, hook)
+    try:
+        emoji.add_emoji(PARROT, {'en': ':partyparrot:'})
+        emoji.remove_emoji(PARROT)
+    finally:
+        for event in ('emoji_added', 'emoji_removed'):
+            emoji.unicode_codes.unregister_hook(event, hook)
+
+    assert [(event, info['emoji']) for event, info in events] == [
+        ('emoji_added', PARROT),
+        ('emoji_removed', PARROT),
+    ]
+
+
+def test_result_cache(parrot: str):
+    emoji.config.enable_result_cache()
+    try:
+        assert emoji.demojize(parrot) == ':partyparrot:'
+        emoji.add_emoji(parrot, {'en': ':fast_parrot:'})
+        assert emoji.demojize(parrot) == ':fast_parrot:'
+    finally:
+        emoji.config.enable_result_cache(0)
+
+
+@pytest.fixture
+def new_data(tmp_path: Path) -> Iterator[Path]:
+    source = Path(emoji.unicode_codes.__file__).parent
+    for path in source.glob('*.json'):
+        shutil.copy(path, tmp_path)
+    with open(tmp_path / 'emoji.json', 'rb') as f:
+        data = json.load(f)
+    data['👍']['en'] = ':thumbs_up_new:'
+    data[PARROT] = {'en': ':partyparrot:', 'status': 2, 'E': 99}
+    with open(tmp_path / 'emoji.json', 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    try:
+        yield tmp_path
+    finally:
+        emoji.reload_data('emoji.unicode_codes')
+
+
+def test_reload_data(new_data: Path):
+    emoji.config.load_language('de')
+    assert emoji.demojize(f'👍{PARROT}') == f':thumbs_up:{PARROT}'
+    old_id = emoji.emoji_to_id('👍')
+    old_data = emoji.EMOJI_DATA
+
+    emoji.reload_data(new_data)
+    assert emoji.EMOJI_DATA is emoji.unicode_codes.EMOJI_DATA
+    assert emoji.EMOJI_DATA is not old_data
+    assert emoji.demojize(f'👍{PARROT}') == ':thumbs_up_new::partyparrot:'
+    assert emoji.emojize(':thumbs_up_new: :thumbs_up:') == '👍 :thumbs_up:'
+    assert emoji.is_emoji(PARROT)
+    assert emoji.version(PARROT) == 99
+    assert may_contain_emoji(PARROT)
+    assert emoji.emoji_list_bytes(PARROT.encode('utf-8'))[0]['emoji'] == PARROT
+    # The languages are loaded again
+    assert emoji.demojize('👍', language='de') == ':daumen_hoch:'
+    assert emoji.emoji_to_id('👍') == old_id
+    assert emoji.emoji_to_id(PARROT) is not None
+
+    emoji.reload_data('emoji.unicode_codes')
+    assert emoji.demojize(f'👍{PARROT}') == f':thumbs_up:{PARROT}'
+    assert emoji.emojize(':thumbs_up:') == '👍'
+    assert not emoji.is_emoji(PARROT)
+
+
+def test_reload_data_error(new_data: Path):
+    with open(new_data / 'emoji_de.json', 'w') as f:
+        f.write('{')
+    emoji.config.load_language('de')
+    old_data = emoji.EMOJI_DATA
+    with pytest.raises(ValueError):
+        emoji.reload_data(new_data)
+    with pytest.raises(FileNotFoundError):
+        emoji.reload_data(new_data / 'missing')
+    assert emoji.EMOJI_DATA is old_data
+    assert emoji.demojize('👍') == ':thumbs_up:'
+
+
+def test_reload_data_hook(new_data: Path):
+    events: List[Dict[str, Any]] = []
+
+    def hook(event: str, info: Dict[str, Any]):
+        events.append(info)
+
+    emoji.unicode_codes.register_hook('data_reloaded', hook)
+    try:
+        emoji.reload_data(str(new_data))
+    finally:
+        emoji.unicode_codes.unregister_hook('data_reloaded', hook)
+    assert [info['source'] for info in events] == [str(new_data)]
+
+
+def test_reload_data_threads(new_data: Path):
+    # Each call sees either the old or the new data, never a mix of both
+    text = '👍 👨\u200d👩\u200d👧 ' * 20
+    expected = {
+        emoji.demojize(text).replace(':thumbs_up:', name)
+        for name in (':thumbs_up:', ':thumbs_up_new:')
+    }
+    results: List[str] = []
+    stop = threading.Event()
+
+    def work():
+        while not stop.is_set():
+            results.append(emoji.demojize(text))
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    try:
+        for _ in range(5):
+            emoji.reload_data(new_data)
+            emoji.reload_data('emoji.unicode_codes')
+    finally:
+        stop.set()
+        thread.join()
+    assert results
+    assert set(results) <= expected
+
+
+def test_reload_data_during_emojize(new_data: Path):
+    # emojize() keeps using the old data for all names of the string
+    def reload(emj: str, data: Dict[str, Any]) -> str:
+        emoji.reload_data(new_data)
+        return emj
+
+    text = ':thumbs_up: :partyparrot:'
+    assert emoji.emojize(text, version=-1, handle_version=reload) == '👍 :partyparrot:'
+    assert emoji.emojize(text) == ':thumbs_up: ' + PARROT
+
+
+def test_add_emoji_waits_for_reload(new_data: Path):
+    # A change of the data while another change runs is not lost
+    thread = threading.Thread(
+        target=emoji.add_emoji, args=('\U000f0001', {'en': ':deploy_bot:'})
+    )
+    with emoji.unicode_codes._write_lock:  # pyright: ignore [reportPrivateUsage]
+        emoji.reload_data(new_data)
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+        assert '\U000f0001' not in emoji.EMOJI_DATA
+    thread.join()
+    assert emoji.emojize(':deploy_bot:') == '\U000f0001'
+    emoji.remove_emoji('\U000f0001')
+    assert emoji.emojize(':deploy_bot:') == ':deploy_bot:'
@@ -0,0 +1,119 @@
+"""Unittests for emoji.config.enable_result_cache()"""
+
+from typing import Any, Dict, Iterator, List
+
+import pytest
+import emoji
+import emoji.tokenizer
+import emoji.unicode_codes
+
+
+@pytest.fixture
+def cache() -> Iterator[None]:
+    # Build the search tree first, so that the tests only measure the cache
+    emoji.tokenizer.get_search_tree()
+    emoji.config.enable_result_cache(maxsize=4, max_length=20)
+    emoji.stats(reset=True)
+    try:
+        yield
+    finally:
+        emoji.config.enable_result_cache(0)
+
+
+def cache_stats() -> Dict[str, Any]:
+    return {
+        key.split('.')[1]: value
+        for key, value in emoji.stats().items()
+        if key.startswith('result_cache.')
+    }
+
+
+def test_disabled():
+    emoji.stats(reset=True)
+    emoji.demojize('lol 👍')
+    emoji.demojize('lol 👍')
+    assert cache_stats()['hits'] == 0
+    assert cache_stats()['currsize'] == 0
+
+
+def test_hits(cache: None):
+    # Loading a language clears the cache
+    emoji.unicode_codes.load_from_json('de')
+    for _ in range(3):
+        assert emoji.demojize('lol 👍') == 'lol :thumbs_up:'
+        assert emoji.emojize(':snake:') == '🐍'
+        assert emoji.emoji_count('😂😂😂') == 3
+    stats = cache_stats()
+    assert stats['hits'] == 6
+    assert stats['misses'] == 3
+    assert stats['currsize'] == 3
+
+    # Building the search tree again does not change the data
+    emoji.tokenizer._SEARCH_TREE = {}  # pyright: ignore [reportPrivateUsage]
+    emoji.tokenizer.get_search_tree()
+    assert emoji.emoji_count('😂😂😂') == 3
+    assert cache_stats()['hits'] == 7
+
+    # Different options are cached separately
+    assert emoji.demojize('lol 👍', language='de') == 'lol :daumen_hoch:'
+    assert emoji.demojize('lol 👍', delimiters=('_', '_')) == 'lol _thumbs_up_'
+    assert cache_stats()['misses'] == 5
+
+    # The least recently used result is removed
+    assert cache_stats()['currsize'] == 4
+    emoji.emoji_count('😂😂😂')
+    assert cache_stats()['misses'] == 5
+    emoji.demojize('lol 👍')
+    assert cache_stats()['misses'] == 6
+
+
+def test_config(cache: None):
+    text = '\U0001f468‍\U0001f469\U0001f3ff'
+    # Other tests change the module-wide setting
+    with emoji.config.override(demojize_keep_zwj=True):
+        assert emoji.demojize(text) == ':man:‍:woman_dark_skin_tone:'
+        with emoji.config.override(demojize_keep_zwj=False):
+            assert emoji.demojize(text) == ':man::woman_dark_skin_tone:'
+        assert emoji.demojize(text) == ':man:‍:woman_dark_skin_tone:'
+
+
+def test_mutable_results(cache: None):
+    result = emoji.emoji_list('a 🐍')
+    result[0]['emoji'] = 'x'
+    result.append(result[0])
+    assert emoji.emoji_list('a 🐍') == [
+        {'match_start': 2, 'match_end': 3, 'emoji': '🐍'}
+    ]
+
+    tokens = list(emoji.analyze('🐍🐍', non_emoji=True))
+    assert list(emoji.analyze('🐍🐍', non_emoji=True)) == tokens
+    assert cache_stats()['hits'] == 2
+
+
+def test_not_cached(cache: None):
+    calls: List[str] = []
+
+    def handle_version(emj: str, data: Dict[str, str]) -> str:
+        calls.append(emj)
+        return 'x'
+
+    for _ in range(2):
+        assert emoji.demojize('🦖', version=1.0, handle_version=handle_version) == 'x'
+        emoji.demojize('long text with an emoji 👍')
+        emoji.demojize('👍', delimiters=['<', '>'])  # type: ignore
+    assert calls == ['🦖', '🦖']
+    assert cache_stats()['currsize'] == 0
+
+
+def test_invalidation(cache: None):
+    emoji.demojize('👍')
+    assert cache_stats()['currsize'] == 1
+    emoji.unicode_codes._fire(  # pyright: ignore [reportPrivateUsage]
+        'language_loaded', language='en'
+    )
+    assert cache_stats()['currsize'] == 0
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        emoji.config.enable_result_cache(-1)
@@ -0,0 +1,112 @@
+"""Unittests for emoji.server"""
+
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+import emoji
+from emoji.server import Client, make_server
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'), reason='Unix sockets are not supported'
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[str]:
+    path = str(tmp_path / 'emoji.sock')
+    server = make_server(path, ['de'])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_client(socket_path: str):
+    with Client(socket_path, timeout=10) as client:
+        assert client.ping()
+        assert client.emojize('Python is :thumbs_up:') == 'Python is 👍'
+        assert client.emojize('Python is :daumen_hoch:', language='de') == (
+            'Python is 👍'
+        )
+        assert client.emojize('__snake__', delimiters=['__', '__']) == '🐍'
+        assert client.demojize('Python is 👍', language='de') == (
+            'Python is :daumen_hoch:'
+        )
+        assert client.demojize('👍', handle_version='x', version=0.5) == 'x'
+
+        tokens = client.analyze('a👍b', non_emoji=True)
+        assert [token['chars'] for token in tokens] == ['a', '👍', 'b']
+        assert tokens[1]['emoji'] == '👍'
+        assert tokens[1]['match_start'] == 1
+        assert tokens[1]['match_end'] == 2
+        assert tokens[1]['data']['en'] == emoji.EMOJI_DATA['👍']['en']
+
+        # Errors do not close the connection
+        with pytest.raises(ValueError, match='Unknown op'):
+            client.request('unknown')
+        with pytest.raises(ValueError, match='Unknown options'):
+            client.emojize(':snake:', keep_zwj=True)
+        with pytest.raises(ValueError, match='Language not supported'):
+            client.demojize('👍', language='xx')
+        assert client.ping()
+
+
+def test_multiple_clients(socket_path: str):
+    clients = [Client(socket_path, timeout=10) for _ in range(3)]
+    try:
+        for i, client in enumerate(clients):
+            assert client.demojize('🐍' * i) == ':snake:' * i
+    finally:
+        for client in clients:
+            client.close()
+
+
+def test_raw_protocol(socket_path: str):
+    sock = socket.socket(getattr(socket, 'AF_UNIX'), socket.SOCK_STREAM)
+    sock.settimeout(10)
+    sock.connect(socket_path)
+    with sock, sock.makefile('rb') as rfile:
+        # Two pipelined requests
+        for request in (
+            b'{"op": "emojize", "string": ":snake:", "id": 7}',
+            b'[]',
+        ):
+            sock.sendall(struct.pack('>I', len(request)) + request)
+
+        (size,) = struct.unpack('>I', rfile.read(4))
+        assert rfile.read(size).decode('utf-8') == '{"result": "🐍", "id": 7}'
+        (size,) = struct.unpack('>I', rfile.read(4))
+        assert b'error' in rfile.read(size)
+
+        # An invalid frame closes the connection
+        sock.sendall(struct.pack('>I', 3) + b'\xff\xfe\xfd')
+        assert rfile.read(4) == b''
+
+
+def test_python_m_emoji_serve(tmp_path: Path):
+    path = str(tmp_path / 'emoji.sock')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'emoji', 'serve', '--socket', path, '-l', 'fr']
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not Path(path).exists():
+            assert process.poll() is None, 'The server exited'
+            assert time.monotonic() < deadline, 'The server did not start'
+            time.sleep(0.05)
+        with Client(path, timeout=10) as client:
+            assert client.demojize('🐍', language='fr') == ':serpent:'
+    finally:
+        process.terminate()
+        process.wait(10)
+    assert process.returncode == 0
+    assert not Path(path).exists()
@@ -1,6 +1,8 @@
 """Unittests for emoji.unicode_codes."""
 
-from typing import Set
+from typing import Any, Dict, List, Set, Tuple
+import pytest
+import emoji.tokenizer
 import emoji.unicode_codes
 from testutils import (
     get_language_packs,
@@ -49,3 +51,129 @@ def test_get_emoji_by_name():
     for lang in emoji.LANGUAGES:
         for name, emj in get_emoji_unicode_dict(lang).items():
             assert emoji.unicode_codes.get_emoji_by_name(name, lang) == emj
+
+
+def test_get_emoji_by_name_first_match():
+    # The index must return the same emoji as a scan of EMOJI_DATA in order
+    for language in ('en', 'alias'):
+        expected: Dict[str, str] = {}
+        for emj, data in emoji.EMOJI_DATA.items():
+            if data['status'] <= emoji.STATUS['fully_qualified']:
+                names = data.get('alias', []) if language == 'alias' else [data['en']]
+                for name in names:
+                    expected.setdefault(name, emj)
+        for name, emj in expected.items():
+            assert emoji.unicode_codes.get_emoji_by_name(name, language) == emj
+    # Aliases fall back to the English names
+    assert emoji.unicode_codes.get_emoji_by_name(':thumbs_up:', 'alias') == '👍'
+    assert emoji.unicode_codes.get_emoji_by_name(':not_an_emoji:', 'alias') is None
+
+
+def test_name_cache():
+    cache = emoji.unicode_codes._NameCache(  # pyright: ignore [reportPrivateUsage]
+        lambda name, language: name.upper(), maxsize=2
+    )
+    assert cache(':a:', 'en') == ':A:'
+    assert cache(':b:', 'en') == ':B:'
+    assert cache(':a:', 'en') == ':A:'
+    assert cache(':c:', 'en') == ':C:'  # Evicts ':b:'
+    assert cache.cache_info() == (1, 3, 2, 2)
+    assert cache(':b:', 'en') == ':B:'
+    assert cache.cache_info().misses == 4
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_name_cache_clear_during_lookup():
+    # A result of the old data is not stored after the data was changed
+    def lookup(name: str, language: str) -> str:
+        cache.cache_clear()
+        return name
+
+    cache = emoji.unicode_codes._NameCache(  # pyright: ignore [reportPrivateUsage]
+        lookup, maxsize=2
+    )
+    assert cache(':a:', 'en') == ':a:'
+    assert cache.cache_info().currsize == 0
+
+
+def unload_language(language: str):
+    loaded_keys = emoji.unicode_codes._loaded_keys  # pyright: ignore [reportPrivateUsage]
+    if language in loaded_keys:
+        loaded_keys.remove(language)
+
+
+def test_hooks():
+    events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def hook(event: str, info: Dict[str, Any]):
+        events.append((event, info))
+
+    for event in emoji.unicode_codes.HOOK_EVENTS:
+        emoji.unicode_codes.register_hook(event, hook)
+    try:
+        unload_language('it')
+        emoji.unicode_codes.load_from_json('it')
+        emoji.unicode_codes._get_name_index('it')  # pyright: ignore [reportPrivateUsage]
+        emoji.tokenizer._SEARCH_TREE.clear()  # pyright: ignore [reportPrivateUsage]
+        emoji.tokenizer.get_search_tree()
+    finally:
+        for event in emoji.unicode_codes.HOOK_EVENTS:
+            emoji.tokenizer.unregister_hook(event, hook)
+
+    assert [event for event, _ in events] == [
+        'language_loaded',
+        'name_index_built',
+        'search_tree_built',
+    ]
+    assert events[0][1]['language'] == 'it'
+    assert events[1][1]['language'] == 'it'
+    assert all(info['duration'] >= 0 for _, info in events)
+
+    # Unregistered hooks are not called anymore
+    unload_language('it')
+    emoji.unicode_codes.load_from_json('it')
+    assert len(events) == 3
+
+
+def test_hook_errors():
+    def broken_hook(event: str, info: Dict[str, Any]):
+        raise KeyError(event)
+
+    with pytest.raises(ValueError):
+        emoji.unicode_codes.register_hook('unknown_event', broken_hook)
+    with pytest.raises(ValueError):
+        emoji.unicode_codes.unregister_hook('language_loaded', broken_hook)
+
+    emoji.unicode_codes.register_hook('language_loaded', broken_hook)
+    try:
+        unload_language('it')
+        with pytest.warns(RuntimeWarning):
+            emoji.unicode_codes.load_from_json('it')
+    finally:
+        emoji.unicode_codes.unregister_hook('language_loaded', broken_hook)
+    assert 'it' in emoji.unicode_codes._loaded_keys  # pyright: ignore [reportPrivateUsage]
+
+
+def test_emoji_ids():
+    ids = [emoji.emoji_to_id(emj) for emj in emoji.EMOJI_DATA]
+    assert None not in ids
+    assert len(set(ids)) == len(ids)
+    for emj, emoji_id in zip(emoji.EMOJI_DATA, ids):
+        assert emoji.id_to_emoji(emoji_id) == emj  # type: ignore
+
+    # The IDs must never change
+    assert emoji.emoji_to_id('\U0001F947') == 0
+    assert emoji.emoji_to_id('\U0001F44D') == 3954
+    assert emoji.emoji_to_id('x') is None
+    assert emoji.id_to_emoji(-1) is None
+    assert emoji.id_to_emoji(len(ids) + 1000) is None
+
+
+def test_tokenize_ids():
+    text = 'a\U0001F44Db\U0001F40D\u200d\U0001F40D'
+    assert list(emoji.tokenizer.tokenize_ids(text)) == [
+        emoji.emoji_to_id('\U0001F44D'),
+        emoji.emoji_to_id('\U0001F40D'),
+        emoji.emoji_to_id('\U0001F40D'),
+    ]
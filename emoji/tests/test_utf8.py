@@ -0,0 +1,94 @@
+"""Unittests for emoji.utf8"""
+
+import random
+from typing import Any, Dict, List
+
+import emoji
+
+
+texts: List[str] = [
+    'Python is fun 👍',
+    '',
+    'no emoji, only digits 123 and # *',
+    'Café ☕ costs 3€',
+    '\U0001f468‍\U0001f469\U0001f3ff‍\U0001f467\U0001f3fb',
+    'A 🦖 is eating a 🥐',
+    '🇫🇷👌️ #️⃣ 1⃣ 👍🏽 🏴󠁧󠁢󠁳󠁣󠁴󠁿',
+    'variation selectors ︎ ️ and zwj ‍ alone',
+    '👨‍🦰‍🐍 ❤️‍🔥 ❤️‍x',
+]
+
+
+def byte_offsets(text: str) -> List[Dict[str, Any]]:
+    """emoji_list() with the offsets translated to byte offsets"""
+    return [
+        {
+            'match_start': len(text[: item['match_start']].encode('utf-8')),
+            'match_end': len(text[: item['match_end']].encode('utf-8')),
+            'emoji': item['emoji'],
+        }
+        for item in emoji.emoji_list(text)
+    ]
+
+
+def test_emoji_list_bytes():
+    for text in texts:
+        assert emoji.emoji_list_bytes(text.encode('utf-8')) == byte_offsets(text)
+    assert emoji.emoji_list_bytes('Café ☕'.encode('utf-8')) == [
+        {'match_start': 6, 'match_end': 9, 'emoji': '☕'}
+    ]
+
+
+def test_demojize_bytes():
+    for text in texts:
+        data = text.encode('utf-8')
+        for keep_zwj in (True, False):
+            assert emoji.demojize_bytes(data, keep_zwj=keep_zwj) == emoji.demojize(
+                text, keep_zwj=keep_zwj
+            ).encode('utf-8')
+        assert emoji.demojize_bytes(
+            data, delimiters=('{', '}'), language='de', version=1.0, handle_version='X'
+        ) == emoji.demojize(
+            text, delimiters=('{', '}'), language='de', version=1.0, handle_version='X'
+        ).encode('utf-8')
+
+
+def test_invalid_utf8():
+    data = b'\xff\xfe 1\xf0\x9f\x91\x8d\xc3'
+    assert emoji.emoji_list_bytes(data) == [
+        {'match_start': 4, 'match_end': 8, 'emoji': '👍'}
+    ]
+    assert emoji.demojize_bytes(data) == b'\xff\xfe 1:thumbs_up:\xc3'
+
+
+def test_streams():
+    text = '\n'.join(texts) * 3
+    data = text.encode('utf-8')
+    expected_list = byte_offsets(text)
+    expected = emoji.demojize(text, language='fr').encode('utf-8')
+
+    random.seed(42)
+    for size in (1, 2, 3, 5, 100, len(data)):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        assert list(emoji.emoji_list_stream(chunks)) == expected_list
+        result = list(emoji.demojize_stream(iter(chunks), language='fr'))
+        assert b''.join(result) == expected
+
+        cuts = sorted(random.sample(range(len(data)), 20))
+        chunks = [data[i:j] for i, j in zip([0, *cuts], [*cuts, len(data)])]
+        assert list(emoji.emoji_list_stream(chunks)) == expected_list
+
+    assert list(emoji.emoji_list_stream([])) == []
+    assert list(emoji.demojize_stream([b'', b''])) == []
+
+
+def test_stream_long_run():
+    # Digits occur in emoji: only the end of a long run is kept back
+    for run in ('1' * 100_000, '1\ufe0f\u20e3' * 10_000, '👍\u200d' * 10_000):
+        data = run.encode('utf-8')
+        chunks = [data[i : i + 1000] for i in range(0, len(data), 1000)]
+        result = list(emoji.demojize_stream(chunks))
+        assert b''.join(result) == emoji.demojize(run).encode('utf-8')
+        # One piece per chunk and the last characters at the end of the stream
+        assert len(result) == len(chunks) + 1
+        assert all(len(piece) > 900 for piece in result[:-1])
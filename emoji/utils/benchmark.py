@@ -0,0 +1,311 @@
+"""
+Benchmark the hot paths of the emoji package on synthetic corpora that are
+generated from emoji.EMOJI_DATA.
+
+Run all benchmarks and save the results:
+
+    python utils/benchmark.py --output before.json
+
+Compare a later run with the saved results:
+
+    python utils/benchmark.py --compare before.json --output after.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+include = os.path.relpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, include)
+import emoji  # noqa: E402
+import emoji.tokenizer  # noqa: E402
+import emoji.unicode_codes  # noqa: E402
+
+SEED = 1337
+
+LOREM = (
+    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor '
+    'incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis '
+    'nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.\n'
+)
+
+SHORTCODE_LANGUAGES = ('en', 'alias', 'de', 'es', 'fr', 'ja', 'zh')
+
+
+def _qualified_emoji() -> List[str]:
+    return [
+        emj
+        for emj, data in emoji.EMOJI_DATA.items()
+        if data['status'] == emoji.STATUS['fully_qualified']
+    ]
+
+
+def _person_emoji() -> List[str]:
+    """Single person emoji with skin tones, used to build non-RGI ZWJ chains"""
+    return [
+        emj
+        for emj, data in emoji.EMOJI_DATA.items()
+        if data['status'] == emoji.STATUS['fully_qualified']
+        and 'skin_tone' in data['en']
+        and '\u200d' not in emj
+    ]
+
+
+def make_ascii(size: int) -> str:
+    """Plain ASCII text without any emoji"""
+    return (LOREM * (size // len(LOREM) + 1))[:size]
+
+
+def make_chat(size: int, rnd: random.Random) -> str:
+    """Short chat messages, roughly every third token is an emoji"""
+    qualified = _qualified_emoji()
+    words = LOREM.split()
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        if rnd.random() < 0.35:
+            part = ''.join(rnd.choice(qualified) for _ in range(rnd.randint(1, 3)))
+        else:
+            part = rnd.choice(words)
+        parts.append(part)
+        length += len(part) + 1
+        if rnd.random() < 0.1:
+            parts.append('\n')
+    return ' '.join(parts)[:size]
+
+
+def make_zwj(size: int, rnd: random.Random) -> str:
+    """Long non-RGI ZWJ chains of person emoji separated by spaces"""
+    persons = _person_emoji()
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        part = '\u200d'.join(rnd.choice(persons) for _ in range(rnd.randint(4, 12)))
+        parts.append(part)
+        length += len(part) + 1
+    return ' '.join(parts)
+
+
+def make_shortcodes(size: int, rnd: random.Random, language: str) -> str:
+    """Text with shortcodes in the given language for emojize()"""
+    if language != 'alias':
+        emoji.config.load_language(language)
+    names: List[str] = []
+    for data in emoji.EMOJI_DATA.values():
+        if data['status'] != emoji.STATUS['fully_qualified']:
+            continue
+        if language == 'alias':
+            names.extend(data.get('alias', []))
+        elif language in data:
+            names.append(data[language])
+    words = LOREM.split()
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        part = rnd.choice(names) if rnd.random() < 0.3 else rnd.choice(words)
+        parts.append(part)
+        length += len(part) + 1
+    return ' '.join(parts)
+
+
+def make_corpora(scale: float = 1.0, seed: int = SEED) -> Dict[str, str]:
+    """Generate the corpora. ``scale`` = 1.0 results in about 100 KB per
+    corpus and 4 MB for the 'large' corpus. The corpora are deterministic for
+    the same seed and the same EMOJI_DATA."""
+    rnd = random.Random(seed)
+    size = max(1, int(100_000 * scale))
+    corpora = {
+        'ascii': make_ascii(size),
+        'chat': make_chat(size, rnd),
+        'zwj': make_zwj(size, rnd),
+    }
+    for language in SHORTCODE_LANGUAGES:
+        corpora[f'shortcodes_{language}'] = make_shortcodes(size // 4, rnd, language)
+    large: List[str] = []
+    while sum(map(len, large)) < size * 40:
+        large.append(rnd.choice((corpora['ascii'], corpora['chat'], corpora['zwj'])))
+    corpora['large'] = ''.join(large)
+    return corpora
+
+
+def _reset_search_tree():
+    emoji.tokenizer._SEARCH_TREE.clear()  # pyright: ignore [reportPrivateUsage]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    corpus: Optional[str]
+    func: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+
+
+def make_benchmarks(corpora: Dict[str, str]) -> List[Benchmark]:
+    benchmarks: List[Benchmark] = []
+
+    def add(name: str, corpus: Optional[str], func: Callable[[str], Any]):
+        text = corpora[corpus] if corpus else ''
+        benchmarks.append(Benchmark(name, corpus, lambda: func(text)))
+
+    for corpus in ('ascii', 'chat', 'zwj', 'large'):
+        add(
+            f'tokenize[{corpus}]',
+            corpus,
+            lambda s: list(emoji.tokenizer.tokenize(s, keep_zwj=True)),
+        )
+        add(f'demojize[{corpus}]', corpus, emoji.demojize)
+        add(f'replace_emoji[{corpus}]', corpus, emoji.replace_emoji)
+        add(f'emoji_list[{corpus}]', corpus, emoji.emoji_list)
+        add(f'emoji_count[{corpus}]', corpus, emoji.emoji_count)
+        add(f'analyze[{corpus}]', corpus, lambda s: list(emoji.analyze(s)))
+        add(f'purely_emoji[{corpus}]', corpus, emoji.purely_emoji)
+
+    for language in SHORTCODE_LANGUAGES:
+        corpus = f'shortcodes_{language}'
+        add(
+            f'emojize[{language}]',
+            corpus,
+            lambda s, language=language: emoji.emojize(s, language=language),
+        )
+
+    names = [data['en'] for data in emoji.EMOJI_DATA.values()]
+
+    def lookup_names():
+        for name in names:
+            emoji.unicode_codes.get_emoji_by_name(name, 'en')
+
+    benchmarks.append(
+        Benchmark(
+            'get_emoji_by_name[cold]',
+            None,
+            lookup_names,
+            emoji.unicode_codes.get_emoji_by_name.cache_clear,
+        )
+    )
+    benchmarks.append(Benchmark('get_emoji_by_name[warm]', None, lookup_names))
+    benchmarks.append(
+        Benchmark(
+            'get_search_tree[build]',
+            None,
+            emoji.tokenizer.get_search_tree,
+            _reset_search_tree,
+        )
+    )
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Tuple[float, int, int]:
+    """Returns the best time in seconds, the peak memory and the number of
+    memory blocks that were allocated and not yet freed at the peak"""
+    # Warm up: load languages, build the search tree and fill caches
+    if benchmark.setup:
+        benchmark.setup()
+    benchmark.func()
+
+    times: List[float] = []
+    for _ in range(repeat):
+        if benchmark.setup:
+            benchmark.setup()
+        gc.collect()
+        start = time.perf_counter()
+        benchmark.func()
+        times.append(time.perf_counter() - start)
+
+    # Measure allocations in a separate run, tracemalloc slows down the code
+    if benchmark.setup:
+        benchmark.setup()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    benchmark.func()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return min(times), peak, max(blocks, 0)
+
+
+def run(
+    scale: float = 1.0, repeat: int = 5, only: Optional[str] = None
+) -> Dict[str, Any]:
+    corpora = make_corpora(scale)
+    results: Dict[str, Any] = {}
+    for benchmark in make_benchmarks(corpora):
+        if only and only not in benchmark.name:
+            continue
+        seconds, peak, blocks = measure(benchmark, repeat)
+        result: Dict[str, Any] = {
+            'seconds': seconds,
+            'peak_memory': peak,
+            'retained_blocks': blocks,
+        }
+        if benchmark.corpus:
+            size = len(corpora[benchmark.corpus].encode('utf-8'))
+            result['bytes'] = size
+            result['mb_per_s'] = size / 1e6 / seconds if seconds else float('inf')
+        results[benchmark.name] = result
+        print(_format(benchmark.name, result), flush=True)
+    return {
+        'meta': {
+            'emoji': emoji.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'scale': scale,
+            'repeat': repeat,
+            'seed': SEED,
+        },
+        'results': results,
+    }
+
+
+def _format(name: str, result: Dict[str, Any]) -> str:
+    throughput = f'{result["mb_per_s"]:9.2f} MB/s' if 'mb_per_s' in result else ' ' * 14
+    return (
+        f'{name:32} {result["seconds"] * 1000:10.3f} ms {throughput} '
+        f'{result["peak_memory"] / 1024:10.1f} KiB peak'
+    )
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]):
+    print()
+    print(f'{"benchmark":32} {"old ms":>10} {"new ms":>10} {"change":>8}')
+    for name, result in new['results'].items():
+        if name not in old['results']:
+            continue
+        old_seconds = old['results'][name]['seconds']
+        ratio = result['seconds'] / old_seconds if old_seconds else float('inf')
+        print(
+            f'{name:32} {old_seconds * 1000:10.3f} {result["seconds"] * 1000:10.3f} '
+            f'{(ratio - 1) * 100:+7.1f}%'
+        )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=float, default=1.0, help='Corpus size factor')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark')
+    parser.add_argument('--only', help='Only run benchmarks containing this string')
+    parser.add_argument('--output', help='Save the results to this JSON file')
+    parser.add_argument('--compare', help='Compare with the results in this JSON file')
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.repeat, args.only)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
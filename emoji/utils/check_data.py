@@ -0,0 +1,144 @@
+"""
+Check the generated JSON files in emoji/unicode_codes/ for consistency.
+The runtime builds its lookup structures (the search tree of the tokenizer and
+the name index of get_emoji_by_name()) lazily from these files, this script
+verifies the assumptions they rely on and reports how long the builds take.
+
+    python utils/check_data.py
+
+The generators run the check after writing the files.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List
+
+include = os.path.relpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, include)
+import emoji  # noqa: E402
+from emoji.core import (  # noqa: E402
+    _EMOJI_NAME_PATTERN,  # pyright: ignore [reportPrivateUsage]
+)
+
+DATA_DIR = Path(emoji.__file__).parent / 'unicode_codes'
+
+_NAME_PATTERN = re.compile(f':[{_EMOJI_NAME_PATTERN}]+:')
+
+
+def _load(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+
+def _check_name(name: Any, where: str, errors: List[str]):
+    if not isinstance(name, str):
+        errors.append(f'{where}: name {name!r} is not a string')
+    elif not unicodedata.is_normalized('NFKC', name):
+        errors.append(f'{where}: name {name!r} is not NFKC normalized')
+    elif not _NAME_PATTERN.fullmatch(name):
+        # emojize() could not find the name
+        errors.append(f'{where}: name {name!r} does not match _EMOJI_NAME_PATTERN')
+
+
+def check_data(directory: Path = DATA_DIR) -> List[str]:
+    """
+    Check emoji.json and all emoji_{lang}.json files in ``directory`` and return
+    a list of errors:
+
+    - every entry in emoji.json has a valid status, version and English name
+    - every emoji in a language file exists in emoji.json
+    - all names and aliases are NFKC normalized and can be matched by emojize()
+    - no two fully-qualified or component emoji share a name in the same language
+    - every emoji has exactly one ID in emoji_ids.json
+    """
+    errors: List[str] = []
+    data = _load(directory / 'emoji.json')
+    statuses = set(emoji.STATUS.values())
+
+    ids: List[str] = _load(directory / 'emoji_ids.json')  # type: ignore
+    if len(set(ids)) != len(ids):
+        errors.append('emoji_ids.json: contains duplicates')
+    for emj in data.keys() - set(ids):
+        errors.append(f'emoji_ids.json: {emj!r} has no ID')
+
+    for emj, item in data.items():
+        if item.get('status') not in statuses:
+            errors.append(f'emoji.json: {emj!r} has an invalid status')
+        if not isinstance(item.get('E'), (int, float)):
+            errors.append(f'emoji.json: {emj!r} has an invalid version')
+        _check_name(item.get('en'), f'emoji.json: {emj!r}', errors)
+        for alias in item.get('alias', []):
+            _check_name(alias, f'emoji.json: {emj!r} alias', errors)
+
+    names: Dict[str, Dict[str, str]] = {'en': {}, 'alias': {}}
+    for lang in emoji.LANGUAGES:
+        if lang == 'en':
+            continue
+        path = directory / f'emoji_{lang}.json'
+        if not path.exists():
+            errors.append(f'{path.name} is missing')
+            continue
+        for emj, name in _load(path).items():
+            if emj not in data:
+                errors.append(f'{path.name}: {emj!r} is not in emoji.json')
+                continue
+            _check_name(name, f'{path.name}: {emj!r}', errors)
+            data[emj][lang] = name
+        names[lang] = {}
+
+    fully_qualified = emoji.STATUS['fully_qualified']
+    for emj, item in data.items():
+        if item.get('status', fully_qualified + 1) > fully_qualified:
+            continue
+        for lang, index in names.items():
+            for name in item.get('alias', []) if lang == 'alias' else [item.get(lang)]:
+                if name is None:
+                    continue
+                if name in index:
+                    errors.append(
+                        f'{lang}: name {name!r} is used by {index[name]!r} and {emj!r}'
+                    )
+                index[name] = emj
+
+    return errors
+
+
+def measure_builds() -> Dict[str, float]:
+    """Returns the seconds it takes to build the search tree and the name index
+    of each language from the data of the imported emoji package"""
+    from emoji import tokenizer, unicode_codes
+
+    for lang in emoji.LANGUAGES:
+        unicode_codes.load_from_json(lang)
+
+    timings: Dict[str, float] = {}
+    tokenizer._SEARCH_TREE.clear()  # pyright: ignore [reportPrivateUsage]
+    start = time.perf_counter()
+    tokenizer.get_search_tree()
+    timings['search_tree'] = time.perf_counter() - start
+
+    unicode_codes._name_index.clear()  # pyright: ignore [reportPrivateUsage]
+    for lang in [*emoji.LANGUAGES, 'alias']:
+        start = time.perf_counter()
+        unicode_codes._get_name_index(lang)  # pyright: ignore [reportPrivateUsage]
+        timings[f'name_index[{lang}]'] = time.perf_counter() - start
+    return timings
+
+
+def main() -> int:
+    errors = check_data()
+    for error in errors:
+        print(error)
+    print(f'{len(errors)} errors in {DATA_DIR}')
+    for name, seconds in measure_builds().items():
+        print(f'{name:20} {seconds * 1000:8.2f} ms')
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,10 +14,10 @@ import re
 import logging
 import json
 
-import requests
 import bs4
 
-from generateutils import get_text_from_url, to_ascii
+from check_data import check_data
+from generateutils import get_text_from_url, prefetch, to_ascii, update_emoji_ids
 
 logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
 
@@ -26,18 +26,24 @@ sys.path.insert(0, include)
 import emoji as emoji_pkg  # noqa: E402
 
 
+def emoji_test_url(version: float) -> str:
+    return f'https://unicode.org/Public/emoji/{version}/emoji-test.txt'
+
+
+def emoji_variation_sequences_url(version: str) -> str:
+    return f'https://www.unicode.org/Public/{version}/ucd/emoji/emoji-variation-sequences.txt'
+
+
 def get_emoji_from_url(version: float) -> List[str]:
     """Get splitlines of emojis list from unicode.org"""
 
-    url = f'https://unicode.org/Public/emoji/{version}/emoji-test.txt'
-    return get_text_from_url(url).splitlines()
+    return get_text_from_url(emoji_test_url(version)).splitlines()
 
 
 def get_emoji_variation_sequence_from_url(version: str) -> List[str]:
     """Get splitlines of emoji variation sequences from unicode.org"""
 
-    url = f'https://www.unicode.org/Public/{version}/ucd/emoji/emoji-variation-sequences.txt'
-    return get_text_from_url(url).splitlines()
+    return get_text_from_url(emoji_variation_sequences_url(version)).splitlines()
 
 
 def get_cheat_sheet(url: str) -> Dict[str, str]:
@@ -108,7 +114,7 @@ def get_emoji_from_youtube(url: str) -> Dict[str, List[str]]:
     E.g. {'💁': [':person_tipping_hand:', ':information_desk_person:'], '😉': [':winking_face:', ':wink:']}
     """
 
-    data = requests.get(url).json()
+    data = json.loads(get_text_from_url(url))
 
     output: Dict[str, List[str]] = {}
     for obj in data:
@@ -225,7 +231,7 @@ def extract_emojis(
 def get_emoji_from_github_api(url: str) -> Dict[str, str]:
     """Get emoji alias from GitHub API"""
 
-    data = requests.get(url).json()
+    data = json.loads(get_text_from_url(url))
     pattern = re.compile(r'unicode/([0-9a-fA-F-]+)\.[a-z]+')
 
     output: Dict[str, str] = {}
@@ -278,15 +284,31 @@ if __name__ == '__main__':
     logging.info('  Downloading...\n')
 
     # Find the latest version at https://www.unicode.org/reports/tr51/#emoji_data
-    emoji_source = get_emoji_from_url(16.0)
-    emoji_sequences_source = get_emoji_variation_sequence_from_url('16.0.0')
-    emojis = extract_emojis(emoji_source, emoji_sequences_source)
+    emoji_version = 16.0
+    emoji_sequences_version = '16.0.0'
+    github_url = 'https://api.github.com/emojis'
+    cheat_sheet_url = 'https://www.webfx.com/tools/emoji-cheat-sheet/'
+    youtube_url = 'https://www.gstatic.com/youtube/img/emojis/emojis-png-7.json'
+
+    prefetch(
+        [
+            emoji_test_url(emoji_version),
+            emoji_variation_sequences_url(emoji_sequences_version),
+            github_url,
+            cheat_sheet_url,
+            youtube_url,
+        ]
+    )
 
-    github_alias_dict = get_emoji_from_github_api('https://api.github.com/emojis')
-    cheat_sheet_dict = get_cheat_sheet('https://www.webfx.com/tools/emoji-cheat-sheet/')
-    youtube_dict = get_emoji_from_youtube(
-        'https://www.gstatic.com/youtube/img/emojis/emojis-png-7.json'
+    emoji_source = get_emoji_from_url(emoji_version)
+    emoji_sequences_source = get_emoji_variation_sequence_from_url(
+        emoji_sequences_version
     )
+    emojis = extract_emojis(emoji_source, emoji_sequences_source)
+
+    github_alias_dict = get_emoji_from_github_api(github_url)
+    cheat_sheet_dict = get_cheat_sheet(cheat_sheet_url)
+    youtube_dict = get_emoji_from_youtube(youtube_url)
 
     logging.info('  Combining...\n')
 
@@ -445,3 +467,12 @@ if __name__ == '__main__':
         json.load(fp)
     with open(out_file, 'rb') as fp:
         json.load(fp)
+
+    # Assign IDs to the new emoji
+    with open(out_file, 'rb') as fp:
+        update_emoji_ids(json.load(fp), out_file.parent / 'emoji_ids.json')
+
+    errors = check_data()
+    for error in errors:
+        logging.error(error)
+    assert not errors, 'The JSON files are not consistent, see the errors above'
@@ -7,7 +7,7 @@ The output files are emoji_{xy}.json where {xy} is the letter language code
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 import re
 import io
 import xml.etree.ElementTree as ET
@@ -16,7 +16,8 @@ import json
 
 import bs4
 
-from generateutils import get_text_from_url, adapt_emoji_name, to_ascii
+from check_data import check_data
+from generateutils import get_text_from_url, adapt_emoji_name, prefetch, to_ascii
 
 logging.basicConfig(stream=sys.stderr, level=logging.DEBUG)
 
@@ -86,6 +87,13 @@ def add_unicode_annotations(data: Dict[str, str], lang: str, url: str):
             data[emj] = emoji_name
 
 
+def cldr_annotation_urls(github_tag: str, github_lang: str) -> List[str]:
+    return [
+        f'https://github.com/unicode-org/cldr/raw/{github_tag}/common/annotations/{github_lang}.xml',
+        f'https://github.com/unicode-org/cldr/raw/{github_tag}/common/annotationsDerived/{github_lang}.xml',
+    ]
+
+
 def extract_names(
     github_tag: str,
     github_lang: str,
@@ -101,16 +109,8 @@ def extract_names(
     emoji_terra = {} if emoji_terra is None else emoji_terra
 
     data = get_UNICODE_EMOJI(lang)
-    add_unicode_annotations(
-        data,
-        lang,
-        f'https://github.com/unicode-org/cldr/raw/{github_tag}/common/annotations/{github_lang}.xml',
-    )
-    add_unicode_annotations(
-        data,
-        lang,
-        f'https://github.com/unicode-org/cldr/raw/{github_tag}/common/annotationsDerived/{github_lang}.xml',
-    )
+    for url in cldr_annotation_urls(github_tag, github_lang):
+        add_unicode_annotations(data, lang, url)
 
     # Add names from emojiterra if there is no unicode annotation
     for emj, name in emoji_terra.items():
@@ -170,21 +170,44 @@ if __name__ == '__main__':
     # Find latest release tag at https://cldr.unicode.org/index/downloads
     # or  https://github.com/unicode-org/cldr/releases
     github_tag = 'release-46-1'
+    emojiterra_urls = {
+        'de': 'https://emojiterra.com/de/tastatur/',
+        'es': 'https://emojiterra.com/es/teclado/',
+        'fr': 'https://emojiterra.com/fr/clavier/',
+        'ja': 'https://emojiterra.com/keyboard/ja/',
+        'ko': 'https://emojiterra.com/keyboard/ko/',
+        'pt': 'https://emojiterra.com/pt/copiar/',
+        'it': 'https://emojiterra.com/it/tastiera/',
+        'fa': 'https://emojiterra.com/keyboard/fa/',
+        'id': 'https://emojiterra.com/keyboard/id/',
+        'zh': 'https://emojiterra.com/keyboard/zh/',
+        'ru': 'https://emojiterra.com/keyboard/ru/',
+        'tr': 'https://emojiterra.com/keyboard/tr/',
+        'ar': 'https://emojiterra.com/keyboard/ar/',
+    }
+
+    # Download all pages concurrently, the parsing below uses the fetched pages
+    prefetch(
+        url
+        for lang, emojiterra_url in emojiterra_urls.items()
+        for url in [emojiterra_url, *cldr_annotation_urls(github_tag, lang)]
+    )
+
     languages = {
         # Update names in other languages:
-        'de': extract_names(github_tag, 'de', 'de', get_emojiterra_from_url('https://emojiterra.com/de/tastatur/')),
-        'es': extract_names(github_tag, 'es', 'es', get_emojiterra_from_url('https://emojiterra.com/es/teclado/')),
-        'fr': extract_names(github_tag, 'fr', 'fr', get_emojiterra_from_url('https://emojiterra.com/fr/clavier/')),
-        'ja': extract_names(github_tag, 'ja', 'ja', get_emojiterra_from_url('https://emojiterra.com/keyboard/ja/')),
-        'ko': extract_names(github_tag, 'ko', 'ko', get_emojiterra_from_url('https://emojiterra.com/keyboard/ko/')),
-        'pt': extract_names(github_tag, 'pt', 'pt', get_emojiterra_from_url('https://emojiterra.com/pt/copiar/')),
-        'it': extract_names(github_tag, 'it', 'it', get_emojiterra_from_url('https://emojiterra.com/it/tastiera/')),
-        'fa': extract_names(github_tag, 'fa', 'fa', get_emojiterra_from_url('https://emojiterra.com/keyboard/fa/')),
-        'id': extract_names(github_tag, 'id', 'id', get_emojiterra_from_url('https://emojiterra.com/keyboard/id/')),
-        'zh': extract_names(github_tag, 'zh', 'zh', get_emojiterra_from_url('https://emojiterra.com/keyboard/zh/')),
-        'ru': extract_names(github_tag, 'ru', 'ru', get_emojiterra_from_url('https://emojiterra.com/keyboard/ru/')),
-        'tr': extract_names(github_tag, 'tr', 'tr', get_emojiterra_from_url('https://emojiterra.com/keyboard/tr/')),
-        'ar': extract_names(github_tag, 'ar', 'ar', get_emojiterra_from_url('https://emojiterra.com/keyboard/ar/')),
+        'de': extract_names(github_tag, 'de', 'de', get_emojiterra_from_url(emojiterra_urls['de'])),
+        'es': extract_names(github_tag, 'es', 'es', get_emojiterra_from_url(emojiterra_urls['es'])),
+        'fr': extract_names(github_tag, 'fr', 'fr', get_emojiterra_from_url(emojiterra_urls['fr'])),
+        'ja': extract_names(github_tag, 'ja', 'ja', get_emojiterra_from_url(emojiterra_urls['ja'])),
+        'ko': extract_names(github_tag, 'ko', 'ko', get_emojiterra_from_url(emojiterra_urls['ko'])),
+        'pt': extract_names(github_tag, 'pt', 'pt', get_emojiterra_from_url(emojiterra_urls['pt'])),
+        'it': extract_names(github_tag, 'it', 'it', get_emojiterra_from_url(emojiterra_urls['it'])),
+        'fa': extract_names(github_tag, 'fa', 'fa', get_emojiterra_from_url(emojiterra_urls['fa'])),
+        'id': extract_names(github_tag, 'id', 'id', get_emojiterra_from_url(emojiterra_urls['id'])),
+        'zh': extract_names(github_tag, 'zh', 'zh', get_emojiterra_from_url(emojiterra_urls['zh'])),
+        'ru': extract_names(github_tag, 'ru', 'ru', get_emojiterra_from_url(emojiterra_urls['ru'])),
+        'tr': extract_names(github_tag, 'tr', 'tr', get_emojiterra_from_url(emojiterra_urls['tr'])),
+        'ar': extract_names(github_tag, 'ar', 'ar', get_emojiterra_from_url(emojiterra_urls['ar'])),
 
         # Do not update names in other languages:
         # 'de': get_UNICODE_EMOJI('de'),
@@ -275,3 +298,8 @@ if __name__ == '__main__':
             json.load(fp)
         with open(out_file, 'rb') as fp:
             json.load(fp)
+
+    errors = check_data()
+    for error in errors:
+        logging.error(error)
+    assert not errors, 'The JSON files are not consistent, see the errors above'
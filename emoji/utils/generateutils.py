@@ -1,11 +1,33 @@
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
 import re
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 import unicodedata
 
 import requests
 
 
 __scraper: Optional[requests.Session] = None
+__scraper_lock = threading.Lock()
+
+# Fetch cache: the fetched texts are stored in the directory FETCH_CACHE under the
+# SHA-256 of their content, FETCH_CACHE/urls.json maps each URL to the hash.
+# With FETCH_REPLAY only cached URLs can be fetched, e.g. to regenerate the
+# data from a fixture directory without network access:
+#   EMOJI_FETCH_CACHE=fixtures EMOJI_FETCH_REPLAY=1 python utils/generate_emoji.py
+FETCH_CACHE: Optional[Path] = (
+    Path(os.environ['EMOJI_FETCH_CACHE']) if os.environ.get('EMOJI_FETCH_CACHE') else None
+)
+FETCH_REPLAY = os.environ.get('EMOJI_FETCH_REPLAY', '') not in ('', '0')
+FETCH_WORKERS = 8
+
+__fetched: Dict[str, str] = {}  # Texts fetched in this process
+__cache_lock = threading.Lock()
 
 
 def to_ascii(s: str) -> str:
@@ -14,8 +36,30 @@ def to_ascii(s: str) -> str:
 
 
 def get_text_from_url(url: str) -> str:
-    """Get text from url"""
-
+    """Get text from url, use the fetch cache if it is enabled"""
+
+    text = __fetched.get(url)
+    if text is None:
+        text = _read_cache(url)
+    if text is None:
+        if FETCH_REPLAY:
+            raise LookupError(f'{url} is not in the fetch cache {FETCH_CACHE}')
+        logging.info(f'  Fetching {url}')
+        text = _fetch(url)
+        _write_cache(url, text)
+    __fetched[url] = text
+    return text
+
+
+def prefetch(urls: Iterable[str]):
+    """Fetch the urls that are not cached yet concurrently"""
+    missing = [url for url in dict.fromkeys(urls) if url not in __fetched]
+    with concurrent.futures.ThreadPoolExecutor(FETCH_WORKERS) as executor:
+        for _ in executor.map(get_text_from_url, missing):
+            pass
+
+
+def _fetch(url: str) -> str:
     html = ''
     if __scraper is None:
         html = requests.get(url).text
@@ -25,16 +69,78 @@ def get_text_from_url(url: str) -> str:
     return html
 
 
+def _read_urls(cache: Path) -> Dict[str, str]:
+    try:
+        with open(cache / 'urls.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _read_cache(url: str) -> Optional[str]:
+    if FETCH_CACHE is None:
+        return None
+    digest = _read_urls(FETCH_CACHE).get(url)
+    if digest is None:
+        return None
+    with open(FETCH_CACHE / digest, 'rb') as f:
+        content = f.read()
+    if hashlib.sha256(content).hexdigest() != digest:
+        raise ValueError(f'The cached content of {url} is corrupted: {FETCH_CACHE / digest}')
+    return content.decode('utf-8')
+
+
+def _write_cache(url: str, text: str):
+    if FETCH_CACHE is None:
+        return
+    content = text.encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()
+    with __cache_lock:
+        FETCH_CACHE.mkdir(parents=True, exist_ok=True)
+        path = FETCH_CACHE / digest
+        if not path.exists():
+            path.write_bytes(content)
+        urls = _read_urls(FETCH_CACHE)
+        urls[url] = digest
+        tmp = FETCH_CACHE / 'urls.json.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(urls.items())), f, indent=2)
+        os.replace(tmp, FETCH_CACHE / 'urls.json')
+
+
 def get_text_from_cloudflare_url(url: str) -> str:
     """Get text from url that is protected by cloudflare"""
     global __scraper
-    if __scraper is None:
-        import cloudscraper  # type: ignore
+    with __scraper_lock:
+        if __scraper is None:
+            import cloudscraper  # type: ignore
 
-        __scraper = cloudscraper.create_scraper()  # type: ignore
+            __scraper = cloudscraper.create_scraper()  # type: ignore
     return __scraper.get(url).text
 
 
+def update_emoji_ids(emojis: Iterable[str], path: Path) -> List[str]:
+    """Append the emoji that have no ID yet to the file emoji_ids.json. The ID of an
+    emoji is its index in the list. The list is append-only: IDs are never changed
+    or reused, even if an emoji is removed from emoji.json."""
+
+    ids: List[str] = []
+    if path.exists():
+        with open(path, 'rb') as fp:
+            ids = json.load(fp)
+    known = set(ids)
+    ids.extend(emj for emj in dict.fromkeys(emojis) if emj not in known)
+
+    with open(path, mode='wt', encoding='utf-8', newline='\n') as fp:
+        fp.write('[\n')
+        for i, emj in enumerate(ids):
+            # Only escape \ufe0f and \u200d like in emoji.json
+            pretty_code = emj.replace('\ufe0f', '\\ufe0f').replace('\u200d', '\\u200d')
+            fp.write(f'"{pretty_code}"{"," if i < len(ids) - 1 else ""}\n')
+        fp.write(']\n')
+    return ids
+
+
 def adapt_emoji_name(text: str, lang: str, emj: str) -> str:
     # Use NFKC-form (single character instead of character + diacritic)
     # Unicode.org files should be formatted like this anyway, but emojiterra is not consistent
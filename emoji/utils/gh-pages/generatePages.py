@@ -1,9 +1,18 @@
 """Generate the files index.html and all.html that will contain a table of all supported emoji
-Run with -minify to minify HTML for production"""
+Run with -minify to minify HTML for production
+
+The table rows of each language are rendered in parallel worker processes and cached
+in the directory .cache with a fingerprint of their inputs: emoji.json, emoji_{lang}.json,
+rows.html and this script. Only the languages with changed inputs are rendered again and
+the pages are only written if one of their inputs changed. Run with -force to ignore the cache."""
 
 import sys
 import os
 import codecs
+import concurrent.futures
+import hashlib
+from typing import Any, Dict, List, Optional
+
 import django.conf
 import django.template
 from htmlmin.minify import html_minify
@@ -21,7 +30,10 @@ except ImportError:
 OUT_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATE_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, 'template.html')
-data = {'defaultLang': 'en'}
+ROWS_TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, 'rows.html')
+CACHE_DIR = os.path.join(OUT_DIR, '.cache')
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(emoji.__file__)), 'unicode_codes')
+data: Dict[str, Any] = {'defaultLang': 'en'}
 
 languages = {
     'en': emoji.emojize('en :United_Kingdom:'),
@@ -43,22 +55,76 @@ languages = {
 language_args = {}
 
 
-minify_enabled = sys.argv[-1] == '-minify'
-if not minify_enabled:
-    print('Run with -minify to minify HTML')
+def setup_django():
+    TEMPLATES = [
+        {
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [TEMPLATE_DIR],
+        }
+    ]
 
+    django.conf.settings.configure(TEMPLATES=TEMPLATES)
+    django.setup()
 
-print('Collecting emoji data...')
 
-data['lists'] = lists = []
-for language in languages:
-    emoji.config.load_language(language)
+def get_language_arg(language: str) -> str:
     if language in language_args:
-        language_arg = language_args[language]
+        return language_args[language]
     elif language == data['defaultLang']:
-        language_arg = ''
+        return ''
     else:
-        language_arg = f'language="{language}"'
+        return f'language="{language}"'
+
+
+def fingerprint(language: str) -> str:
+    """SHA-256 of all inputs of the table rows of a language"""
+    files = [os.path.join(DATA_DIR, 'emoji.json'), ROWS_TEMPLATE_FILE, __file__]
+    if language in emoji.LANGUAGES and language != 'en':
+        files.append(os.path.join(DATA_DIR, f'emoji_{language}.json'))
+
+    h = hashlib.sha256()
+    h.update(f'{language}\0{languages[language]}\0{get_language_arg(language)}\0'.encode('utf-8'))
+    for file in files:
+        with open(file, 'rb') as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def read_fingerprint(name: str) -> Optional[str]:
+    try:
+        with open(os.path.join(CACHE_DIR, f'{name}.sha256'), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_fingerprint(name: str, digest: str):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, f'{name}.sha256'), 'w', encoding='utf-8') as f:
+        f.write(digest)
+
+
+def read_cache(language: str, digest: str) -> Optional[str]:
+    """Returns the cached table rows if they were rendered with the same fingerprint"""
+    if read_fingerprint(language) != digest:
+        return None
+    try:
+        with open(os.path.join(CACHE_DIR, f'{language}.html'), 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_cache(language: str, digest: str, html: str):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, f'{language}.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+    # Write the fingerprint last, so that an interrupted run is not cached
+    write_fingerprint(language, digest)
+
+
+def collect_emoji(language: str) -> List[Dict[str, str]]:
+    emoji.config.load_language(language)
 
     emoji_list = []
     for code, emoji_data in emoji.EMOJI_DATA.items():
@@ -79,49 +145,99 @@ for language in languages:
                     'xml': code.encode('ascii', 'xmlcharrefreplace').decode('ascii'),
                 }
             )
+    return emoji_list
+
 
+def render_rows(language: str) -> str:
+    """Render the table rows of a language. Runs in a worker process"""
+    emoji_list = collect_emoji(language)
+    if not emoji_list:
+        return ''
     listentry = {
         'name': language,
         'pretty': languages[language],
-        'languageArg': language_arg,
+        'languageArg': get_language_arg(language),
         'emojis': emoji_list,
     }
-    lists.append(listentry)
-
-
-# Render with django
-TEMPLATES = [
-    {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [TEMPLATE_DIR],
-    }
-]
-
-django.conf.settings.configure(TEMPLATES=TEMPLATES)
-django.setup()
-template = django.template.loader.get_template(TEMPLATE_FILE)
-
-print("Render 'all.html' ...")
-with codecs.open(os.path.join(OUT_DIR, 'all.html'), 'w', encoding='utf-8') as f:
-    html = template.render(data)
+    template = django.template.loader.get_template(ROWS_TEMPLATE_FILE)
+    return template.render({'entry': listentry})
+
+
+def write_page(filename: str, page_data: Dict[str, Any], minify_enabled: bool, force: bool):
+    """Render the page, unless the inputs did not change since the last run"""
+    path = os.path.join(OUT_DIR, filename)
+    h = hashlib.sha256()
+    h.update(f'{minify_enabled}\0'.encode('utf-8'))
+    with open(TEMPLATE_FILE, 'rb') as f:
+        h.update(hashlib.sha256(f.read()).digest())
+    for listentry in page_data['lists']:
+        h.update(f"{listentry['name']}\0{listentry['pretty']}\0".encode('utf-8'))
+        h.update(hashlib.sha256(listentry['rows'].encode('utf-8')).digest())
+    digest = h.hexdigest()
+
+    if not force and os.path.exists(path) and read_fingerprint(filename) == digest:
+        print(f"Skip '{filename}', the inputs did not change")
+        return
+
+    print(f"Render '{filename}' ...")
+    html = django.template.loader.get_template(TEMPLATE_FILE).render(page_data)
     if minify_enabled:
-        print("Minify 'all.html' ...")
+        print(f"Minify '{filename}' ...")
         html = html_minify(html)
-    f.write(html)
-    print(f"Wrote to {os.path.join(OUT_DIR, 'all.html')}")
-
-print("Render 'index.html' ...")
-# Remove emoji except for default list
-for listentry in lists:
-    if listentry['name'] != data['defaultLang']:
-        listentry['emojis'] = []
-
-with codecs.open(os.path.join(OUT_DIR, 'index.html'), 'w', encoding='utf-8') as f:
-    html = template.render(data)
-    if minify_enabled:
-        print("Minify 'index.html' ...")
-        html = html_minify(html)
-    f.write(html)
-    print(f"Wrote to {os.path.join(OUT_DIR, 'index.html')}")
-
-print('Done.')
+    with codecs.open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    write_fingerprint(filename, digest)
+    print(f'Wrote to {path}')
+
+
+def main(argv: List[str]):
+    minify_enabled = '-minify' in argv
+    if not minify_enabled:
+        print('Run with -minify to minify HTML')
+    force = '-force' in argv
+
+    setup_django()
+
+    print('Collecting emoji data...')
+
+    rows: Dict[str, str] = {}
+    digests = {language: fingerprint(language) for language in languages}
+    for language, digest in digests.items():
+        cached = None if force else read_cache(language, digest)
+        if cached is not None:
+            rows[language] = cached
+
+    changed = [language for language in languages if language not in rows]
+    if changed:
+        print(f"Render {', '.join(changed)} ...")
+        with concurrent.futures.ProcessPoolExecutor(
+            min(len(changed), os.cpu_count() or 1), initializer=setup_django
+        ) as executor:
+            for language, html in zip(changed, executor.map(render_rows, changed)):
+                rows[language] = html
+                write_cache(language, digests[language], html)
+    print(f'{len(languages) - len(changed)} languages unchanged')
+
+    data['lists'] = lists = [
+        {
+            'name': language,
+            'pretty': languages[language],
+            'rows': rows[language],
+        }
+        for language in languages
+    ]
+
+    write_page('all.html', data, minify_enabled, force)
+
+    # Remove emoji except for default list
+    for listentry in lists:
+        if listentry['name'] != data['defaultLang']:
+            listentry['rows'] = ''
+
+    write_page('index.html', data, minify_enabled, force)
+
+    print('Done.')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])